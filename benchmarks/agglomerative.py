@@ -0,0 +1,70 @@
+""" Benchmark the agglomerative clustering trees method on random class matrices.
+For each number of trees, a random (trees x instances) class matrix is normalized, then the pairwise distances between
+its trees are computed, and the trees are merged with an average linkage. Each number of trees is measured in its own
+process, so its peak memory isn't hidden by the previous ones. The time spent computing the distances and the linkage,
+the size of the condensed distances array and the increase of the peak resident memory are printed.
+Usage : python benchmarks/agglomerative.py [number of trees ...], from the root of the repository. Without any
+argument, 1000 and 5000 trees are measured.
+"""
+import os
+import resource
+import subprocess
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DEFAULT_NUMBERS_OF_TREES = [1000, 5000]
+_INSTANCES = 500
+_CLUSTERING_THRESHOLD = 0.5
+_SINGLE_RUN = "--single-run"
+_SEED = 0
+
+
+def main() -> None:
+    if len(sys.argv) == 3 and sys.argv[1] == _SINGLE_RUN:
+        _single_run(int(sys.argv[2]))
+        return
+
+    print("{} instances, euclidean distance".format(_INSTANCES))
+    for number_of_trees in [int(value) for value in sys.argv[1:]] or _DEFAULT_NUMBERS_OF_TREES:
+        subprocess.run([sys.executable, os.path.abspath(__file__), _SINGLE_RUN, str(number_of_trees)], check=True)
+
+
+def _single_run(number_of_trees: int) -> None:
+    """ Measure the agglomerative clustering of `number_of_trees` trees, and print the results on a single line. """
+    sys.path.insert(0, _ROOT)
+    import numpy as np
+
+    from fforest.src.core.phase.performance_evaluation.clustering_trees_method.agglomerative import \
+        _agglomerative_clusters
+    from fforest.src.vrac.maths.arrays import z_score
+    from fforest.src.vrac.maths.distance_matrix import pairwise_distances
+    from fforest.src.vrac.maths.distance_measure import DistanceMeasure
+
+    matrix = z_score(np.random.default_rng(_SEED).random((number_of_trees, _INSTANCES)))
+    initial_peak = _peak_memory()
+
+    start = time.perf_counter()
+    distances = pairwise_distances(vectors=matrix, measure=DistanceMeasure.EUCLIDEAN)
+    distances_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clusters = _agglomerative_clusters(distances_matrix=distances, number_of_trees=number_of_trees,
+                                       clustering_threshold=_CLUSTERING_THRESHOLD)
+    linkage_time = time.perf_counter() - start
+
+    print("{:>6} trees : {:.2f}s (distances {:.2f}s, linkage {:.2f}s), {} clusters, {:.0f} MiB condensed, "
+          "peak memory +{:.0f} MiB".format(number_of_trees, distances_time + linkage_time, distances_time,
+                                           linkage_time, clusters.max() + 1, distances.nbytes / 2 ** 20,
+                                           (_peak_memory() - initial_peak) / 2 ** 20))
+
+
+def _peak_memory() -> int:
+    """ Return the peak resident memory of the process, in bytes. """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The peak resident memory is given in bytes by macOS, and in kibibytes by Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+""" Benchmark the computation of the quality of the trees with the Kappa-Rifqi-Marsala method.
+The main entry point is run on a database, in a temporary directory. Then the quality of all the trees is computed
+several times for each t-norm, and the best time is printed. With the CSV format for the vectors, the quality is also
+computed by a reference implementation summing the score of each instance one by one, as the software did before
+computing the quality of the trees as one matrix product. Both results must agree, up to the order of the summations.
+Usage : python benchmarks/quality.py [database] [fforest options], from the root of the repository. Without any
+argument, the bank database is used with 15 trees.
+"""
+import os
+import sys
+import tempfile
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_DEFAULT_ARGS = [os.path.join(_ROOT, "fforest", "test", "data", "bank.csv"), "--delimiter-input=;", "--trees-in-forest",
+                 "15", "--have-header", "--class", "y"]
+_REPEAT = 5
+
+
+def main() -> None:
+    sys.path.insert(0, _ROOT)
+    import fforest.src.getters.environment as env
+    from fforest.src.file_tools.format import Format
+    from fforest.main import main_entry_point
+
+    args = [os.path.abspath(sys.argv[1])] + sys.argv[2:] if len(sys.argv) > 1 else _DEFAULT_ARGS
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        sys.argv = ["fforest"] + args + ["--verbosity", "quiet"]
+        try:
+            main_entry_point()
+        except SystemExit:
+            pass
+
+        from fforest.src.core.phase.performance_evaluation.quality_computing_method.kappa_rifqi_marsala import \
+            kappa_rifqi_marsala
+        print("{} trees, {} instances, {} vectors".format(env.trees_in_forest, env.reference_database_instances,
+                                                          env.vector_format.name.lower()))
+        qualities, best_time = _best_time(kappa_rifqi_marsala)
+        print("kappa_rifqi_marsala : {:.1f} ms".format(best_time * 1000))
+
+        if env.vector_format == Format.CSV:
+            reference_qualities, reference_time = _best_time(lambda: _reference_quality(env))
+            print("reference implementation : {:.1f} ms".format(reference_time * 1000))
+            print("greatest relative difference : {:.1e}".format(_greatest_difference(qualities, reference_qualities)))
+
+
+def _best_time(function):
+    """ Call `function` `_REPEAT` times, then return its result and its best time (in seconds). """
+    best_time = float("inf")
+    for _ in range(_REPEAT):
+        start = time.perf_counter()
+        result = function()
+        best_time = min(best_time, time.perf_counter() - start)
+    return result, best_time
+
+
+def _reference_quality(env) -> dict:
+    """ Compute the quality of each tree by summing the score of each instance, read from the CSV vectors. """
+    from fforest.src.core.phase.learning_process.forest_construction import KEY_DIFFICULTY, KEY_ID, KEY_TRUECLASS
+    from fforest.src.file_tools.csv_tools import iter_rows_dict
+
+    qualities = dict()
+    for tnorm in env.t_norms_names:
+        difficulties = {row[KEY_ID]: float(row[KEY_DIFFICULTY])
+                        for row in iter_rows_dict(path=env.difficulty_vectors_paths[tnorm], dialect=env.dialect_output)}
+        qualities[tnorm] = dict()
+        for tree_path, vector_path in zip(env.subsubtrain_directories_path, env.salammbo_vectors_paths[tnorm]):
+            memberships = {row[KEY_ID]: float(row[row[KEY_TRUECLASS]])
+                           for row in iter_rows_dict(path=vector_path, dialect=env.dialect_output)}
+            qualities[tnorm][tree_path] = sum(difficulty * memberships.get(identifier, 0.0)
+                                              for identifier, difficulty in difficulties.items()) / len(difficulties)
+    return qualities
+
+
+def _greatest_difference(qualities: dict, reference_qualities: dict) -> float:
+    """ Return the greatest relative difference between two qualities of the same tree. """
+    return max(abs(quality - reference_qualities[tnorm][tree]) / max(abs(quality), sys.float_info.min)
+               for tnorm in qualities for tree, quality in qualities[tnorm].items())
+
+
+if __name__ == "__main__":
+    main()
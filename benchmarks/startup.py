@@ -0,0 +1,64 @@
+""" Benchmark the startup of the command line interface.
+The resource files opened while importing the main module and formatting the documentation of the parameters are
+counted by an audit hook, in a fresh process, which also measures the time spent importing the main module, and
+checks that neither NumPy nor SciPy has been imported. Then the main entry point is run several times with `--help`,
+each time in a fresh process, and the median wall-clock time is printed.
+Usage : python benchmarks/startup.py, from the root of the repository. The exit code is non-zero if NumPy or SciPy has
+been imported.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_RESOURCES_PATH = os.path.join(_ROOT, "fforest", "res")
+_REPEAT = 7
+_NUMERICAL_MODULES = ["numpy", "scipy"]
+_SINGLE_RUN = "--single-run"
+_HELP_RUN = ("import sys; sys.path.insert(0, {!r}); sys.argv = ['fforest', '--help']; "
+             "from fforest.main import main_entry_point; main_entry_point()").format(_ROOT)
+
+
+def main() -> int:
+    if sys.argv[1:] == [_SINGLE_RUN]:
+        return _single_run()
+
+    single_run = subprocess.run([sys.executable, os.path.abspath(__file__), _SINGLE_RUN])
+    durations = []
+    for _ in range(_REPEAT):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", _HELP_RUN], stdout=subprocess.DEVNULL, check=True)
+        durations.append(time.perf_counter() - start)
+    print("--help : {:.0f} ms (median of {} runs)".format(statistics.median(durations) * 1000, _REPEAT))
+    return single_run.returncode
+
+
+def _single_run() -> int:
+    """ Count the resource files opened while importing the main module and formatting the documentation, and return
+    the number of numerical modules imported meanwhile.
+    """
+    opened_resources = []
+
+    def hook(event, args):
+        if event == "open" and isinstance(args[0], str) and os.path.abspath(args[0]).startswith(_RESOURCES_PATH):
+            opened_resources.append(args[0])
+
+    sys.addaudithook(hook)
+    sys.path.insert(0, _ROOT)
+    start = time.perf_counter()
+    import fforest.main
+    import_time = time.perf_counter() - start
+    from fforest.src.core.phase.preprocessing import args_parser
+    args_parser._format_dictionary()
+    print("import fforest.main : {:.1f} ms".format(import_time * 1000))
+    print("resource files opened : {} ({} distinct)".format(len(opened_resources), len(set(opened_resources))))
+
+    imported_modules = [module for module in _NUMERICAL_MODULES if module in sys.modules]
+    print("numerical modules imported : {}".format(", ".join(imported_modules) or "none"))
+    return len(imported_modules)
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -1,16 +1,19 @@
 """ This module contains all the entry points created during the software installation. They're all protected by the
 `failure_safe` decorator, which safely dump the environment created and the data computed before exiting the process.
-The main entry point is the `main_entry_point` method. It executes all the existing phases sequentially by default, and
-can also start at a previously computed phase (thus the obligatory `compute_first_phase` statement). Every other method
-is an entry point for a specific phase, and exit the process right after its termination.
+The main entry point is the `main_entry_point` method. It executes all the existing phases sequentially by default,
+skipping the ones whose outputs are up to date, and can also start at a previously computed phase (thus the obligatory
+`compute_first_phase` statement). Every other method
+is an entry point for a specific phase, and exit the process right after its termination. They load the environment
+file computed by the previous phases, and skip their phase if its outputs are up to date with its inputs (see the
+`checkpoint` module). The `sweep_entry_point` learns and evaluates one forest for each configuration of Salammbô options
+given by the user, from the same split databases (see the `sweep` module).
 """
+import fforest.src.core.phase.preprocessing.args_parser as args_parser
 from fforest.src.core.phase.ending.ending import failure_safe
-from fforest.src.core.phase.phase import call_all_phases
-from fforest.src.core.phase.preprocessing.args_parser import parse_args_main_entry_point
+from fforest.src.core.phase.phase import Phase, call_all_phases, call_single_phase, call_sweep
 from fforest.src.core.phase.preprocessing.preparsing import compute_first_phase
 
 
-
 def main_entry_point() -> None:
     # Parse only a part of arguments needed to know if the user asked to start the software from the beginning or from a
     # specific phase.
@@ -18,47 +21,66 @@ def main_entry_point() -> None:
 
     # Call successively all phases, starting with the `first_phase` (computed by the previous statement).
     call_all_phases(starting_phase=first_phase,
-                    parsing_function=parse_args_main_entry_point)
+                    parsing_function=args_parser.parse_args_main_entry_point)
 
 
 @failure_safe
 def preprocessing_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.PREPROCESSING,
+                      parsing_function=args_parser.parse_args_preprocessing_entry_point)
 
 
 @failure_safe
 def initial_split_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.INITIAL_SPLIT,
+                      parsing_function=args_parser.parse_args_initial_split_entry_point)
 
 
 @failure_safe
 def reference_split_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.REFERENCE_SPLIT,
+                      parsing_function=args_parser.parse_args_reference_split_entry_point)
 
 
 @failure_safe
 def subsubtrain_split_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.SUBSUBTRAIN_SPLIT,
+                      parsing_function=args_parser.parse_args_subsubtrain_split_entry_point)
 
 
 @failure_safe
 def learning_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.LEARNING,
+                      parsing_function=args_parser.parse_args_learning_entry_point)
 
 
 @failure_safe
 def reduction_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.REDUCTION,
+                      parsing_function=args_parser.parse_args_reduction_entry_point)
 
 
 @failure_safe
 def quality_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.QUALITY,
+                      parsing_function=args_parser.parse_args_quality_entry_point)
 
 
 @failure_safe
 def classes_matrices_entry_point() -> None:
-    pass
+    call_single_phase(phase=Phase.CLASSES_MATRICES,
+                      parsing_function=args_parser.parse_args_classes_matrices_entry_point)
+
+
+@failure_safe
+def clustering_trees_entry_point() -> None:
+    call_single_phase(phase=Phase.CLUSTERING_TREES,
+                      parsing_function=args_parser.parse_args_clustering_trees_entry_point)
+
+
+@failure_safe
+def sweep_entry_point() -> None:
+    call_sweep(parsing_function=args_parser.parse_args_sweep_entry_point)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,191 @@
+""" This module records a checkpoint of the phases inside the environment file, to skip the computation of a phase whose
+results are up to date. The checkpoint of a phase is stored in the `phases_hashes` variable of the `env` module, and
+contains :
+- The SHA-256 hash of its inputs : the content of the files read by the phase and the value of the parameters it uses,
+  before the phase is computed.
+- The SHA-256 hash of its outputs : the content of the files written by the phase.
+- The value of the variables of the `env` module set by the phase, restored when the phase is skipped.
+A phase is up to date if its inputs didn't change since its last computation, and if its outputs are still untouched.
+Thus, changing a parameter of a phase or the output of a previous phase invalidates the checkpoint of this phase, and
+only of this phase : the following phases are invalidated one by one as their inputs change.
+
+The files and parameters of each phase are given by the name of their variables in the `env` module. A variable can
+contain a path, or a list or dictionary of paths.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+import fforest.src.getters.environment as env
+from fforest.src.core.phase.phase import Phase, phase_to_str
+from fforest.src.file_tools.format import Format
+
+_KEY_INPUTS = "inputs"
+_KEY_OUTPUTS = "outputs"
+_KEY_VARIABLES = "variables"
+_MISSING_FILE = b"\x00missing"
+_BUFFER_SIZE = 1024 * 1024
+
+_PHASES_INPUT_FILES = {
+    Phase.PREPROCESSING: ("original_database_path",),
+    Phase.INITIAL_SPLIT: ("preprocessed_database_path",),
+    Phase.REFERENCE_SPLIT: ("train_database_path",),
+    Phase.SUBSUBTRAIN_SPLIT: ("subtrain_database_path",),
+    Phase.LEARNING: ("subsubtrain_databases_paths", "reference_database_path", "subtrain_database_path",
+                     "subtrain_offsets_path", "subsubtrain_indexes_paths"),
+    Phase.REDUCTION: ("salammbo_vectors_paths", "reference_database_path"),
+    Phase.QUALITY: ("salammbo_vectors_paths", "difficulty_vectors_paths"),
+    Phase.CLASSES_MATRICES: ("salammbo_vectors_paths", "reference_database_path"),
+    Phase.CLUSTERING_TREES: ("classes_matrices_files_paths", "quality_files_paths"),
+}
+
+_PHASES_PARAMETERS = {
+    Phase.PREPROCESSING: ("class_name", "identifier", "have_header", "format_input", "format_output", "encoding_input",
+                          "encoding_output", "delimiter_input", "delimiter_output", "line_delimiter_input",
+                          "line_delimiter_output", "quoting_input", "quoting_output", "quote_character_input",
+                          "quote_character_output"),
+    Phase.INITIAL_SPLIT: ("initial_split_method", "training_value", "class_name", "seed"),
+    Phase.REFERENCE_SPLIT: ("reference_split_method", "reference_value", "class_name", "seed"),
+    Phase.SUBSUBTRAIN_SPLIT: ("subsubtrain_split_method", "trees_in_forest", "class_name", "seed", "sampling_fraction",
+                              "fifo"),
+    Phase.LEARNING: ("discretization_threshold", "entropy_measure", "entropy_threshold", "minimal_size_leaf", "t_norms",
+                     "vector_format"),
+    Phase.REDUCTION: ("vector_format",),
+    Phase.QUALITY: ("quality_computing_method", "vector_format"),
+    Phase.CLASSES_MATRICES: ("vector_format", "matrix_format"),
+    Phase.CLUSTERING_TREES: ("clustering_trees_method", "clustering_threshold", "distance_measure", "quality_threshold",
+                             "matrix_format"),
+}
+
+_PHASES_OUTPUT_FILES = {
+    Phase.PREPROCESSING: ("preprocessed_database_path", "header_path"),
+    Phase.INITIAL_SPLIT: ("train_database_path", "test_database_path"),
+    Phase.REFERENCE_SPLIT: ("reference_database_path", "subtrain_database_path"),
+    Phase.SUBSUBTRAIN_SPLIT: ("subsubtrain_databases_paths", "subsubtrain_indexes_paths", "subtrain_offsets_path"),
+    Phase.LEARNING: ("salammbo_vectors_paths", "cclassified_vectors_paths"),
+    Phase.REDUCTION: ("difficulty_vectors_paths",),
+    Phase.QUALITY: ("quality_files_paths",),
+    Phase.CLASSES_MATRICES: ("classes_matrices_files_paths",),
+    Phase.CLUSTERING_TREES: ("clustering_trees_files_paths",),
+}
+
+_PHASES_VARIABLES = {
+    Phase.PREPROCESSING: ("identifier", "class_name", "have_header"),
+    Phase.INITIAL_SPLIT: ("original_database_instances", "train_database_instances", "test_database_instances"),
+    Phase.REFERENCE_SPLIT: ("reference_database_instances", "subtrain_database_instances"),
+    Phase.SUBSUBTRAIN_SPLIT: ("subsubtrain_databases_instances",),
+    Phase.LEARNING: ("failed_trees", "trees_in_forest", "subsubtrain_directories_path", "subsubtrain_databases_paths",
+                     "subsubtrain_indexes_paths", "cclassified_vectors_paths", "salammbo_vectors_paths"),
+    Phase.REDUCTION: (),
+    Phase.QUALITY: (),
+    Phase.CLASSES_MATRICES: ("classes_matrices_timings",),
+    Phase.CLUSTERING_TREES: ("clustering_trees_timings",),
+}
+
+
+def inputs_hash(phase: Phase) -> Optional[str]:
+    """ Hash the content of the input files of `phase` and the value of its parameters. The parsing and ending phases
+    have no checkpoint, thus no inputs hash. This method must be called right before the phase is computed, as the phase
+    can change its own parameters.
+    """
+    if phase not in _PHASES_INPUT_FILES:
+        return None
+    digest = hashlib.sha256()
+    digest.update(json.dumps([getattr(env, name) for name in _PHASES_PARAMETERS[phase]], default=str).encode())
+    _hash_files(digest, _get_paths(_PHASES_INPUT_FILES[phase]))
+    return digest.hexdigest()
+
+
+def phase_up_to_date(phase: Phase, phase_inputs_hash: Optional[str]) -> bool:
+    """ Check if the outputs of `phase` have been computed from its current inputs, hashed as `phase_inputs_hash`, and
+    have not been modified since. A phase without any checkpoint (the parsing and ending phases, or a phase never
+    computed) is never up to date.
+    """
+    checkpoint = (env.phases_hashes or dict()).get(phase_to_str(phase))
+    if checkpoint is None:
+        return False
+    return checkpoint[_KEY_INPUTS] == phase_inputs_hash and \
+        checkpoint[_KEY_OUTPUTS] == _outputs_hash(phase, variables=checkpoint[_KEY_VARIABLES])
+
+
+def restore_checkpoint(phase: Phase) -> None:
+    """ Set the variables of the `env` module to the values they had right after the last computation of `phase`. This
+    method must be called instead of computing an up to date phase.
+    """
+    for name, value in env.phases_hashes[phase_to_str(phase)][_KEY_VARIABLES].items():
+        setattr(env, name, value)
+
+
+def record_checkpoint(phase: Phase, phase_inputs_hash: Optional[str]) -> None:
+    """ Store the checkpoint of `phase`, whose inputs have been hashed as `phase_inputs_hash` right before its
+    computation, into the `phases_hashes` variable of the `env` module. This method must be called right after the
+    phase has been completed.
+    """
+    if phase not in _PHASES_OUTPUT_FILES:
+        return
+    variables = {name: getattr(env, name) for name in _PHASES_VARIABLES[phase]}
+    phases_hashes = dict(env.phases_hashes or dict())
+    phases_hashes[phase_to_str(phase)] = {_KEY_INPUTS: phase_inputs_hash, _KEY_OUTPUTS: _outputs_hash(phase),
+                                          _KEY_VARIABLES: variables}
+    env.phases_hashes = phases_hashes
+
+
+def _outputs_hash(phase: Phase, variables: Optional[Dict] = None) -> str:
+    """ Hash the content of the output files of `phase`. The values of `variables` take precedence over the variables of
+    the `env` module with the same name.
+    """
+    digest = hashlib.sha256()
+    _hash_files(digest, _get_paths(_PHASES_OUTPUT_FILES[phase], variables=variables))
+    return digest.hexdigest()
+
+
+def _get_paths(variables_names: Iterable[str], variables: Optional[Dict] = None) -> List[str]:
+    """ Return all the paths contained by the variables of the `env` module named `variables_names`, or by the values of
+    `variables` with the same name. A class matrix stored with the NUMPY format is followed by its sidecar file.
+    """
+    variables = variables or dict()
+    paths = list()
+    for name in variables_names:
+        value = variables[name] if name in variables else getattr(env, name)
+        paths.extend(_flatten_paths(value))
+        if name == "classes_matrices_files_paths" and env.matrix_format == Format.NUMPY:
+            # Imported locally, as the `matrix_tools` module imports NumPy
+            from fforest.src.file_tools.matrix_tools import sidecar_path
+            paths.extend([sidecar_path(path) for path in _flatten_paths(value)])
+    return paths
+
+
+def _flatten_paths(value) -> List[str]:
+    """ Return the paths contained by a path, a list of paths or a dictionary of paths, in a deterministic order.
+
+        Example :
+        >>> _flatten_paths({"yes": {"luka": "b", "classic": "a"}, "no": ["c", None]})
+        ['c', 'a', 'b']
+    """
+    if value is None:
+        return []
+    elif isinstance(value, str):
+        return [value]
+    elif isinstance(value, dict):
+        return [path for key in sorted(value.keys()) for path in _flatten_paths(value[key])]
+    return [path for element in value for path in _flatten_paths(element)]
+
+
+def _hash_files(digest, paths: List[str]) -> None:
+    """ Update `digest` with the content of each file of `paths`. A missing file has its own marker, so deleting an
+    output invalidates the checkpoint.
+    """
+    for path in paths:
+        if not os.path.isfile(path):
+            digest.update(_MISSING_FILE)
+            continue
+        file_digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(_BUFFER_SIZE), b""):
+                file_digest.update(block)
+        digest.update(file_digest.digest())
+
+
+if __name__ == "__main__":
+    pass
@@ -5,6 +5,8 @@ from typing import List, Dict
 
 import fforest.src.getters.environment as env
 from fforest.src.core.phase.learning_process.entropy_measures import EntropyMeasure
+from fforest.src.core.phase.performance_evaluation.clustering_trees_method.clustering_trees_method import \
+    ClusteringTreesMethod
 from fforest.src.core.phase.performance_evaluation.quality_computing_method.quality_computing_method import \
     QualityComputingMethod
 from fforest.src.core.phase.phase import Phase
@@ -13,6 +15,7 @@ from fforest.src.file_tools.dialect import Dialect
 from fforest.src.file_tools.format import Format
 from fforest.src.getters.get_output_message import Verbosity
 from fforest.src.vrac.file_system import dump_dict, load_dict
+from fforest.src.vrac.maths.distance_measure import DistanceMeasure
 
 ENVIRONMENT_FILE_NAME = "environment.json"
 
@@ -38,6 +41,13 @@ def load_environment_file(path: str = ENVIRONMENT_FILE_NAME) -> None:
     _dict_to_module(content)
 
 
+def load_checkpoints(path: str = ENVIRONMENT_FILE_NAME) -> None:
+    """ Load only the checkpoints of the phases from the environment file, into the `phases_hashes` variable of the
+    `environment` module (see the `checkpoint` module).
+    """
+    env.phases_hashes = load_dict(path).get("phases_hashes")
+
+
 def _get_all_environment_variables() -> List[str]:
     """ Retrieve all variables user-created inside the `environment` module. This method ignores all variables
     automatically created by Python during the module's creation (eg: the variables starting with "__").
@@ -82,15 +92,22 @@ def _deserialize_custom_classes(content: dict) -> None:
 def _deserialize_enums(content: dict) -> None:
     """ Convert int or str values contained in `content` and correspond to an Enum to the initial Enum. """
     for key, value in content.items():
-        if key in ("current_phase", "last_phase"):
+        if value is None:
+            # The parameter has not been initialized by the entry point used
+            continue
+        elif key in ("current_phase", "last_phase"):
             content[key] = Phase(value)
         elif key == "entropy_measure":
             content[key] = EntropyMeasure(value)
-        elif key in ("format_input", "format_output"):
+        elif key == "distance_measure":
+            content[key] = DistanceMeasure(value)
+        elif key in ("format_input", "format_output", "vector_format", "matrix_format"):
             content[key] = Format(value)
         elif key in ("initial_split_method", "reference_split_method", "subsubtrain_split_method"):
             content[key] = SplittingMethod(value)
         elif key == "quality_computing_method":
             content[key] = QualityComputingMethod(value)
+        elif key == "clustering_trees_method":
+            content[key] = ClusteringTreesMethod(value)
         elif key == "verbosity":
             content[key] = Verbosity(value)
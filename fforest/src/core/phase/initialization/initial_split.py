@@ -26,4 +26,5 @@ def initial_split() -> None:
                output_name_test=env.test_database_path,
                class_name=env.class_name,
                number_of_rows=env.original_database_instances,
+               seed=env.seed,
                dialect=env.dialect_output)
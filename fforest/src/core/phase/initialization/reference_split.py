@@ -27,6 +27,7 @@ def reference_split():
                output_name_test=env.subtrain_database_path,
                class_name=env.class_name,
                number_of_rows=env.train_database_instances,
+               seed=env.seed,
                dialect=env.dialect_output)
 
 
@@ -0,0 +1,153 @@
+""" This module streams the database of a tree to the Salammbô executable through a named pipe (FIFO), so that the
+database is never written to the disk. The rows of the database are given by their indexes in the subtrain database (see
+the `row_indexes` module), and written into the FIFO by a thread while Salammbô reads them.
+If Salammbô can't read the whole database from the FIFO, the database can still be written to a temporary file with
+`database_file`.
+"""
+import contextlib
+import os
+import tempfile
+import threading
+from typing import BinaryIO, Iterator, NamedTuple
+
+import numpy as np
+
+from fforest.src.file_tools.row_indexes import write_sample
+
+_DATABASE_NAME = "database"
+_JOIN_TIMEOUT = 0.1
+_BUFFER_SIZE = 1024 * 1024
+
+
+class StreamedDatabase(NamedTuple):
+    """ The database made of the rows stored in `indexes_path` of the database located at `input_path`, whose offsets
+    are stored in `offsets_path`.
+    """
+    input_path: str
+    offsets_path: str
+    indexes_path: str
+
+
+def fifo_supported() -> bool:
+    """ Check if the operating system supports the named pipes. """
+    return hasattr(os, "mkfifo")
+
+
+@contextlib.contextmanager
+def database_fifo(database: StreamedDatabase) -> Iterator["_FifoWriter"]:
+    """ Create a FIFO in a temporary directory, then write the rows of `database` into it with a thread while the
+    context is active. The FIFO is removed when leaving the context, then the `completed` attribute of the thread tells
+    if the reader read all the rows from the FIFO, up to its last byte. The reader must have terminated before leaving
+    the context. A reader stopping before the end of the FIFO is detected even if it exits successfully, but the
+    bytes it read and then ignored can't be : only the reading of the FIFO is checked.
+    The temporary directory is private to the context, thus the trees of a sweep sharing the same database never share
+    the same FIFO.
+
+        Example :
+        >>> import shutil, subprocess
+        >>> directory = tempfile.mkdtemp()
+        >>> paths = [os.path.join(directory, name) for name in ("database.csv", "offsets.npy", "indexes.npy")]
+        >>> with open(paths[0], "w") as file:
+        ...     _ = file.write("1,a\\n" * 100000)
+        >>> np.save(paths[1], np.arange(100001) * 4)
+        >>> np.save(paths[2], np.arange(100000))
+        >>> with database_fifo(StreamedDatabase(*paths)) as fifo:
+        ...     _ = subprocess.run(["cat", fifo.path], stdout=subprocess.DEVNULL, check=True)
+        >>> fifo.completed
+        True
+        >>> with database_fifo(StreamedDatabase(*paths)) as fifo:
+        ...     _ = subprocess.run(["head", "-c", "4", fifo.path], stdout=subprocess.DEVNULL, check=True)
+        >>> fifo.completed
+        False
+        >>> shutil.rmtree(directory)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        fifo_path = os.path.join(directory, _DATABASE_NAME)
+        os.mkfifo(fifo_path)
+        writer = _FifoWriter(database=database, fifo_path=fifo_path)
+        writer.start()
+        try:
+            yield writer
+        finally:
+            writer.stop()
+
+
+@contextlib.contextmanager
+def database_file(database: StreamedDatabase) -> Iterator[str]:
+    """ Write the rows of `database` to a file in a temporary directory, then return its path. The file is removed when
+    leaving the context.
+    As for the FIFOs, the temporary directory is private to the context : the trees of a sweep sharing the same database
+    never write nor read the same file.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = os.path.join(directory, _DATABASE_NAME)
+        write_database(database=database, database_path=database_path)
+        yield database_path
+
+
+def write_database(database: StreamedDatabase, database_path: str) -> None:
+    """ Write the rows of `database` to the file located at `database_path`. """
+    with open(database_path, mode="wb", buffering=_BUFFER_SIZE) as database_file:
+        _write_rows(database=database, output_file=database_file)
+
+
+def _write_rows(database: StreamedDatabase, output_file: BinaryIO) -> None:
+    """ Write the rows of `database` to the binary file object `output_file`. """
+    write_sample(input_path=database.input_path, offsets=np.load(database.offsets_path, mmap_mode="r"),
+                 rows_indexes=np.load(database.indexes_path), output_file=output_file)
+
+
+class _FifoWriter(threading.Thread):
+    """ A thread writing the rows of `database` into the FIFO located at `path`.
+    Once the reader opened the FIFO, the thread opens it for reading too, without ever reading from it : the bytes the
+    reader didn't consume stay inside the FIFO after the reader closed it, and are detected by the `stop` method.
+    """
+    def __init__(self, database: StreamedDatabase, fifo_path: str):
+        threading.Thread.__init__(self, daemon=True)
+        self.path = fifo_path
+        self.completed = False
+        self._database = database
+        self._written = False
+        self._unread_descriptor = None
+
+    def run(self) -> None:
+        try:
+            with open(self.path, mode="wb", buffering=_BUFFER_SIZE) as fifo:
+                self._unread_descriptor = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+                _write_rows(database=self._database, output_file=fifo)
+        except BrokenPipeError:
+            # The reader closed the FIFO before the thread opened it for reading
+            return
+        self._written = True
+
+    def stop(self) -> None:
+        """ Wait for the end of the thread, then check if the reader consumed all the rows written into the FIFO. If the
+        reader stopped reading the FIFO, or never opened it, the thread is blocked : the FIFO is opened to unblock it,
+        and the rows it writes are discarded.
+        """
+        self.join(_JOIN_TIMEOUT)
+        unread = self.is_alive()
+        if self.is_alive():
+            descriptor = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                while self.is_alive():
+                    try:
+                        if not os.read(descriptor, _BUFFER_SIZE):
+                            self.join(_JOIN_TIMEOUT)
+                    except BlockingIOError:
+                        self.join(_JOIN_TIMEOUT)
+            finally:
+                os.close(descriptor)
+
+        if self._unread_descriptor is not None:
+            try:
+                unread = unread or bool(os.read(self._unread_descriptor, 1))
+            except BlockingIOError:
+                pass
+            finally:
+                os.close(self._unread_descriptor)
+        self.completed = self._written and not unread
+
+
+if __name__ == "__main__":
+    pass
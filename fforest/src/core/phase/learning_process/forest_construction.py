@@ -2,17 +2,25 @@
 Salammbô executable, located inside the `bin` directory, at the root of the software. Then, compute cclassified and
 salammbo vectors for each t_norms on each tree and save it inside the tree directory.
 """
-from multiprocessing import Process
+import subprocess
+import traceback
+from multiprocessing import Pool
 from os import path
-from typing import List, Dict
+from typing import List, Dict, Union, Iterable, Optional, Tuple
 
 import fforest.src.getters.environment as env
+from fforest.src.core.phase.learning_process.database_fifo import StreamedDatabase, database_fifo, database_file, \
+    fifo_supported
 from fforest.src.core.phase.learning_process.entropy_measures import EntropyMeasure
+from fforest.src.core.phase.learning_process.salammbo_cache import cache_key, load_result, store_result
 from fforest.src.core.phase.learning_process.triangular_norms import tnorm_to_str
 from fforest.src.file_tools.csv_tools import Dialect
 from fforest.src.file_tools.csv_tools import dump_csv_content
+from fforest.src.file_tools.format import Format
+from fforest.src.file_tools.vector_tools import SalammboVector, dump_cclassified_vector, dump_salammbo_vector
+from fforest.src.getters.get_output_message import Message, vprint
 from fforest.src.vrac.iterators import grouper
-from fforest.src.vrac.process import execute_and_get_stdout
+from fforest.src.vrac.process import execute_and_iter_stdout, get_number_of_workers
 
 HERE = path.abspath(path.dirname(__file__))
 PATH_TO_SALAMMBO = HERE + "/../../../../bin/Salammbo"
@@ -28,34 +36,97 @@ def forest_construction():
     """ Asynchronously create `t_norms` number of trees/fuzzy-trees inside each subsubtrain directory with the help of
     the Salammbô executable, located inside the `bin` directory, at the root of the software. Then, compute cclassified
     and salammbo vectors for each t_norms on each tree and save it inside the tree directory.
+    The trees are constructed by a pool of `workers` processes. The trees whose construction failed are removed from the
+    forest and their indexes are stored into the `failed_trees` variable in the `env` module. If a `cache_directory` is
+    given, the results of the Salammbô executable are reused from one run to another (see the `salammbo_cache` module).
+    With the `fifo` option, the subsubtrain databases are streamed to the Salammbô executable through named pipes
+    instead of being read from the disk (see the `database_fifo` module).
     """
+    failed_trees, = construct_forests(forests_jobs=[forest_jobs()], workers=get_number_of_workers(env.workers))
+    for tree_index in failed_trees:
+        vprint(Message.TREE_CONSTRUCTION_FAILED, tree_index=tree_index)
+
+    remove_failed_trees(failed_trees=failed_trees)
+
+
+def forest_jobs() -> List[Dict]:
+    """ Return the jobs constructing the trees of the forest described by the variables of the `env` module. """
     chosen_options = _parameters_to_salammbo_options(discretization_threshold=str(env.discretization_threshold),
                                                      entropy_measure=env.entropy_measure,
                                                      number_of_tnorms=str(env.t_norms),
                                                      entropy_threshold=env.entropy_threshold,
                                                      min_size_leaf=env.minimal_size_leaf)
 
-    processes = list()
+    jobs = list()
     for tree_index in range(1, env.trees_in_forest + 1):
-        process = Process(target=_tree_construction,
-                          kwargs={"path_to_database": env.subsubtrain_databases_paths[tree_index - 1],
-                                  "path_to_reference_database": env.reference_database_path,
-                                  "chosen_options": chosen_options,
-                                  "cclassified_vectors_paths": env.cclassified_vectors_paths,
-                                  "salammbo_vectors_paths": env.salammbo_vectors_paths,
-                                  "possible_classes": env.possible_classes,
-                                  "tree_index": tree_index,
-                                  "dialect": env.dialect_output,
-                                  })
-        processes.append(process)
-
-    # Start the processes
-    for process in processes:
-        process.start()
-
-    # Wait for all processes to finish
-    for process in processes:
-        process.join()
+        jobs.append({"path_to_database": env.subsubtrain_databases_paths[tree_index - 1],
+                     "path_to_reference_database": env.reference_database_path,
+                     "chosen_options": chosen_options,
+                     "cclassified_vectors_paths": env.cclassified_vectors_paths,
+                     "salammbo_vectors_paths": env.salammbo_vectors_paths,
+                     "possible_classes": env.possible_classes,
+                     "tree_index": tree_index,
+                     "dialect": env.dialect_output,
+                     "vector_format": env.vector_format,
+                     "cache_directory": env.cache_directory,
+                     "cache_size": env.cache_size,
+                     "streamed_database": _streamed_database(tree_index) if env.fifo else None,
+                     })
+    return jobs
+
+
+def _streamed_database(tree_index: int) -> StreamedDatabase:
+    """ Return the subsubtrain database of the tree `tree_index`, made of rows of the subtrain database. """
+    return StreamedDatabase(input_path=env.subtrain_database_path,
+                            offsets_path=env.subtrain_offsets_path,
+                            indexes_path=env.subsubtrain_indexes_paths[tree_index - 1])
+
+
+def construct_forests(forests_jobs: List[List[Dict]], workers: int) -> List[List[int]]:
+    """ Construct all the trees of the forests described by `forests_jobs` with a single pool of `workers` processes, so
+    that no more than `workers` Salammbô executables are running at the same time. Return, for each forest, the sorted
+    indexes of the trees whose construction failed.
+    """
+    indexed_jobs = [(forest_index, job) for forest_index, jobs in enumerate(forests_jobs) for job in jobs]
+    failed_trees = [list() for _ in forests_jobs]
+    with Pool(processes=workers) as pool:
+        for forest_index, tree_index in pool.imap_unordered(_tree_construction_job, indexed_jobs):
+            if tree_index is not None:
+                failed_trees[forest_index].append(tree_index)
+    return [sorted(forest_failed_trees) for forest_failed_trees in failed_trees]
+
+
+def _tree_construction_job(indexed_job: Tuple[int, Dict]) -> Tuple[int, Union[int, None]]:
+    """ Call `_tree_construction` with the content of the job as arguments. Return the index of the forest of the job,
+    and the index of the tree if its construction failed or `None` otherwise. The exception is printed but not raised,
+    thus a bad tree doesn't stop the construction of the others.
+    """
+    forest_index, job = indexed_job
+    try:
+        _tree_construction(**job)
+    except Exception:
+        traceback.print_exc()
+        return forest_index, job["tree_index"]
+    return forest_index, None
+
+
+def remove_failed_trees(failed_trees: List[int]) -> None:
+    """ Remove the trees whose construction failed from all the trees-related variables in the `env` module, so that
+    the following phases only work with the trees successfully constructed.
+    """
+    env.failed_trees = failed_trees
+    if not failed_trees:
+        return
+
+    kept_indexes = [tree_index for tree_index in range(env.trees_in_forest) if tree_index + 1 not in failed_trees]
+    env.subsubtrain_directories_path = [env.subsubtrain_directories_path[i] for i in kept_indexes]
+    env.subsubtrain_databases_paths = [env.subsubtrain_databases_paths[i] for i in kept_indexes]
+    env.subsubtrain_indexes_paths = [env.subsubtrain_indexes_paths[i] for i in kept_indexes]
+    env.cclassified_vectors_paths = {tnorm: [paths[i] for i in kept_indexes] for
+                                     tnorm, paths in env.cclassified_vectors_paths.items()}
+    env.salammbo_vectors_paths = {tnorm: [paths[i] for i in kept_indexes] for
+                                  tnorm, paths in env.salammbo_vectors_paths.items()}
+    env.trees_in_forest = len(kept_indexes)
 
 
 def _parameters_to_salammbo_options(discretization_threshold: str, entropy_measure: EntropyMeasure,
@@ -91,39 +162,108 @@ def _parameters_to_salammbo_options(discretization_threshold: str, entropy_measu
 
 def _tree_construction(path_to_database: str, path_to_reference_database: str, chosen_options: iter,
                        cclassified_vectors_paths: Dict[str, List[str]], salammbo_vectors_paths: Dict[str, List[str]],
-                       possible_classes: List[str], tree_index: int, dialect: Dialect) -> None:
+                       possible_classes: List[str], tree_index: int, dialect: Dialect,
+                       vector_format: Format = Format.CSV, cache_directory: Optional[str] = None,
+                       cache_size: int = 0, streamed_database: Optional[StreamedDatabase] = None) -> None:
     """ Create `t_norms` number of trees/fuzzy-trees inside each subsubtrain directory with the help of the Salammbô
     executable, located inside the `bin` directory, at the root of the software. Then, compute cclassified and salammbo
-    vectors for each t_norms on each tree and save it inside the tree directory.
+    vectors for each t_norms on each tree and save it inside the tree directory with the format `vector_format`.
+    If `cache_directory` is given, the Salammbô executable is only called if its result is not already cached.
+    If `streamed_database` is given, the database isn't read from `path_to_database` but streamed to the Salammbô
+    executable.
     """
     number_of_tnorms = len(cclassified_vectors_paths.keys())
-    lines = _construct_tree(path_to_database=path_to_database,
-                            path_to_reference_database=path_to_reference_database,
-                            chosen_options=chosen_options)
-    salammbo_vectors = _parse_result(lines=lines,
-                                     number_of_tnorms=number_of_tnorms)
+    salammbo_vectors = _get_salammbo_result(path_to_database=path_to_database,
+                                            path_to_reference_database=path_to_reference_database,
+                                            chosen_options=chosen_options,
+                                            cache_directory=cache_directory,
+                                            cache_size=cache_size,
+                                            streamed_database=streamed_database)
     cclassified_vectors = _get_cclassified_dictionary(salammbo_dict=salammbo_vectors,
                                                       number_of_tnorms=number_of_tnorms)
     _save_cclassified_vectors(cclassified_vector=cclassified_vectors,
                               vectors_path=cclassified_vectors_paths,
                               tree_index=tree_index,
-                              dialect=dialect)
+                              dialect=dialect,
+                              vector_format=vector_format)
     _save_salammbo_vectors(vector_content=salammbo_vectors,
                            vectors_path=salammbo_vectors_paths,
                            tree_index=tree_index,
                            possible_classes=possible_classes,
-                           dialect=dialect)
+                           dialect=dialect,
+                           vector_format=vector_format)
+
+
+def _get_salammbo_result(path_to_database: str, path_to_reference_database: str, chosen_options: List[str],
+                         cache_directory: Optional[str], cache_size: int,
+                         streamed_database: Optional[StreamedDatabase] = None) -> dict:
+    """ Return the parsed result of the Salammbô executable, from the cache located in `cache_directory` if possible.
+    Without any `cache_directory`, the executable is always called.
+    """
+    if cache_directory is None:
+        return _salammbo_result(path_to_database=path_to_database,
+                                path_to_reference_database=path_to_reference_database,
+                                chosen_options=chosen_options,
+                                streamed_database=streamed_database)
+
+    # A streamed database is identified by the database it's made of and by the indexes of its rows
+    if streamed_database is None:
+        databases = [path_to_database, path_to_reference_database]
+    else:
+        databases = [streamed_database.input_path, streamed_database.indexes_path, path_to_reference_database]
+    key = cache_key(executable=PATH_TO_SALAMMBO, options=MANDATORY_OPTIONS + chosen_options, databases=databases)
+    result = load_result(cache_directory=cache_directory, key=key)
+    if result is None:
+        result = _salammbo_result(path_to_database=path_to_database,
+                                  path_to_reference_database=path_to_reference_database,
+                                  chosen_options=chosen_options,
+                                  streamed_database=streamed_database)
+        store_result(cache_directory=cache_directory, key=key, result=result, cache_size=cache_size)
+    return result
 
 
-def _construct_tree(path_to_database: str, path_to_reference_database: str, chosen_options: iter) -> str:
-    """ Call the Salammbô executable with the chosen options and parameters, then return the output. """
+def _salammbo_result(path_to_database: str, path_to_reference_database: str, chosen_options: List[str],
+                     streamed_database: Optional[StreamedDatabase]) -> dict:
+    """ Call the Salammbô executable then return its parsed result. If `streamed_database` is given, the database is
+    streamed to the executable through a FIFO. If the executable can't read the whole database from the FIFO, because it
+    needs to seek through it for instance, the database is written to a temporary file and the executable is called
+    again on this file. The database is never written to `path_to_database`, which can be shared by the trees of a
+    sweep.
+    """
+    if streamed_database is None:
+        return _parse_result(lines=_construct_tree(path_to_database=path_to_database,
+                                                   path_to_reference_database=path_to_reference_database,
+                                                   chosen_options=chosen_options))
+
+    if fifo_supported():
+        try:
+            with database_fifo(database=streamed_database) as fifo:
+                result = _parse_result(lines=_construct_tree(path_to_database=fifo.path,
+                                                             path_to_reference_database=path_to_reference_database,
+                                                             chosen_options=chosen_options))
+            if fifo.completed:
+                return result
+        except subprocess.CalledProcessError:
+            pass
+        vprint(Message.FIFO_FALLBACK, database=path_to_database)
+
+    with database_file(database=streamed_database) as database_path:
+        return _parse_result(lines=_construct_tree(path_to_database=database_path,
+                                                   path_to_reference_database=path_to_reference_database,
+                                                   chosen_options=chosen_options))
+
+
+def _construct_tree(path_to_database: str, path_to_reference_database: str, chosen_options: iter) -> Iterable[str]:
+    """ Call the Salammbô executable with the chosen options and parameters, then iterate through the lines of its
+    output as soon as they are written.
+    """
     parameters = MANDATORY_OPTIONS + chosen_options
     parameters.append(path_to_database)
     parameters.append(path_to_reference_database)
-    return execute_and_get_stdout(PATH_TO_SALAMMBO, *parameters)
+    return execute_and_iter_stdout(PATH_TO_SALAMMBO, *parameters)
 
 
-def _parse_result(lines: str, number_of_tnorms: int) -> dict:
+def _parse_result(lines: Iterable[str]) -> dict:
     """ Parse lines outputted from the Salammbo executable.
     Construct a dictionary of result.
     Each key is an identifier of an instance and has for value another dictionary. Each of theses dictionary contains
@@ -132,31 +272,27 @@ def _parse_result(lines: str, number_of_tnorms: int) -> dict:
     associated with a degree of membership.
     Each lines format is as follows :
     Null T-NORM IDENTIFIER TRUECLASS [(FOUNDCLASSX MEMBERSHIPDEGREEX) (FOUNDCLASSY MEMBERSHIPDEGREEY) ...]
+    The lines are parsed one by one, thus `lines` can be a stream and the raw output is never stored in memory.
     """
     result = dict()
-    try:
-        for tnorm_chunk in grouper(number_of_tnorms, lines.split("\n")):
-            for instance in tnorm_chunk:
-                _, tnorm, identifier, true_class, *rest = instance.strip("\"").split()
-                identifier = identifier.strip("\"")
-                try:
-                    result[identifier][tnorm_to_str(int(tnorm))] = {class_found.strip('"'): float(membership_degree)
-                                                                    for class_found, membership_degree in
-                                                                    grouper(2, rest)}
-                except KeyError:  # Will be triggered at the first instance for each chunk
-                    result[identifier] = dict()
-                    result[identifier][tnorm_to_str(int(tnorm))] = {class_found.strip('"'): float(membership_degree)
-                                                                    for class_found, membership_degree in
-                                                                    grouper(2, rest)}
-                    # Try to cast the trueclass as float to reduce the trailing zeros
-                    # We need to do this because we compare them to other classes as string
-                    try:
-                        result[identifier][KEY_TRUECLASS] = str(float(true_class.strip("\"")))
-                    except ValueError:
-                        result[identifier][KEY_TRUECLASS] = str(true_class.strip("\""))
-
-    except ValueError:  # For the last empty line
-        pass
+    for instance in lines:
+        if not instance.strip():
+            continue
+        _, tnorm, identifier, true_class, *rest = instance.strip("\"").split()
+        identifier = identifier.strip("\"")
+        try:
+            result[identifier][tnorm_to_str(int(tnorm))] = {class_found.strip('"'): float(membership_degree)
+                                                            for class_found, membership_degree in grouper(2, rest)}
+        except KeyError:  # Will be triggered at the first line of each instance
+            result[identifier] = dict()
+            result[identifier][tnorm_to_str(int(tnorm))] = {class_found.strip('"'): float(membership_degree)
+                                                            for class_found, membership_degree in grouper(2, rest)}
+            # Try to cast the trueclass as float to reduce the trailing zeros
+            # We need to do this because we compare them to other classes as string
+            try:
+                result[identifier][KEY_TRUECLASS] = str(float(true_class.strip("\"")))
+            except ValueError:
+                result[identifier][KEY_TRUECLASS] = str(true_class.strip("\""))
     return result
 
 
@@ -182,55 +318,66 @@ def _get_cclassified_dictionary(salammbo_dict: dict, number_of_tnorms: int) -> D
 
 
 def _save_cclassified_vectors(cclassified_vector: Dict[str, Dict[str, bool]], vectors_path: Dict[str, List[str]],
-                              tree_index: int, dialect: Dialect) -> None:
+                              tree_index: int, dialect: Dialect, vector_format: Format) -> None:
     """ Dump the content of the cclassified vectors inside the subsubtrain directory. """
     for tnorm in vectors_path.keys():
         _save_cclassified_vector(vector_path=vectors_path[tnorm][tree_index - 1],
                                  vector_content=cclassified_vector,
                                  tnorm_name=tnorm,
-                                 dialect=dialect)
+                                 dialect=dialect,
+                                 vector_format=vector_format)
 
 
 def _save_cclassified_vector(vector_path: str, vector_content: Dict[str, Dict[str, bool]], tnorm_name: str,
-                             dialect: Dialect) -> None:
+                             dialect: Dialect, vector_format: Format) -> None:
     """ Dump the cclassified vector inside the subsubtrain directory for one t-norm. """
-    content = list()
-    for identifier in vector_content.keys():
-        content.append([identifier, 1.0 if vector_content[identifier][tnorm_name] else 0.0])
-
-    dump_csv_content(path=vector_path, content=content, dialect=dialect)
+    dump_cclassified_vector(path=vector_path,
+                            identifiers=list(vector_content.keys()),
+                            cclassified=[vector_content[identifier][tnorm_name] for
+                                         identifier in vector_content.keys()],
+                            vector_format=vector_format,
+                            dialect=dialect)
 
 
 def _save_salammbo_vectors(vector_content: Dict, vectors_path: Dict[str, List[str]], possible_classes: List[str],
-                           tree_index: int, dialect: Dialect) -> None:
+                           tree_index: int, dialect: Dialect, vector_format: Format) -> None:
     """ Dump the content of the salammbo vectors inside the subsubtrain directory. """
     for tnorm in vectors_path.keys():
         _save_salammbo_vector(vector_path=vectors_path[tnorm][tree_index - 1],
                               vector_content=vector_content,
                               tnorm=tnorm,
                               possible_classes=possible_classes,
-                              dialect=dialect)
+                              dialect=dialect,
+                              vector_format=vector_format)
 
 
 def _save_salammbo_vector(vector_path: str, vector_content: Dict, tnorm: str, possible_classes: List[str],
-                          dialect: Dialect) -> None:
+                          dialect: Dialect, vector_format: Format) -> None:
     """ Dump the salammbo vector inside the subsubtrain directory for one t-norm. """
-    content = list()
-
-    # Add header
-    content.append([KEY_ID, KEY_TRUECLASS, *(str(possible_class) for possible_class in possible_classes)])
-
-    # Add rows
+    classes = [str(possible_class) for possible_class in possible_classes]
+    memberships = list()
     for identifier in vector_content.keys():
-        row = [identifier, vector_content[identifier][KEY_TRUECLASS]]
+        row = list()
         for possible_class in possible_classes:
             try:
                 row.append(vector_content[identifier][tnorm][possible_class])
             except KeyError:
                 row.append(0.0)
-        content.append(row)
-
-    dump_csv_content(path=vector_path, content=content, dialect=dialect)
+        memberships.append(row)
+
+    if vector_format == Format.CSV:
+        # Add header, then rows
+        content = [[KEY_ID, KEY_TRUECLASS, *classes]]
+        for identifier, row in zip(vector_content.keys(), memberships):
+            content.append([identifier, vector_content[identifier][KEY_TRUECLASS], *row])
+        dump_csv_content(path=vector_path, content=content, dialect=dialect)
+    else:
+        vector = SalammboVector(identifiers=list(vector_content.keys()),
+                                classes=classes,
+                                true_classes=[vector_content[identifier][KEY_TRUECLASS] for
+                                              identifier in vector_content.keys()],
+                                memberships=memberships)
+        dump_salammbo_vector(path=vector_path, vector=vector, vector_format=vector_format, dialect=dialect)
 
 
 if __name__ == "__main__":
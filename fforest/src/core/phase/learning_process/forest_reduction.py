@@ -3,83 +3,77 @@ class's % of membership for all salammbo vectors. It assign a classification dif
 database. Theses difficulty vectors will be dumped into the subtrain directory.
 """
 
+from multiprocessing import Pool
 from typing import Dict, List
 
+import numpy as np
+
 import fforest.src.getters.environment as env
 from fforest.src.core.phase.learning_process.forest_construction import KEY_ID, KEY_DIFFICULTY
-from fforest.src.file_tools.csv_tools import iter_rows, get_header, dump_csv_content
+from fforest.src.file_tools.csv_tools import dump_csv_content, get_column
 from fforest.src.file_tools.dialect import Dialect
-from fforest.src.vrac.maths.maths import round_float
+from fforest.src.file_tools.format import Format
+from fforest.src.file_tools.vector_tools import IdentifiersIndex, load_true_class_membership
+from fforest.src.vrac.maths.arrays import round_floats
+from fforest.src.vrac.process import get_number_of_workers
+
+_WORKER_PARAMETERS = dict()
 
 
 def forest_reduction() -> None:
     """ Compute one difficulty vector for each triangular norm used. A difficulty vector correspond to the sum of all
     true class's % of membership for all salammbo vectors. It assign a classification difficulty to an example from the
     reference database. Theses difficulty vectors will be dumped into the subtrain directory.
+    The salammbo vectors of each tree are loaded together by a pool of `workers` processes.
     """
+    identifiers = get_column(path=env.reference_database_path, column=0, have_header=False, dialect=env.dialect_output)
     difficulty_vectors = \
         _compute_difficulty_vectors(number_of_trees=env.trees_in_forest,
                                     salammbo_vectors_dict=env.salammbo_vectors_paths,
-                                    dialect=env.dialect_output)
+                                    identifiers=identifiers,
+                                    dialect=env.dialect_output,
+                                    vector_format=env.vector_format,
+                                    workers=get_number_of_workers(env.workers))
 
     _dump_difficulty_vectors(difficulty_vectors=difficulty_vectors,
                              difficulty_vectors_paths=env.difficulty_vectors_paths,
                              dialect=env.dialect_output)
 
 
-def _compute_difficulty_vectors(number_of_trees: int, salammbo_vectors_dict: Dict[str, List],
-                                dialect: Dialect) -> Dict[str, Dict[str, float]]:
+def _compute_difficulty_vectors(number_of_trees: int, salammbo_vectors_dict: Dict[str, List], identifiers: List[str],
+                                dialect: Dialect, vector_format: Format, workers: int) -> Dict[str, Dict[str, float]]:
     """ Compute a difficulty vector for each t-norm used. A difficulty vector correspond to the sum of all true class's
     % of membership for all salammbo vectors. It assign a classification difficulty to an example from the reference
     database.
+    Each tree directory is visited once : a worker loads the salammbo vectors of all the t-norms of a tree, aligned on
+    `identifiers`. The trees are then reduced in their original order, one after the other, thus the floating values
+    are summed in the same order whatever the number of workers. A value closer than 2e-16 to an integer is then
+    replaced by this integer by `round_floats`.
     """
-    difficulty_vectors = dict()
-    for tnorm in salammbo_vectors_dict.keys():
-        difficulty_vectors[tnorm] =\
-            _compute_difficulty_vector(salammbo_vectors_paths=salammbo_vectors_dict[tnorm],
-                                       number_of_trees=number_of_trees,
-                                       dialect=dialect)
-    return difficulty_vectors
-
-
-def _compute_difficulty_vector(salammbo_vectors_paths: List[str], number_of_trees: int,
-                               dialect: Dialect) -> Dict[str, float]:
-    """ Compute a difficulty vector for one t-norm. A difficulty vector correspond to the sum of all true class's % of
-    membership for all salammbo vectors. It assign a classification difficulty to an example from the reference
-    database.
-    """
-    difficulty_vector = dict()
-    for vector_path in salammbo_vectors_paths:
-        salammbo_vector = _get_salammbo_vector(vector_path=vector_path, number_of_trees=number_of_trees,
-                                               dialect=dialect)
-
-        try:
-            difficulty_vector = {instance: difficulty_vector[instance] + salammbo_vector[instance] for
-                                 instance in salammbo_vector.keys()}
-        except KeyError:
-            difficulty_vector = {instance: salammbo_vector[instance] for instance in salammbo_vector.keys()}
-
-    # Round wrong floating values
-    for instance in difficulty_vector.keys():
-        difficulty_vector[instance] = round_float(difficulty_vector[instance])
-    return difficulty_vector
-
-
-def _get_salammbo_vector(vector_path: str, number_of_trees: int, dialect: Dialect) -> Dict[str, int]:
-    """ Construct an salammbo vector for one t-norm. A salammbo vector correspond to a dictionary mapping one instance
-    to its true class and all classes found by a tree, along with their % of membership.
-    """
-    salammbo_vector = dict()
+    tnorms = list(salammbo_vectors_dict.keys())
+    jobs = [{tnorm: salammbo_vectors_dict[tnorm][tree_index] for tnorm in tnorms}
+            for tree_index in range(number_of_trees)]
+
+    difficulties = {tnorm: np.zeros(len(identifiers), dtype=np.float64) for tnorm in tnorms}
+    with Pool(processes=workers, initializer=_init_reduction_worker,
+              initargs=(identifiers, dialect, vector_format)) as pool:
+        for tree_memberships in pool.imap(_load_tree_memberships, jobs):
+            for tnorm in tnorms:
+                difficulties[tnorm] += tree_memberships[tnorm] / number_of_trees
+
+    return {tnorm: dict(zip(identifiers, round_floats(difficulties[tnorm]))) for tnorm in tnorms}
+
 
-    # Extract classes from the header
-    classes = get_header(path=vector_path, dialect=dialect)[2:]
+def _init_reduction_worker(identifiers: List[str], dialect: Dialect, vector_format: Format) -> None:
+    """ Store the parameters shared by all the trees into each worker process, so that they are sent only once. """
+    global _WORKER_PARAMETERS
+    _WORKER_PARAMETERS = {"index": IdentifiersIndex(identifiers), "dialect": dialect, "vector_format": vector_format}
 
-    for row in iter_rows(path=vector_path, skip_header=True, dialect=dialect):
-        identifier, true_class, *rest = row
-        membership = rest[classes.index(true_class)]
-        salammbo_vector[identifier] = membership / number_of_trees
 
-    return salammbo_vector
+def _load_tree_memberships(vectors_paths: Dict[str, str]) -> Dict[str, np.ndarray]:
+    """ Load the % of membership to their true class of all the instances, for each salammbo vector of a tree. """
+    return {tnorm: load_true_class_membership(path=vector_path, **_WORKER_PARAMETERS) for
+            tnorm, vector_path in vectors_paths.items()}
 
 
 def _dump_difficulty_vectors(difficulty_vectors: Dict[str, Dict[str, float]], difficulty_vectors_paths: Dict[str, str],
@@ -0,0 +1,121 @@
+""" This module caches on disk the results of the Salammbô executable, so that a tree learned from the same databases
+with the same options is never learned twice, even by different runs of the software.
+The cache is content-addressed : each result is stored in a JSON file named after the SHA-256 hash of the Salammbô
+executable, of its options and of the content of the databases it reads. Thus, a modified database or a new version of
+the executable can't reuse an outdated result.
+The results are written in a temporary file then atomically renamed, so that concurrent workers, or concurrent runs
+sharing the same cache directory, never read a partially written result. When the cache exceeds its maximal size, the
+least recently used results are removed first.
+"""
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from typing import List, Optional
+
+from fforest.src.vrac.file_system import create_dir
+
+_RESULT_EXTENSION = ".json"
+_TEMPORARY_EXTENSION = ".tmp"
+_BUFFER_SIZE = 1024 * 1024
+_BYTES_IN_MEGABYTE = 1024 * 1024
+
+
+def cache_key(executable: str, options: List[str], databases: List[str]) -> str:
+    """ Return the key of the result of `executable` called with `options` on the files `databases`. """
+    digest = hashlib.sha256()
+    digest.update(_file_hash(executable).encode())
+    digest.update(json.dumps(options).encode())
+    for database in databases:
+        digest.update(_file_hash(database).encode())
+    return digest.hexdigest()
+
+
+def load_result(cache_directory: str, key: str) -> Optional[dict]:
+    """ Return the result stored in `cache_directory` with the key `key`, or `None` if there is no such result. A loaded
+    result becomes the most recently used one.
+    """
+    path = _result_path(cache_directory=cache_directory, key=key)
+    try:
+        with open(path, encoding="utf8") as file:
+            result = json.load(file)
+        os.utime(path)
+    except (OSError, ValueError):
+        # A missing result, a result removed by another process, or a corrupted one
+        return None
+    return result
+
+
+def store_result(cache_directory: str, key: str, result: dict, cache_size: int) -> None:
+    """ Store `result` in `cache_directory` with the key `key`, then remove the least recently used results until the
+    size of the cache is lower than `cache_size` megabytes.
+    """
+    create_dir(cache_directory)
+    descriptor, temporary_path = tempfile.mkstemp(suffix=_TEMPORARY_EXTENSION, dir=cache_directory)
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf8") as file:
+            json.dump(result, file)
+        os.replace(temporary_path, _result_path(cache_directory=cache_directory, key=key))
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+    _evict_results(cache_directory=cache_directory, maximal_size=cache_size * _BYTES_IN_MEGABYTE)
+
+
+def _result_path(cache_directory: str, key: str) -> str:
+    """ Return the path of the result with the key `key`. """
+    return os.path.join(cache_directory, key + _RESULT_EXTENSION)
+
+
+def _evict_results(cache_directory: str, maximal_size: int) -> None:
+    """ Remove the least recently used results of `cache_directory` until their total size is lower than
+    `maximal_size` bytes.
+    """
+    results = list()
+    for entry in os.scandir(cache_directory):
+        if entry.name.endswith(_RESULT_EXTENSION):
+            try:
+                status = entry.stat()
+            except FileNotFoundError:
+                continue
+            results.append((status.st_mtime, status.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in results)
+    for _, size, path in sorted(results):
+        if total_size <= maximal_size:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Already removed by another process
+            pass
+        total_size -= size
+
+
+def _file_hash(path: str) -> str:
+    """ Return the hash of the file located at `path`. The hash is computed once per process and per version of the
+    file, as all the trees are learned with the same executable, and the streamed databases of the trees are all made of
+    the same subtrain database.
+    """
+    status = os.stat(path)
+    return _versioned_content_hash(path, status.st_mtime_ns, status.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _versioned_content_hash(path: str, modification_time: int, size: int) -> str:
+    """ Return the hash of the file located at `path`, cached for its `modification_time` and its `size`. """
+    return _content_hash(path)
+
+
+def _content_hash(path: str) -> str:
+    """ Return the SHA-256 hash of the content of the file located at `path`. """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(_BUFFER_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+if __name__ == "__main__":
+    pass
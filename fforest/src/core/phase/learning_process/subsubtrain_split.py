@@ -5,7 +5,7 @@ module.
 from typing import List
 
 import fforest.src.getters.environment as env
-from fforest.src.core.splitting_methods.split import split
+from fforest.src.core.splitting_methods.split import split, SplittingMethod
 from fforest.src.vrac.file_system import create_dir
 
 
@@ -17,21 +17,47 @@ def subsubtrain_split() -> None:
     # Create the subsubtrain directories
     _create_subsubtrain_directories(env.subsubtrain_directories_path)
 
-    # Split the database
-    row_limit = env.subtrain_database_instances // env.trees_in_forest
-    list_instances = \
-        split(input_path=env.subtrain_database_path,
-              row_limit=row_limit,
-              method=env.subsubtrain_split_method,
-              class_name=env.class_name,
-              number_of_rows=env.subtrain_database_instances,
-              output_paths=env.subsubtrain_databases_paths,
-              dialect=env.dialect_output)
+    # Split the database, or sample it with the bootstrap method. If the databases are streamed to Salammbô through
+    # FIFOs during the learning phase, only the indexes of their rows are stored
+    if env.subsubtrain_split_method == SplittingMethod.BOOTSTRAP:
+        # Imported locally, as the `bootstrap` module imports NumPy
+        from fforest.src.core.splitting_methods.bootstrap import bootstrap
+        list_instances = \
+            bootstrap(input_path=env.subtrain_database_path,
+                      number_of_rows=env.subtrain_database_instances,
+                      output_paths=env.subsubtrain_databases_paths,
+                      indexes_paths=env.subsubtrain_indexes_paths,
+                      sampling_fraction=env.sampling_fraction,
+                      seed=env.seed,
+                      dialect=env.dialect_output,
+                      offsets_path=env.subtrain_offsets_path if env.fifo else None)
+    else:
+        row_limit = env.subtrain_database_instances // env.trees_in_forest
+        list_instances = \
+            split(input_path=env.subtrain_database_path,
+                  row_limit=row_limit,
+                  method=env.subsubtrain_split_method,
+                  class_name=env.class_name,
+                  number_of_rows=env.subtrain_database_instances,
+                  output_paths=env.subsubtrain_databases_paths,
+                  seed=env.seed,
+                  dialect=env.dialect_output,
+                  indexes_paths=env.subsubtrain_indexes_paths if env.fifo else None)
+        if env.fifo:
+            _save_subtrain_offsets()
 
     # Store the number of instances of each tree along with its name in the `env` module
     env.subsubtrain_databases_instances = dict(zip(env.subsubtrain_directories_path, list_instances))
 
 
+def _save_subtrain_offsets() -> None:
+    """ Store the offsets of the rows of the subtrain database, used to stream the subsubtrain databases. """
+    # Imported locally, as the `row_indexes` module imports NumPy
+    import numpy as np
+    from fforest.src.file_tools.row_indexes import rows_offsets
+    np.save(env.subtrain_offsets_path, rows_offsets(path=env.subtrain_database_path, dialect=env.dialect_output))
+
+
 def _create_subsubtrain_directories(subsubtrain_directories: List[str]) -> None:
     """ Create all needed directories which will each serves as a workplace for a single tree. """
     for dir_name in subsubtrain_directories:
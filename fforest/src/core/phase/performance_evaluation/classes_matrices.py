@@ -4,26 +4,43 @@ A class matrix depends of a specific class and link one instance to the % of mem
 class.
 """
 import os
-from typing import List, Dict
+import time
+from multiprocessing import Pool
+from typing import List, Dict, Tuple
+
+import numpy as np
 
 import fforest.src.getters.environment as env
-from fforest.src.file_tools.csv_tools import get_column, dump_csv_content, get_columns
+from fforest.src.core.phase.performance_evaluation.jobs_timings import print_timings_summary
+from fforest.src.file_tools.csv_tools import get_column
 from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.format import Format
+from fforest.src.file_tools.matrix_tools import ClassMatrix, dump_class_matrix
+from fforest.src.file_tools.vector_tools import load_classes_memberships
+from fforest.src.getters.get_output_message import Message
 from fforest.src.vrac.file_system import create_dir
-
-KEY_IDENTIFIER = "ID"
+from fforest.src.vrac.process import get_number_of_workers
 
 
 def classes_matrices() -> None:
+    """ Compute and dump a class matrix for each class and each t-norm, with a pool of `workers` processes. The time
+    spent to compute each class matrix is stored into the `classes_matrices_timings` variable in the `env` module.
+    """
     _create_directories(classes_matrices_directories=env.classes_matrices_directories_path,
                         possibles_classes=env.possible_classes)
 
-    _compute_classes_matrices(possible_classes=env.possible_classes,
-                              tnorms=env.t_norms_names,
-                              reference_database_path=env.reference_database_path,
-                              classes_matrices_paths=env.classes_matrices_files_paths,
-                              forest_paths=env.salammbo_vectors_paths,
-                              dialect=env.dialect_output)
+    env.classes_matrices_timings = \
+        _compute_classes_matrices(possible_classes=env.possible_classes,
+                                  tnorms=env.t_norms_names,
+                                  reference_database_path=env.reference_database_path,
+                                  classes_matrices_paths=env.classes_matrices_files_paths,
+                                  forest_paths=env.salammbo_vectors_paths,
+                                  dialect=env.dialect_output,
+                                  vector_format=env.vector_format,
+                                  matrix_format=env.matrix_format,
+                                  workers=get_number_of_workers(env.workers))
+
+    print_timings_summary(message=Message.VERBOSE_CLASSES_MATRICES_TIMINGS, timings=env.classes_matrices_timings)
 
 
 def _create_directories(classes_matrices_directories: Dict[str, str], possibles_classes: List[str]) -> None:
@@ -34,40 +51,68 @@ def _create_directories(classes_matrices_directories: Dict[str, str], possibles_
 
 def _compute_classes_matrices(possible_classes: List[str], tnorms: List[str], reference_database_path: str,
                               classes_matrices_paths: Dict[str, Dict[str, str]], forest_paths: Dict[str, str],
-                              dialect: Dialect) -> None:
+                              dialect: Dialect, vector_format: Format, matrix_format: Format,
+                              workers: int) -> Dict[str, Dict[str, float]]:
+    """ Compute and dump the class matrix of each class and each t-norm. The salammbo vector of a tree is loaded once
+    per t-norm, and scattered into the class matrices of all the classes.
+    Each t-norm is an independent job of a pool of `workers` processes : a worker loads the class matrices of its t-norm
+    then dumps them itself, so the class matrices are never sent between the processes.
+    Return a dictionary mapping each class and each t-norm to the time spent (in seconds) to compute its class matrix.
+    """
     identifiers = get_column(path=reference_database_path,
                              column=0,
                              have_header=False,
                              dialect=dialect)
-    for class_name in possible_classes:
-        for tnorm in tnorms:
-            _compute_class_matrix(class_name=class_name,
-                                  tnorm=tnorm,
-                                  identifiers=identifiers,
-                                  class_matrix_path=classes_matrices_paths[class_name][tnorm],
-                                  forest_paths=forest_paths,
-                                  dialect=dialect)
-
-
-def _compute_class_matrix(class_name: str, tnorm: str, identifiers: List[str], class_matrix_path: str,
-                          forest_paths: Dict[str, str], dialect: Dialect) -> None:
-    global KEY_IDENTIFIER
-
-    content = list()
-    matrix = {identifier: list() for identifier in identifiers}
-
-    # Construct header
-    content.append([KEY_IDENTIFIER] + [identifier for identifier in identifiers])
-
-    # Construct matrix
-    for tree_path in forest_paths[tnorm]:
-        columns = get_columns(path=tree_path, columns=[0, class_name], have_header=True, dialect=dialect)
-        for identifier, membership in columns:
-            matrix[identifier].append(membership)
-
-    # Dump matrix
-    for tree_index, tree_path in enumerate(forest_paths[tnorm]):
-        content.append([os.path.dirname(tree_path)] + [matrix[identifier][tree_index] for identifier in identifiers])
-    dump_csv_content(path=class_matrix_path,
-                     content=content,
-                     dialect=dialect)
+    jobs = [{"tnorm": tnorm,
+             "paths": forest_paths[tnorm],
+             "identifiers": identifiers,
+             "classes": possible_classes,
+             "classes_matrices_paths": {class_name: classes_matrices_paths[class_name][tnorm]
+                                        for class_name in possible_classes},
+             "vector_format": vector_format,
+             "matrix_format": matrix_format,
+             "dialect": dialect} for tnorm in tnorms]
+
+    timings = {class_name: dict() for class_name in possible_classes}
+    with Pool(processes=workers) as pool:
+        for tnorm, tnorm_timings in pool.imap_unordered(_classes_matrices_job, jobs):
+            for class_name, timing in tnorm_timings.items():
+                timings[class_name][tnorm] = timing
+    return timings
+
+
+def _classes_matrices_job(job: Dict) -> Tuple[str, Dict[str, float]]:
+    """ Load then dump the class matrices of all the classes for the t-norm of `job`. Return the t-norm, and the time
+    spent to compute the class matrix of each class : the time spent to load all the class matrices is shared equally
+    between the classes.
+    """
+    start = time.perf_counter()
+    matrices = load_classes_memberships(paths=job["paths"],
+                                        identifiers=job["identifiers"],
+                                        classes=job["classes"],
+                                        vector_format=job["vector_format"],
+                                        dialect=job["dialect"])
+    load_time = (time.perf_counter() - start) / len(job["classes"])
+
+    timings = dict()
+    for class_name in job["classes"]:
+        start = time.perf_counter()
+        _dump_class_matrix(matrix=matrices.pop(class_name),
+                           identifiers=job["identifiers"],
+                           class_matrix_path=job["classes_matrices_paths"][class_name],
+                           trees_paths=job["paths"],
+                           dialect=job["dialect"],
+                           matrix_format=job["matrix_format"])
+        timings[class_name] = load_time + time.perf_counter() - start
+    return job["tnorm"], timings
+
+
+def _dump_class_matrix(matrix: np.ndarray, identifiers: List[str], class_matrix_path: str, trees_paths: List[str],
+                       dialect: Dialect, matrix_format: Format) -> None:
+    """ Dump a class matrix, with one row per tree and one column per instance. """
+    dump_class_matrix(path=class_matrix_path,
+                      matrix=ClassMatrix(trees=[os.path.dirname(tree_path) for tree_path in trees_paths],
+                                         instances=identifiers,
+                                         values=matrix),
+                      matrix_format=matrix_format,
+                      dialect=dialect)
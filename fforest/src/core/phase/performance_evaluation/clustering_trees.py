@@ -1,12 +1,27 @@
+""" This module will create a "clustering trees" directory, and regroup the trees of the forest into clusters for each
+class and for each triangular norm, with the help of their class matrix.
+A "clustering trees" file contains one row per tree, with the identifier of the tree, the identifier of its cluster and
+its quality : 1 for an High Quality Tree, 0 for a Low Quality Tree (see the `quality_threshold` parameter).
+"""
 import enum
-from typing import Dict, List, Union
+import time
+from multiprocessing import Pool
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 import fforest.src.getters.environment as env
+from fforest.src.core.phase.performance_evaluation.clustering_trees_method.agglomerative import agglomerative
 from fforest.src.core.phase.performance_evaluation.clustering_trees_method.clustering_trees_method import \
     ClusteringTreesMethod, UnknownClusteringTreesMethod
 from fforest.src.core.phase.performance_evaluation.clustering_trees_method.hypersphere import hypersphere
 from fforest.src.core.phase.performance_evaluation.clustering_trees_method.jason_forest import jason_forest
+from fforest.src.core.phase.performance_evaluation.jobs_timings import print_timings_summary
+from fforest.src.file_tools.csv_tools import dump_csv_content, iter_rows
+from fforest.src.file_tools.dialect import Dialect
+from fforest.src.getters.get_output_message import Message
 from fforest.src.vrac.file_system import create_dir
+from fforest.src.vrac.process import get_number_of_workers
 
 _KEY_ID_TREE = "ID_tree"
 _KEY_ID_CLUSTER = "ID_cluster"
@@ -20,10 +35,30 @@ class TreeQuality(enum.IntEnum):
 
 
 def clustering_trees() -> None:
+    """ Regroup the trees of the forest for each class and each t-norm, with a pool of `workers` processes. The time
+    spent to regroup the trees of each class and t-norm is stored into the `clustering_trees_timings` variable in the
+    `env` module.
+    """
     _create_directories(clustering_trees_directories=env.clustering_trees_directories_path,
                         possibles_classes=env.possible_classes)
 
-    clustering_trees = _compute_clustering_trees(clustering_method=env.clustering_trees_method)
+    jobs = list()
+    for class_name in env.possible_classes:
+        for tnorm in env.t_norms_names:
+            jobs.append({"class_name": class_name,
+                         "tnorm": tnorm,
+                         "clustering_method": env.clustering_trees_method,
+                         "class_matrix_path": env.classes_matrices_files_paths[class_name][tnorm],
+                         "quality_file_path": env.quality_files_paths[tnorm],
+                         "clustering_trees_path": env.clustering_trees_files_paths[class_name][tnorm],
+                         "quality_threshold": float(env.quality_threshold),
+                         "distance_measure": env.distance_measure,
+                         "clustering_threshold": float(env.clustering_threshold),
+                         "matrix_format": env.matrix_format,
+                         "dialect": env.dialect_output})
+
+    env.clustering_trees_timings = _compute_clustering_trees(jobs=jobs, workers=get_number_of_workers(env.workers))
+    print_timings_summary(message=Message.VERBOSE_CLUSTERING_TREES_TIMINGS, timings=env.clustering_trees_timings)
 
 
 def _create_directories(clustering_trees_directories: Dict[str, str], possibles_classes: List[str]) -> None:
@@ -32,80 +67,77 @@ def _create_directories(clustering_trees_directories: Dict[str, str], possibles_
         create_dir(clustering_trees_directories[class_name])
 
 
-def _compute_clustering_trees(clustering_method: ClusteringTreesMethod)\
-        -> Dict[str, Dict[str, List[Dict[str, Union[str, int]]]]]:
+def _compute_clustering_trees(jobs: List[Dict], workers: int) -> Dict[str, Dict[str, float]]:
+    """ Compute and dump the clustering trees described by `jobs` with a pool of `workers` processes. Return a
+    dictionary mapping each class and each t-norm to the time spent (in seconds) by its job.
+    """
+    timings = dict()
+    with Pool(processes=workers) as pool:
+        for class_name, tnorm, seconds in pool.imap_unordered(_clustering_trees_job, jobs):
+            timings.setdefault(class_name, dict())[tnorm] = seconds
+    return timings
+
+
+def _clustering_trees_job(job: Dict) -> Tuple[str, str, float]:
+    """ Regroup the trees for the class and the t-norm of `job`, then dump the result. Return the class, the t-norm and
+    the time spent by the job.
+    """
+    start = time.perf_counter()
+    trees, clusters = _cluster_trees(clustering_method=job["clustering_method"],
+                                     class_matrix_path=job["class_matrix_path"],
+                                     matrix_format=job["matrix_format"],
+                                     dialect=job["dialect"],
+                                     distance_measure=job["distance_measure"],
+                                     clustering_threshold=job["clustering_threshold"])
+    trees_quality = _load_trees_quality(quality_file_path=job["quality_file_path"], dialect=job["dialect"])
+    _dump_clustering_trees(clustering_trees_path=job["clustering_trees_path"],
+                           trees=trees,
+                           clusters=clusters.tolist(),
+                           trees_quality=trees_quality,
+                           quality_threshold=job["quality_threshold"],
+                           dialect=job["dialect"])
+    return job["class_name"], job["tnorm"], time.perf_counter() - start
+
+
+def _cluster_trees(clustering_method: ClusteringTreesMethod, clustering_threshold: float,
+                   **parameters) -> Tuple[List[str], np.ndarray]:
+    """ Regroup the trees with the method `clustering_method`. Return the identifiers of the trees and the identifier
+    of the cluster of each tree. The `clustering_threshold` is only used by the methods needing a threshold.
+    """
     if clustering_method == ClusteringTreesMethod.HYPERSPHERE:
-        return hypersphere()
+        return hypersphere(clustering_threshold=clustering_threshold, **parameters)
     elif clustering_method == ClusteringTreesMethod.JASON_FOREST:
-        return jason_forest()
+        return jason_forest(**parameters)
+    elif clustering_method == ClusteringTreesMethod.AGGLOMERATIVE:
+        return agglomerative(clustering_threshold=clustering_threshold, **parameters)
     else:
-        UnknownClusteringTreesMethod(clustering_method.value)
-
-
-
-result_example = {
-    "yes": {
-        "classic": [
-            {
-                "ID_tree": "bank/subtrain/01_subsubtrain",
-                "ID_cluster": 0,
-                "quality": 0
-            },
-            {
-                "ID_tree": "bank/subtrain/02_subsubtrain",
-                "ID_cluster": 1,
-                "quality": 0
-            },
-            {
-                "ID_tree": "bank/subtrain/03_subsubtrain",
-                "ID_cluster": 1,
-                "quality": 0
-            }
-        ],
-        "luka": [
-            {
-                "ID_tree": "bank/subtrain/01_subsubtrain",
-                "ID_cluster": 0,
-                "quality": 0
-            },
-            {
-                "ID_tree": "bank/subtrain/02_subsubtrain",
-                "ID_cluster": 1,
-                "quality": 0
-            },
-            {
-                "ID_tree": "bank/subtrain/03_subsubtrain",
-                "ID_cluster": 1,
-                "quality": 0
-            }
-        ],
-        "zadeh": [
-            {
-                "ID_tree": "bank/subtrain/01_subsubtrain",
-                "ID_cluster": 0,
-                "quality": 0
-            },
-            {
-                "ID_tree": "bank/subtrain/02_subsubtrain",
-                "ID_cluster": 1,
-                "quality": 0
-            },
-            {
-                "ID_tree": "bank/subtrain/03_subsubtrain",
-                "ID_cluster": 1,
-                "quality": 0
-            }
-        ],
-    },
-    "no": {
-        "classic": {
-
-        },
-        "luka": {
-
-        },
-        "zadeh": {
-
-        }
-    }
-}
\ No newline at end of file
+        raise UnknownClusteringTreesMethod(clustering_method.name.lower())
+
+
+def _load_trees_quality(quality_file_path: str, dialect: Dialect) -> Dict[str, float]:
+    """ Load the quality of each tree from a forest's quality vector. """
+    return {tree: float(quality) for tree, quality in iter_rows(path=quality_file_path, skip_header=False,
+                                                                dialect=dialect)}
+
+
+def _get_tree_quality(quality: float, quality_threshold: float) -> TreeQuality:
+    """ Return the quality of a tree. A tree with a quality strictly inferior than `quality_threshold` is a Low Quality
+    Tree, else it's an High Quality Tree.
+
+        Example :
+        >>> _get_tree_quality(0.4, 0.5), _get_tree_quality(0.5, 0.5)
+        (<TreeQuality.LOW_QUALITY_TREE: 0>, <TreeQuality.HIGH_QUALITY_TREE: 1>)
+    """
+    if quality < quality_threshold:
+        return TreeQuality.LOW_QUALITY_TREE
+    return TreeQuality.HIGH_QUALITY_TREE
+
+
+def _dump_clustering_trees(clustering_trees_path: str, trees: List[str], clusters: List[int],
+                           trees_quality: Dict[str, float], quality_threshold: float, dialect: Dialect) -> None:
+    """ Dump the identifier, the cluster and the quality of each tree for one class and one t-norm. """
+    content = [[_KEY_ID_TREE, _KEY_ID_CLUSTER, _KEY_QUALITY]]
+    for tree, cluster in zip(trees, clusters):
+        content.append([tree, cluster, _get_tree_quality(quality=trees_quality[tree],
+                                                         quality_threshold=quality_threshold).value])
+    dump_csv_content(path=clustering_trees_path, content=content, dialect=dialect)
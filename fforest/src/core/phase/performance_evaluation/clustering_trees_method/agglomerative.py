@@ -0,0 +1,72 @@
+""" This CTM regroups the trees with an agglomerative hierarchical clustering. The values of each instance are
+normalized with their z-score, then the two nearest clusters of trees are merged until the average distance between
+their trees exceeds the cut threshold. The cut threshold is the `clustering_threshold` parameter times the greatest
+distance between two trees, thus it doesn't depend on the scale of the distance measure.
+The distances are stored in a condensed distance array of n * (n - 1) / 2 values, which is the only quadratic structure
+kept in memory (copied once by `scipy.cluster.hierarchy.linkage`) : 10k trees need ~400 Mo of distances.
+"""
+from typing import List, Tuple
+
+import numpy as np
+import scipy as sp
+import scipy.cluster
+import scipy.cluster.hierarchy
+import scipy.spatial
+
+from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.format import Format
+from fforest.src.file_tools.matrix_tools import load_normalized_class_matrix
+from fforest.src.vrac.maths.distance_matrix import pairwise_distances
+from fforest.src.vrac.maths.distance_measure import DistanceMeasure
+
+_LINKAGE_METHOD = "average"
+
+
+def agglomerative(class_matrix_path: str, matrix_format: Format, dialect: Dialect, distance_measure: DistanceMeasure,
+                  clustering_threshold: float) -> Tuple[List[str], np.ndarray]:
+    """ Regroup the trees of the class matrix located at `class_matrix_path`. Return the identifiers of the trees and
+    the identifier of the cluster of each tree.
+    """
+    class_matrix = load_normalized_class_matrix(path=class_matrix_path, matrix_format=matrix_format, dialect=dialect)
+    distances_matrix = pairwise_distances(vectors=class_matrix.values, measure=distance_measure)
+    return class_matrix.trees, _agglomerative_clusters(distances_matrix=distances_matrix,
+                                                       number_of_trees=len(class_matrix.trees),
+                                                       clustering_threshold=clustering_threshold)
+
+
+def _agglomerative_clusters(distances_matrix: np.ndarray, number_of_trees: int,
+                            clustering_threshold: float) -> np.ndarray:
+    """ Merge the trees with an average linkage, and cut the dendrogram at `clustering_threshold` times the greatest
+    distance. The clusters are numbered from 0, in the order of their first tree.
+
+        Example :
+        >>> distances = sp.spatial.distance.pdist(np.array([[0.0], [1.0], [10.0], [12.0], [30.0]]))
+        >>> _agglomerative_clusters(distances, 5, 0.1)
+        array([0, 0, 1, 1, 2])
+        >>> _agglomerative_clusters(distances, 5, 1.0)
+        array([0, 0, 0, 0, 0])
+    """
+    if number_of_trees < 2:
+        return np.zeros(number_of_trees, dtype=np.intp)
+
+    cut_distance = clustering_threshold * distances_matrix.max()
+    dendrogram = sp.cluster.hierarchy.linkage(distances_matrix, method=_LINKAGE_METHOD)
+    clusters = sp.cluster.hierarchy.fcluster(dendrogram, t=cut_distance, criterion="distance")
+    return _renumber_clusters(clusters)
+
+
+def _renumber_clusters(clusters: np.ndarray) -> np.ndarray:
+    """ Renumber the identifiers of the clusters from 0, in the order of their first tree.
+
+        Example :
+        >>> _renumber_clusters(np.array([3, 3, 1, 2, 1]))
+        array([0, 0, 1, 2, 1])
+    """
+    _, first_trees, inverse = np.unique(clusters, return_index=True, return_inverse=True)
+    ranks = np.empty(len(first_trees), dtype=np.intp)
+    ranks[np.argsort(first_trees)] = np.arange(len(first_trees))
+    return ranks[inverse]
+
+
+if __name__ == "__main__":
+    pass
@@ -8,6 +8,7 @@ import enum
 class ClusteringTreesMethod(enum.IntEnum):
     HYPERSPHERE = 0
     JASON_FOREST = 1
+    AGGLOMERATIVE = 2
 
 
 class UnknownClusteringTreesMethod(Exception):
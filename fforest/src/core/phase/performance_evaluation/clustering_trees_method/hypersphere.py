@@ -1,9 +1,27 @@
-from typing import Callable
+""" This CTM regroups the trees into hyperspheres of the same radius. The values of each instance are normalized with
+their z-score, then the trees are browsed in order : a tree which is not in any sphere yet becomes the center of a new
+sphere, containing all the trees not regrouped yet at a distance inferior or equal to the radius.
+The radius is the `clustering_threshold` parameter times twice the greatest distance between a tree and the mean tree,
+which bounds the greatest distance between two trees without computing all the pairwise distances. The trees close to
+a center are found with batched queries, on a KD-tree (`scipy.spatial.cKDTree`) in low dimension or by blocks of
+distances to the trees not regrouped yet otherwise, thus no distance matrix is computed.
+"""
+from typing import Callable, List, Tuple
 
 import numpy as np
+import scipy as sp
+import scipy.spatial
 
+from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.format import Format
+from fforest.src.file_tools.matrix_tools import load_normalized_class_matrix
+from fforest.src.vrac.maths.distance_measure import DistanceMeasure, distancemeasure_to_metric, \
+    distancemeasure_to_minkowski_p
 from fforest.src.vrac.maths.maths import gamma
-from fforest.src.vrac.maths.norms import euclidean
+from fforest.src.vrac.maths.norms import euclidean, manhattan
+
+_NO_CLUSTER = -1
+_KD_TREE_MAX_DIMENSION = 16
 
 
 class HyperSphere:
@@ -41,11 +59,98 @@ class HyperSphere:
             >>> vector in sphere
             True
         """
-        return self.norm(np.array(item) - self.center) <= self.radius
+        return self.norm(np.asarray(item) - self.center) <= self.radius
 
+    def contains(self, vectors) -> np.ndarray:
+        """ Return for each row of the (n x dimension) matrix `vectors` if it is in the hypersphere. The distances are
+        computed at once for the euclidean and manhattan norms.
 
-def hypersphere():
-    pass
+            Example :
+            >>> sphere = HyperSphere(center=(1, 2), radius=1)
+            >>> sphere.contains([(0, 3), (0, 2), (1, 2)])
+            array([False,  True,  True])
+        """
+        differences = np.asarray(vectors, dtype=np.float64) - self.center
+        if self.norm is euclidean:
+            distances = np.linalg.norm(differences, axis=1)
+        elif self.norm is manhattan:
+            distances = np.abs(differences).sum(axis=1)
+        else:
+            distances = np.fromiter(map(self.norm, differences), dtype=np.float64, count=len(differences))
+        return distances <= self.radius
+
+
+def hypersphere(class_matrix_path: str, matrix_format: Format, dialect: Dialect, distance_measure: DistanceMeasure,
+                clustering_threshold: float) -> Tuple[List[str], np.ndarray]:
+    """ Regroup the trees of the class matrix located at `class_matrix_path` into hyperspheres. Return the identifiers
+    of the trees and the identifier of the cluster of each tree.
+    """
+    class_matrix = load_normalized_class_matrix(path=class_matrix_path, matrix_format=matrix_format, dialect=dialect)
+    return class_matrix.trees, _hypersphere_clusters(vectors=np.asarray(class_matrix.values),
+                                                     distance_measure=distance_measure,
+                                                     clustering_threshold=clustering_threshold)
+
+
+def _hypersphere_clusters(vectors: np.ndarray, distance_measure: DistanceMeasure, clustering_threshold: float,
+                          chunk_size: int = 256) -> np.ndarray:
+    """ Regroup the rows of `vectors` into hyperspheres of radius `clustering_threshold` times twice the greatest
+    distance between a row and the mean row. The trees not regrouped yet are queried by blocks of `chunk_size` rows,
+    then browsed in order to choose the centers. The clusters are numbered from 0, in the order of their first tree.
+
+        Example :
+        >>> vectors = np.array([[0.0], [1.0], [10.0], [12.0], [30.0]])
+        >>> _hypersphere_clusters(vectors, DistanceMeasure.EUCLIDEAN, 0.1, chunk_size=2)
+        array([0, 0, 1, 1, 2])
+        >>> _hypersphere_clusters(vectors, DistanceMeasure.MANHATTAN, 0.02)
+        array([0, 1, 2, 3, 4])
+        >>> _hypersphere_clusters(np.repeat(vectors, 20, axis=1), DistanceMeasure.EUCLIDEAN, 0.1, chunk_size=2)
+        array([0, 0, 1, 1, 2])
+    """
+    number_of_trees = len(vectors)
+    clusters = np.full(number_of_trees, _NO_CLUSTER, dtype=np.intp)
+    if number_of_trees == 0:
+        return clusters
+
+    p = distancemeasure_to_minkowski_p(distance_measure)
+    radius = clustering_threshold * 2 * sp.spatial.minkowski_distance(vectors, vectors.mean(axis=0), p=p).max()
+    query_neighbours = _neighbours_query(vectors=vectors, radius=radius, distance_measure=distance_measure)
+    number_of_clusters = 0
+    next_tree = 0
+    while next_tree < number_of_trees:
+        # Query at once the next trees which are not regrouped yet, as they are the only possible centers
+        candidates = np.flatnonzero(clusters[next_tree:] == _NO_CLUSTER)[:chunk_size] + next_tree
+        if len(candidates) == 0:
+            break
+        for center, center_neighbours in zip(candidates.tolist(), query_neighbours(candidates, clusters)):
+            if clusters[center] != _NO_CLUSTER:
+                continue
+            clusters[center_neighbours[clusters[center_neighbours] == _NO_CLUSTER]] = number_of_clusters
+            number_of_clusters += 1
+        next_tree = candidates[-1] + 1
+    return clusters
+
+
+def _neighbours_query(vectors: np.ndarray, radius: float, distance_measure: DistanceMeasure) -> Callable:
+    """ Return a function computing, for a block of rows of `vectors`, the rows not regrouped yet at a distance inferior
+    or equal to `radius`. A KD-tree only prunes the search in low dimension (see `_KD_TREE_MAX_DIMENSION`) ; in higher
+    dimension, the distances from the block to the rows not regrouped yet are computed at once.
+    """
+    number_of_trees, dimension = vectors.shape
+    if dimension <= _KD_TREE_MAX_DIMENSION or 2 ** dimension <= number_of_trees:
+        p = distancemeasure_to_minkowski_p(distance_measure)
+        kd_tree = sp.spatial.cKDTree(vectors)
+
+        def query(rows: np.ndarray, clusters: np.ndarray) -> List[np.ndarray]:
+            neighbours = kd_tree.query_ball_point(vectors[rows], r=radius, p=p, return_sorted=False)
+            return [np.asarray(row_neighbours, dtype=np.intp) for row_neighbours in neighbours]
+    else:
+        metric = distancemeasure_to_metric(distance_measure)
+
+        def query(rows: np.ndarray, clusters: np.ndarray) -> List[np.ndarray]:
+            not_regrouped = np.flatnonzero(clusters == _NO_CLUSTER)
+            distances = sp.spatial.distance.cdist(vectors[rows], vectors[not_regrouped], metric=metric)
+            return [not_regrouped[row_distances <= radius] for row_distances in distances]
+    return query
 
 
 if __name__ == "__main__":
@@ -1,87 +1,52 @@
-from typing import Dict, List, Union, Callable, Set
+""" This CTM regroups the trees giving similar % of membership to the instances of a class. The values of each instance
+are normalized with their z-score, then each tree is linked to its nearest tree. The clusters are the connected
+components of this nearest neighbour graph, thus this method doesn't need any threshold.
+"""
+from typing import List, Tuple
 
-from fforest.src.file_tools.csv_tools import get_header, iter_rows_dict
-from fforest.src.file_tools.dialect import Dialect
-import fforest.src.getters.environment as env
 import numpy as np
-from fforest.src.core.phase.performance_evaluation.classes_matrices import KEY_IDENTIFIER
-from collections import OrderedDict
-from fforest.src.vrac.maths.distance_measure import euclidean
-
-
-def jason_forest() -> Dict[str, Dict[str, List[Dict[str, Union[str, int]]]]]:
-    clustering_trees = dict()
-    for class_name in env.possible_classes:
-        for tnorm_name in env.t_norms_names:
-            # TODO: This segment of code can be parallellised
-            database = _data_normalization(input_path=env.classes_matrices_files_paths[class_name][tnorm_name],
-                                           dialect=env.dialect_output)
-            distances_matrix = _compute_distances_matrix(database=database,
-                                                         #TODO: Implement this parameter
-                                                         #distance_measure=env.distance_measure)
-                                                         distance_measure=euclidean)
-    return clustering_trees
-
+import scipy as sp
+import scipy.sparse
+import scipy.sparse.csgraph
+import scipy.spatial
 
-def _data_normalization(input_path: str, dialect: Dialect, useless_value: float = 0.0) -> Dict[str, Dict[str, float]]:
-    """ Retrieve a database from a file and normalize its data between the interval [-1, 1]. """
-    database = _load_database(file_path=input_path, dialect=dialect)
-    for attribute in _get_attributes(file_path=input_path, dialect=dialect):
-        mean = _compute_mean(database=database, attribute=attribute)
-        standard_deviation = _compute_standard_deviation(database=database, attribute=attribute)
-        if standard_deviation == 0.0:
-            # This attribute is useless because all the instances have the same values for it
-            for tree_name in database.keys():
-                database[tree_name][attribute] = useless_value
-        else:
-            for tree_name in database.keys():
-                database[tree_name][attribute] = (database[tree_name][attribute] - mean) / standard_deviation
-    return database
+from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.format import Format
+from fforest.src.file_tools.matrix_tools import load_normalized_class_matrix
+from fforest.src.vrac.maths.distance_matrix import pairwise_distances
+from fforest.src.vrac.maths.distance_measure import DistanceMeasure
 
 
-def _load_database(file_path: str, dialect: Dialect) -> Dict[str, Dict[str, float]]:
-    """ Load the database located at `file_path` then return a dictionary mapping a tree name with all the attributes,
-    and these attributes to the value given by the tree.
+def jason_forest(class_matrix_path: str, matrix_format: Format, dialect: Dialect,
+                 distance_measure: DistanceMeasure) -> Tuple[List[str], np.ndarray]:
+    """ Regroup the trees of the class matrix located at `class_matrix_path`. Return the identifiers of the trees and
+    the identifier of the cluster of each tree.
     """
-    database = dict()
-    for row in iter_rows_dict(path=file_path, dialect=dialect):
-        tree_name = row[KEY_IDENTIFIER]
-        del row[KEY_IDENTIFIER]
-        database[tree_name] = OrderedDict(row)
-    return database
-
-
-def _get_attributes(file_path: str, dialect: Dialect) -> List[str]:
-    """ Retrieve all the attributes from a CSV file. """
-    return get_header(path=file_path, dialect=dialect)[1:]
+    class_matrix = load_normalized_class_matrix(path=class_matrix_path, matrix_format=matrix_format, dialect=dialect)
+    distances_matrix = pairwise_distances(vectors=class_matrix.values, measure=distance_measure)
+    return class_matrix.trees, _nearest_neighbour_clusters(distances_matrix=distances_matrix,
+                                                           number_of_trees=len(class_matrix.trees))
 
 
-def _compute_mean(database: Dict[str, Dict[str, float]], attribute: str) -> float:
-    """ Compute the mean of all values given by the trees for one attribute """
-    return np.mean([database[tree_name][attribute] for tree_name in database.keys()])
+def _nearest_neighbour_clusters(distances_matrix: np.ndarray, number_of_trees: int) -> np.ndarray:
+    """ Link each tree to its nearest tree, and return the connected component of each tree in this graph. The clusters
+    are numbered from 0, in the order of their first tree.
 
-
-def _compute_standard_deviation(database: Dict[str, Dict[str, float]], attribute: str) -> float:
-    """ Compute the standard deviatio of all values given by the trees for one attribute """
-    return np.std([database[tree_name][attribute] for tree_name in database.keys()])
-
-
-def _compute_distances_matrix(database: Dict[str, Dict[str, float]], distance_measure: Callable)\
-        -> Dict[str, Dict[frozenset, float]]:
-    distances_matrix = {tree_name: dict() for tree_name in database.keys()}
-    for tree_name in database.keys():
-        # Compute the semi distance matrix for each tree
-        for i_attribute1, attribute1 in enumerate(database[tree_name].keys()):
-            for i_attribute2 in range(i_attribute1, len(database[tree_name].keys())):
-                attribute2 = list(database[tree_name].keys())[i_attribute2]
-                distances_matrix[tree_name][frozenset([attribute1, attribute2])] = \
-                    distance_measure(database[tree_name][attribute1], database[tree_name][attribute2])
-    return distances_matrix
-
-
-#TODO: Delete this when the algorithm is working
-def jason_forest():
-    pass
+        Example :
+        >>> distances = sp.spatial.distance.pdist(np.array([[0.0], [1.0], [10.0], [12.0], [30.0]]))
+        >>> _nearest_neighbour_clusters(distances, 5)
+        array([0, 0, 1, 1, 1], dtype=int32)
+    """
+    if number_of_trees < 2:
+        return np.zeros(number_of_trees, dtype=np.int32)
+
+    distances = sp.spatial.distance.squareform(distances_matrix)
+    np.fill_diagonal(distances, np.inf)
+    nearest_trees = np.argmin(distances, axis=1)
+    graph = sp.sparse.coo_matrix((np.ones(number_of_trees), (np.arange(number_of_trees), nearest_trees)),
+                                 shape=(number_of_trees, number_of_trees))
+    _, clusters = sp.sparse.csgraph.connected_components(graph, directed=True, connection="weak")
+    return clusters
 
 
 if __name__ == "__main__":
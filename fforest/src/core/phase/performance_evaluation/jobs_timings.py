@@ -0,0 +1,25 @@
+""" This module contains tools to summarize the time spent by the jobs of a performance evaluation phase, computed for
+each class and each t-norm.
+"""
+from typing import Dict
+
+from fforest.src.getters.get_output_message import Message, vprint
+
+
+def print_timings_summary(message: Message, timings: Dict[str, Dict[str, float]]) -> None:
+    """ Print the number of jobs, the total, mean and maximal time spent by the jobs with the message `message`.
+    `timings` map each class and each t-norm to the time spent (in seconds) by its job.
+    """
+    jobs = [(class_name, tnorm, seconds) for class_name in timings.keys() for tnorm, seconds in
+            timings[class_name].items()]
+    if not jobs:
+        return
+
+    slowest_class, slowest_tnorm, slowest_time = max(jobs, key=lambda job: job[-1])
+    total_time = sum(seconds for _, _, seconds in jobs)
+    vprint(message, jobs=len(jobs), total_time=total_time, mean_time=total_time / len(jobs),
+           slowest_class=slowest_class, slowest_tnorm=slowest_tnorm, slowest_time=slowest_time)
+
+
+if __name__ == "__main__":
+    pass
@@ -1,82 +1,69 @@
 """ This QCM sum all instances' score, then divide this sum by the number of instances to normalize the result.
 An instance's score is the product of its difficulty by the % of membership found by the fuzzy tree.
+The quality of all the trees of the forest is computed at once, as the product of the (trees x instances) matrix of
+the % of membership by the difficulty vector.
 """
 
-from typing import Dict, Union
+from typing import Dict, List, Tuple
+
+import numpy as np
 
 import fforest.src.getters.environment as env
-from fforest.src.core.phase.learning_process.forest_construction import KEY_ID, KEY_TRUECLASS, KEY_DIFFICULTY
-from fforest.src.file_tools.csv_tools import get_columns, iter_rows_dict
+from fforest.src.core.phase.learning_process.forest_construction import KEY_ID, KEY_DIFFICULTY
+from fforest.src.file_tools.csv_tools import get_columns
 from fforest.src.file_tools.dialect import Dialect
-
-KEY_MEMBERSHIP = "%membership"
+from fforest.src.file_tools.format import Format
+from fforest.src.file_tools.vector_tools import load_true_class_memberships
 
 
 def kappa_rifqi_marsala() -> Dict[str, Dict[str, float]]:
     forest_quality_all_tnorms = dict()
     for tnorm in env.t_norms_names:
-        instances = _load_instances_difficulty(difficulty_vector_path=env.difficulty_vectors_paths[tnorm],
-                                               dialect=env.dialect_output)
+        identifiers, difficulties = \
+            _load_instances_difficulty(difficulty_vector_path=env.difficulty_vectors_paths[tnorm],
+                                       dialect=env.dialect_output)
 
         forest_quality_all_tnorms[tnorm] = \
-            _get_forest_quality(instances=instances,
+            _get_forest_quality(identifiers=identifiers,
+                                difficulties=difficulties,
                                 subsubtrain_directories_path=env.subsubtrain_directories_path,
                                 salammbo_vector_paths=env.salammbo_vectors_paths[tnorm],
-                                dialect=env.dialect_output)
+                                dialect=env.dialect_output,
+                                vector_format=env.vector_format)
     return forest_quality_all_tnorms
 
 
-def _load_instances_difficulty(difficulty_vector_path: str, dialect: Dialect) -> Dict[str, Dict[str, float]]:
-    """ Get the instances' difficulty from their difficulty vector. """
-    instances = dict()
+def _load_instances_difficulty(difficulty_vector_path: str, dialect: Dialect) -> Tuple[List[str], np.ndarray]:
+    """ Get the instances' identifier and their difficulty from their difficulty vector. """
+    identifiers, difficulties = list(), list()
     for identifier, difficulty in get_columns(path=difficulty_vector_path,
                                               columns=[KEY_ID, KEY_DIFFICULTY],
                                               have_header=True,
                                               dialect=dialect):
-        instances[identifier] = dict()
-        instances[identifier][KEY_DIFFICULTY] = float(difficulty)
-    return instances
+        identifiers.append(identifier)
+        difficulties.append(float(difficulty))
+    return identifiers, np.array(difficulties, dtype=np.float64)
 
 
-def _get_forest_quality(instances: Dict[str, Dict[str, Union[str, float]]], subsubtrain_directories_path: str,
-                        salammbo_vector_paths: str, dialect: Dialect) -> Dict[str, float]:
+def _get_forest_quality(identifiers: List[str], difficulties: np.ndarray, subsubtrain_directories_path: List[str],
+                        salammbo_vector_paths: List[str], dialect: Dialect, vector_format: Format) -> Dict[str, float]:
     """ Compute the forest quality.
     Return a dictionary mapping each forest's path to their quality.
     """
-    forest_quality = dict()
-    for tree_index, tree_path in enumerate(subsubtrain_directories_path):
-        _load_instances_membership(salammbo_vector_path=salammbo_vector_paths[tree_index],
-                                   instances=instances,
-                                   dialect=dialect)
-        forest_quality[tree_path] = _get_tree_quality(instances=instances)
-    return forest_quality
-
-
-def _load_instances_membership(salammbo_vector_path: str, instances: Dict[str, Dict[str, float]],
-                               dialect: Dialect) -> None:
-    """ Get the instances' membership from their salammbo vector. """
-    global KEY_MEMBERSHIP
+    memberships = load_true_class_memberships(paths=salammbo_vector_paths, identifiers=identifiers,
+                                              vector_format=vector_format, dialect=dialect)
+    trees_quality = _get_trees_quality(memberships=memberships, difficulties=difficulties)
+    return dict(zip(subsubtrain_directories_path, trees_quality.tolist()))
 
-    for row in iter_rows_dict(path=salammbo_vector_path, dialect=dialect):
-        identifier, true_class = row[KEY_ID], row[KEY_TRUECLASS]
-        membership = row[true_class]
-        instances[identifier][KEY_MEMBERSHIP] = float(membership)
 
-
-def _get_tree_quality(instances: Dict[str, Dict[str, Union[str, float]]]) -> float:
-    """ Return the quality of a tree.
+def _get_trees_quality(memberships: np.ndarray, difficulties: np.ndarray) -> np.ndarray:
+    """ Return the quality of each tree.
     The quality of a tree, as defined by the Kappa-Rifqi-Marsala method, is the sum of the score of all instances
-    divided by the number of instances (to normalize the result).
-    """
-    global KEY_MEMBERSHIP
-
-    return sum(_get_instance_score(difficulty=instances[identifier][KEY_DIFFICULTY],
-                                   membership=instances[identifier][KEY_MEMBERSHIP]) for
-               identifier in instances.keys()) / len(instances)
-
+    divided by the number of instances (to normalize the result). An instance's score is the product of its difficulty
+    by the % of membership found by the tree.
 
-def _get_instance_score(difficulty: float, membership: float) -> float:
-    """ Return the score of an instance.
-    An instance's score is the product of its difficulty by the % of membership found by the tree.
+        Example :
+        >>> _get_trees_quality(np.array([[1.0, 0.5], [0.0, 0.25]]), np.array([0.5, 1.0]))
+        array([0.5  , 0.125])
     """
-    return difficulty * membership
+    return memberships @ difficulties / len(difficulties)
@@ -5,10 +5,12 @@ proper place in the `Phase` class (with a unique value), and add the entry point
 `_load_phases_entry_points` method.
 """
 import enum
+import importlib
 from typing import Callable, List
 
 import fforest.src.getters.environment as env
 from fforest.src.core.phase.ending.exit_code import EXIT_SUCCESS
+from fforest.src.getters.get_output_message import Message, vprint
 
 
 class UnknownPhase(Exception):
@@ -58,10 +60,55 @@ def call_all_phases(starting_phase: Phase, parsing_function: Callable) -> None:
     """ Call successively all phases requested by the user. """
     phases_entry_points = _load_phases_entry_points(parsing_function)
     for phase_index in range(starting_phase.value, len(phases_entry_points)):
-        phases_entry_points[phase_index]()
+        _call_phase(phase=Phase(phase_index), entry_point=phases_entry_points[phase_index])
         _increment_phase(last_phase=env.last_phase)
 
 
+def call_single_phase(phase: Phase, parsing_function: Callable) -> None:
+    """ Call only the phase `phase`, with the environment file computed by the previous phases, then end the process.
+    The parameters explicitly given in the command-line override the ones of the environment file (see the
+    `prepare_single_phase` method of the `preparsing` module).
+    """
+    from fforest.src.core.phase.preprocessing.preparsing import prepare_single_phase
+
+    prepare_single_phase(phase=phase, parsing_function=parsing_function)
+    _call_phase(phase=phase, entry_point=_load_phases_entry_points(parsing_function)[phase.value])
+
+    # The following phase can now be computed
+    env.last_phase = max(env.last_phase, phase)
+    _exit_if_last_phase(current_phase=phase, last_phase=phase)
+
+
+def call_sweep(parsing_function: Callable) -> None:
+    """ Call the splitting phases once, then learn and evaluate one forest for each configuration of the sweep (see the
+    `sweep` module), and end the process.
+    """
+    from fforest.src.core.phase.sweep import sweep_forests
+
+    phases_entry_points = _load_phases_entry_points(parsing_function)
+    for phase_index in range(Phase.PARSING.value, Phase.LEARNING.value):
+        _call_phase(phase=Phase(phase_index), entry_point=phases_entry_points[phase_index])
+
+    sweep_forests(evaluation_entry_points=phases_entry_points[Phase.REDUCTION.value:Phase.ENDING.value])
+    env.current_phase = Phase.ENDING
+    phases_entry_points[Phase.ENDING.value]()
+
+
+def _call_phase(phase: Phase, entry_point: Callable) -> None:
+    """ Call the entry point of `phase`, unless its outputs are up to date with its inputs. Then record its checkpoint
+    inside the `env` module.
+    """
+    from fforest.src.core.phase.checkpoint import inputs_hash, phase_up_to_date, record_checkpoint, restore_checkpoint
+
+    phase_inputs_hash = inputs_hash(phase)
+    if phase_up_to_date(phase, phase_inputs_hash):
+        restore_checkpoint(phase)
+        vprint(Message.PHASE_UP_TO_DATE, phase=phase_to_str(phase))
+        return
+    entry_point()
+    record_checkpoint(phase, phase_inputs_hash)
+
+
 def _increment_phase(last_phase: Phase) -> None:
     """ Check if the `current_phase` variable from the `environment` module is the last phase asked by the user. If
     that's the case, exit the process. Otherwise, change its value to the next phase. This method must be called right
@@ -95,19 +142,24 @@ def _exit_if_last_phase(current_phase: Phase, last_phase: Phase) -> None:
 def _load_phases_entry_points(parsing_function: Callable) -> List[Callable]:
     """ Return a list containing one entry point for each phase in the exact same order of the phases' values. The
     parsing function depends of the initial entry point used to start the software, thus it should be passed as an
-    argument. The other phases are loaded locally into the method to prevent cyclic dependencies between the `phase`
-    module and the loaded modules.
+    argument. The other phases are imported only when they are called, to prevent cyclic dependencies between the
+    `phase` module and the loaded modules, and to parse the arguments without importing NumPy and SciPy.
     """
-    from fforest.src.core.phase.preprocessing.preprocessing import preprocessing
-    from fforest.src.core.phase.initialization.initial_split import initial_split
-    from fforest.src.core.phase.initialization.reference_split import reference_split
-    from fforest.src.core.phase.learning_process.subsubtrain_split import subsubtrain_split
-    from fforest.src.core.phase.learning_process.forest_construction import forest_construction
-    from fforest.src.core.phase.learning_process.forest_reduction import forest_reduction
-    from fforest.src.core.phase.performance_evaluation.forest_quality import forest_quality
-    from fforest.src.core.phase.performance_evaluation.classes_matrices import classes_matrices
-    from fforest.src.core.phase.performance_evaluation.clustering_trees import clustering_trees
-    from fforest.src.core.phase.ending.ending import ending
-
-    return [parsing_function, preprocessing, initial_split, reference_split, subsubtrain_split, forest_construction,
-            forest_reduction, forest_quality, classes_matrices, clustering_trees, ending]
+    return [parsing_function,
+            _lazy_entry_point("fforest.src.core.phase.preprocessing.preprocessing", "preprocessing"),
+            _lazy_entry_point("fforest.src.core.phase.initialization.initial_split", "initial_split"),
+            _lazy_entry_point("fforest.src.core.phase.initialization.reference_split", "reference_split"),
+            _lazy_entry_point("fforest.src.core.phase.learning_process.subsubtrain_split", "subsubtrain_split"),
+            _lazy_entry_point("fforest.src.core.phase.learning_process.forest_construction", "forest_construction"),
+            _lazy_entry_point("fforest.src.core.phase.learning_process.forest_reduction", "forest_reduction"),
+            _lazy_entry_point("fforest.src.core.phase.performance_evaluation.forest_quality", "forest_quality"),
+            _lazy_entry_point("fforest.src.core.phase.performance_evaluation.classes_matrices", "classes_matrices"),
+            _lazy_entry_point("fforest.src.core.phase.performance_evaluation.clustering_trees", "clustering_trees"),
+            _lazy_entry_point("fforest.src.core.phase.ending.ending", "ending")]
+
+
+def _lazy_entry_point(module_name: str, function_name: str) -> Callable:
+    """ Return a function importing the module `module_name` then calling its function `function_name`. """
+    def entry_point() -> None:
+        getattr(importlib.import_module(module_name), function_name)()
+    return entry_point
@@ -4,6 +4,7 @@ requiring an index or a column name has been completed with a name, it change it
 checks if some of the parameters are invalids and raises exceptions accordingly.
 """
 import sys
+from typing import Dict, Iterable, List, Optional
 
 import fforest.src.getters.get_default_value as gdv
 import fforest.src.getters.get_parameter_name as gpn
@@ -13,14 +14,16 @@ from fforest.src.core.phase.performance_evaluation.clustering_trees_method.clust
 from fforest.src.core.phase.performance_evaluation.quality_computing_method.quality_computing_method import \
     str_to_qualitycomputingmethod
 from fforest.src.core.phase.phase import str_to_phase
-from fforest.src.core.splitting_methods.split import str_to_splittingmethod, SplittingMethod
+from fforest.src.core.splitting_methods.split import str_to_splittingmethod, splittingmethod_to_str, \
+    SplittingMethod, UnsupportedSplittingMethod
 from fforest.src.file_tools.csv_tools import find_index_with_class, index_in_bounds, \
     get_number_of_columns
 from fforest.src.file_tools.csv_tools import str_to_quoting
 from fforest.src.file_tools.dialect import Dialect
-from fforest.src.file_tools.format import str_to_format
+from fforest.src.file_tools.format import str_to_format, Format
 from fforest.src.getters.get_output_message import str_to_verbosity
 from fforest.src.vrac.file_system import get_filename, get_absolute_path
+from fforest.src.vrac.maths.distance_measure import str_to_distancemeasure
 from fforest.src.vrac.maths.maths import is_a_percentage, is_an_int
 
 
@@ -34,6 +37,11 @@ class InvalidPercentage(Exception):
         Exception.__init__(self, "The value \"{percentage}\" is not a percentage.".format(percentage=percentage))
 
 
+class InvalidWorkersNumber(Exception):
+    def __init__(self, workers: int):
+        Exception.__init__(self, "The number of workers \"{workers}\" can't be negative.".format(workers=workers))
+
+
 class IndexOutOfBounds(Exception):
     def __init__(self, index: int, length: int, column: str):
         Exception.__init__(self, "The {column} index \"{index}\" can't be used in a "
@@ -45,16 +53,23 @@ class InvalidParameter(Exception):
         Exception.__init__(self, "The \"{param}\" parameter doesn't exists.".format(param=invalid_parameter_name))
 
 
+class InvalidSweepValue(Exception):
+    def __init__(self, param_name: str, value: str, expected: str = "an integer"):
+        Exception.__init__(self, "The value \"{value}\" of the \"{param}\" parameter is not "
+                                 "{expected}.".format(value=value, param=param_name, expected=expected))
+
+
 class IllegalLineDelimiter(Exception):
     def __init__(self, delimiter: str):
         Exception.__init__(self, "The \"{param}\" parameter can't be used as a newline value.".format(param=delimiter))
 
 
-def clean_args(args: dict) -> None:
+def clean_args(args: dict, parameters_names: Optional[Iterable[str]] = None) -> None:
     """ Clean the command-line arguments parsed by the `docopt` package.
     It mainly convert string values to their numeric and enum counterpart. If a parameter requiring an index or a column
     name has been completed with a name, it change it to its corresponding index. It also checks if some of the
-    parameters are invalids and raises exceptions accordingly.
+    parameters are invalids and raises exceptions accordingly. If `parameters_names` is given, only these parameters
+    are cleaned.
     """
     # Rename parameter database
     args[gpn.database()] = args["<" + gpn.database() + ">"]
@@ -69,7 +84,7 @@ def clean_args(args: dict) -> None:
 
     extension = args[gpn.format_output()].lower()
 
-    for param_name in args.keys():
+    for param_name in (args.keys() if parameters_names is None else parameters_names):
         if param_name == gpn.parent_dir():
             if not args[param_name]:
                 args[param_name] = get_absolute_path(".")
@@ -78,15 +93,38 @@ def clean_args(args: dict) -> None:
         if param_name == gpn.class_name():
             _check_key_exists(args, param_name, custom_exception=MissingClassificationAttribute)
             _clean_column_index_or_name(args=args, param_name=param_name, column_name="class")
-        elif param_name in (gpn.discretization_threshold(), gpn.number_of_tnorms(), gpn.trees_in_forest()):
+        elif param_name in (gpn.discretization_threshold(), gpn.number_of_tnorms(), gpn.trees_in_forest(),
+                            gpn.workers(), gpn.cache_size(), gpn.seed()):
             args[param_name] = int(args[param_name])
+            if param_name == gpn.workers() and args[param_name] < 0:
+                raise InvalidWorkersNumber(args[param_name])
+        elif param_name == gpn.cache_directory():
+            if args[param_name] is not None:
+                args[param_name] = get_absolute_path(args[param_name])
         elif param_name in (gpn.format_input(), gpn.format_output()):
             args[param_name] = str_to_format(args[param_name])
+        elif param_name == gpn.vector_format():
+            args[param_name] = str_to_format(args[param_name])
+            if args[param_name] not in (Format.CSV, Format.NUMPY):
+                # Imported locally, as the `vector_tools` module imports NumPy
+                from fforest.src.file_tools.vector_tools import UnsupportedVectorFormat
+                raise UnsupportedVectorFormat(args[param_name].name.lower())
+        elif param_name == gpn.matrix_format():
+            args[param_name] = str_to_format(args[param_name])
+            if args[param_name] not in (Format.CSV, Format.NUMPY):
+                # Imported locally, as the `matrix_tools` module imports NumPy
+                from fforest.src.file_tools.matrix_tools import UnsupportedMatrixFormat
+                raise UnsupportedMatrixFormat(args[param_name].name.lower())
         elif param_name == gpn.entropy_measure():
             args[param_name] = str_to_entropymeasure(args[param_name])
-        elif param_name in (gpn.entropy_threshold(), gpn.quality_threshold()):
+        elif param_name in (gpn.entropy_threshold(), gpn.quality_threshold(), gpn.clustering_threshold()):
             if not is_a_percentage(args[param_name]):
                 raise InvalidPercentage(args[param_name])
+        elif param_name == gpn.sampling_fraction():
+            # An empty sample can't be learned
+            if not is_a_percentage(args[param_name]) or float(args[param_name]) == 0.0:
+                raise InvalidPercentage(args[param_name])
+            args[param_name] = float(args[param_name])
         elif param_name == gpn.identifier():
             if _check_default_value_id(args[param_name], gdv.identifier()):
                 # We must add a column as an identifier. It will be done in the preprocessing function
@@ -95,12 +133,17 @@ def clean_args(args: dict) -> None:
                 _clean_column_index_or_name(args=args, param_name=param_name, column_name="identifier")
         elif param_name in (gpn.initial_split_method(), gpn.reference_split_method(), gpn.subsubtrain_split_method()):
             args[param_name] = str_to_splittingmethod(args[param_name])
-            if args[param_name] == SplittingMethod.KEEP_DISTRIBUTION and args[gpn.class_name()] is None:
+            if args[param_name] == SplittingMethod.BOOTSTRAP and param_name != gpn.subsubtrain_split_method():
+                raise UnsupportedSplittingMethod(splittingmethod_to_str(args[param_name]), param_name)
+            if args[param_name] in (SplittingMethod.KEEP_DISTRIBUTION, SplittingMethod.ROUND_ROBIN) and \
+                    args[gpn.class_name()] is None:
                 raise MissingClassificationAttribute()
         elif param_name == gpn.quality_computing_method():
             args[param_name] = str_to_qualitycomputingmethod(args[param_name])
         elif param_name == gpn.clustering_trees_method():
             args[param_name] = str_to_clusteringtreesmethod(args[param_name])
+        elif param_name == gpn.distance_measure():
+            args[param_name] = str_to_distancemeasure(args[param_name])
         elif param_name == gpn.quoting_output():
             args[param_name] = str_to_quoting(args[param_name])
         elif param_name == gpn.main_directory():
@@ -130,6 +173,41 @@ def clean_args(args: dict) -> None:
             args[param_name] = str_to_clusteringtreesmethod(args[param_name])
 
 
+def clean_sweep_grids(args: dict) -> Dict[str, List]:
+    """ Split the comma-separated values of the parameters swept by the sweep entry point, then check and convert each
+    value like `clean_args` does. Return the values of each swept parameter. The parameters are then replaced by their
+    first value, so that `clean_args` can be called afterwards.
+
+        Example :
+        >>> args = {gpn.discretization_threshold(): "2,3", gpn.entropy_threshold(): "0.0", gpn.min_size_leaf(): "0,5"}
+        >>> clean_sweep_grids(args) == {gpn.discretization_threshold(): [2, 3], gpn.entropy_threshold(): ["0.0"],
+        ...                             gpn.min_size_leaf(): ["0", "5"]}
+        True
+        >>> args[gpn.discretization_threshold()], args[gpn.min_size_leaf()]
+        ('2', '0')
+        >>> clean_sweep_grids({gpn.discretization_threshold(): "2", gpn.entropy_threshold(): "0.0",
+        ...                    gpn.min_size_leaf(): "0.1,5"})[gpn.min_size_leaf()]
+        ['0.1', '5']
+    """
+    grids = dict()
+    for param_name in (gpn.discretization_threshold(), gpn.entropy_threshold(), gpn.min_size_leaf()):
+        values = [value.strip() for value in str(args[param_name]).split(",")]
+        for value in values:
+            if param_name == gpn.entropy_threshold() and not is_a_percentage(value):
+                raise InvalidPercentage(value)
+            elif param_name == gpn.discretization_threshold() and not is_an_int(value):
+                raise InvalidSweepValue(param_name, value)
+            elif param_name == gpn.min_size_leaf() and not (is_a_percentage(value) or is_an_int(value)):
+                # A value between 0 and 1 is a fraction of the training set, like without any sweep
+                raise InvalidSweepValue(param_name, value, expected="an integer or a percentage")
+        if param_name == gpn.discretization_threshold():
+            grids[param_name] = [int(value) for value in values]
+        else:
+            grids[param_name] = values
+        args[param_name] = values[0]
+    return grids
+
+
 def _check_key_exists(d: dict, key: object, custom_exception=None) -> None:
     """ Check if a key exists inside a dictionary. Otherwise, raise KeyError or a custom exception. """
     try:
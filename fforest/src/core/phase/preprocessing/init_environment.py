@@ -1,10 +1,14 @@
 """ Initialize the variables contained in the `environment` module. """
+import itertools
+from typing import Dict, List
+
 from fforest.src.core.phase.learning_process.triangular_norms import tnorm_to_str
 from fforest.src.core.phase.phase import Phase
 from fforest.src.file_tools.csv_tools import get_column
 from fforest.src.file_tools.dialect import Dialect
 from fforest.src.file_tools.format import format_to_str
 from fforest.src.getters import environment as env, get_parameter_name as gpn
+from fforest.src.getters.get_output_message import Message, vprint
 from fforest.src.vrac.file_system import get_filename
 
 
@@ -24,12 +28,104 @@ def init_environment(args: dict) -> None:
     _init_names(args)
 
 
+def init_sweep_configurations(grids: Dict[str, List]) -> None:
+    """ Initialize the `sweep_configurations` variable of the `env` module with one configuration for each combination
+    of the values of `grids`. A configuration maps each swept variable of the `env` module to one of its values.
+
+        Example :
+        >>> init_sweep_configurations({gpn.discretization_threshold(): [2, 3], gpn.min_size_leaf(): ["0"]})
+        >>> [(c["discretization_threshold"], c["minimal_size_leaf"]) for c in env.sweep_configurations]
+        [(2, '0'), (3, '0')]
+    """
+    swept_parameters = _swept_parameters()
+    variables_names = [swept_parameters[parameter_name] for parameter_name in grids.keys()]
+    env.sweep_configurations = [dict(zip(variables_names, values)) for values in itertools.product(*grids.values())]
+
+
+def _swept_parameters() -> Dict[str, str]:
+    """ Return the names of the parameters which can be swept, mapped to their variable in the `env` module. """
+    return {gpn.discretization_threshold(): "discretization_threshold",
+            gpn.entropy_threshold(): "entropy_threshold",
+            gpn.min_size_leaf(): "minimal_size_leaf"}
+
+
+def override_environment(args: dict, argv: List[str]) -> None:
+    """ Override the variables of the `env` module, loaded from an environment file, with the parameters explicitly
+    given in the command-line `argv`. Only the parameters which don't change any path can be overridden, the other ones
+    keep the value of the environment file (see the `warn_not_overridden` method).
+    """
+    for parameter_names, variable_name in _overridable_parameters().items():
+        if any(_given_in_command_line(name, argv) for name in parameter_names.split()):
+            setattr(env, variable_name, args.get(parameter_names.split()[-1]))
+
+
+def warn_not_overridden(args: dict, argv: List[str]) -> None:
+    """ Warn the user about each parameter explicitly given in the command-line `argv` which can't be overridden, and
+    whose value is not the one stored in the `command_line_arguments` variable of the `env` module. `args` are the
+    arguments parsed by the `docopt` package, before being cleaned.
+    """
+    overridable_names = {name for parameter_names in _overridable_parameters() for name in parameter_names.split()}
+    stored_arguments = env.command_line_arguments or dict()
+    for argument in argv:
+        name = argument.split("=")[0]
+        if name.startswith("-") and name not in overridable_names and \
+                (name not in stored_arguments or stored_arguments[name] != args.get(name)):
+            vprint(Message.PARAMETER_NOT_OVERRIDABLE, parameter=name)
+
+
+def overridden_parameters(argv: List[str]) -> List[str]:
+    """ Return the names, as parsed by the `docopt` package, of the overridable parameters given in the command-line
+    `argv`.
+    """
+    return [parameter_names.split()[-1] for parameter_names in _overridable_parameters()
+            if any(_given_in_command_line(name, argv) for name in parameter_names.split())]
+
+
+def _overridable_parameters() -> Dict[str, str]:
+    """ Return the names of the parameters which can be overridden, mapped to their variable in the `env` module. """
+    return {gpn.cache_directory(): "cache_directory",
+            gpn.cache_size(): "cache_size",
+            gpn.clustering_threshold(): "clustering_threshold",
+            gpn.clustering_trees_method(): "clustering_trees_method",
+            gpn.discretization_threshold(): "discretization_threshold",
+            gpn.distance_measure(): "distance_measure",
+            gpn.entropy_measure(): "entropy_measure",
+            gpn.entropy_threshold(): "entropy_threshold",
+            gpn.initial_split_method(): "initial_split_method",
+            gpn.min_size_leaf(): "minimal_size_leaf",
+            gpn.quality_computing_method(): "quality_computing_method",
+            gpn.quality_threshold(): "quality_threshold",
+            gpn.reference_split_method(): "reference_split_method",
+            gpn.reference_value(): "reference_value",
+            gpn.sampling_fraction(): "sampling_fraction",
+            gpn.seed(): "seed",
+            gpn.subsubtrain_split_method(): "subsubtrain_split_method",
+            gpn.training_value(): "training_value",
+            gpn.verbosity(): "verbosity",
+            gpn.workers(): "workers"}
+
+
+def _given_in_command_line(parameter_name: str, argv: List[str]) -> bool:
+    """ Check if the parameter `parameter_name` is explicitly given in the command-line `argv`.
+
+        Example :
+        >>> _given_in_command_line("--workers", ["db.csv", "--workers=2"])
+        True
+        >>> _given_in_command_line("--workers", ["db.csv", "--workers-count", "2"])
+        False
+    """
+    return any(argument == parameter_name or argument.startswith(parameter_name + "=") for argument in argv)
+
+
 def _init_command_line_parameters(args: dict) -> None:
     """ Initialize all the command-line-parameters-related variables located inside the `env` module. """
+    env.cache_directory = args.get(gpn.cache_directory().split()[-1])
+    env.cache_size = args.get(gpn.cache_size().split()[-1])
     env.cclassified_vector_prefix = args.get(gpn.cclassified_vector_prefix().split()[-1])
     env.class_name = args.get(gpn.class_name().split()[-1])
     env.class_matrix_prefix = args.get(gpn.class_matrix_prefix().split()[-1])
     env.classes_matrices_directory = args.get(gpn.classes_matrices_directory().split()[-1])
+    env.clustering_threshold = args.get(gpn.clustering_threshold().split()[-1])
     env.clustering_trees_directory = args.get(gpn.clustering_trees_directory().split()[-1])
     env.clustering_trees_method = args.get(gpn.clustering_trees_method().split()[-1])
     env.clustering_trees_prefix = args.get(gpn.clustering_trees_prefix().split()[-1])
@@ -37,10 +133,12 @@ def _init_command_line_parameters(args: dict) -> None:
     env.delimiter_output = args.get(gpn.delimiter_output().split()[-1])
     env.difficulty_vector_prefix = args.get(gpn.difficulty_vector_prefix().split()[-1])
     env.discretization_threshold = args.get(gpn.discretization_threshold().split()[-1])
+    env.distance_measure = args.get(gpn.distance_measure().split()[-1])
     env.encoding_input = args.get(gpn.encoding_input().split()[-1])
     env.encoding_output = args.get(gpn.encoding_output().split()[-1])
     env.entropy_measure = args.get(gpn.entropy_measure().split()[-1])
     env.entropy_threshold = args.get(gpn.entropy_threshold().split()[-1])
+    env.fifo = args.get(gpn.fifo().split()[-1])
     env.format_input = args.get(gpn.format_input().split()[-1])
     env.format_output = args.get(gpn.format_output().split()[-1])
     env.have_header = args.get(gpn.have_header().split()[-1])
@@ -53,6 +151,7 @@ def _init_command_line_parameters(args: dict) -> None:
     env.line_delimiter_input = args.get(gpn.line_delimiter_input().split()[-1])
     env.line_delimiter_output = args.get(gpn.line_delimiter_output().split()[-1])
     env.main_directory = args.get(gpn.main_directory().split()[-1])
+    env.matrix_format = args.get(gpn.matrix_format().split()[-1])
     env.minimal_size_leaf = args.get(gpn.min_size_leaf().split()[-1])
     env.parent_dir = args.get(gpn.parent_dir())
     env.preprocessed_database_name = args.get(gpn.preprocessed_database_name().split()[-1])
@@ -68,6 +167,8 @@ def _init_command_line_parameters(args: dict) -> None:
     env.reference_split_method = args.get(gpn.reference_split_method().split()[-1])
     env.reference_value = args.get(gpn.reference_value().split()[-1])
     env.resume_phase = args.get(gpn.resume_phase().split()[-1])
+    env.sampling_fraction = args.get(gpn.sampling_fraction().split()[-1])
+    env.seed = args.get(gpn.seed().split()[-1])
     env.statistics_file_name = args.get(gpn.statistics_file_name().split()[-1])
     env.subsubtrain_directory = args.get(gpn.subsubtrain_directory().split()[-1])
     env.subsubtrain_directory_pattern = args.get(gpn.subsubtrain_directory_pattern().split()[-1])
@@ -75,6 +176,7 @@ def _init_command_line_parameters(args: dict) -> None:
     env.subsubtrain_split_method = args.get(gpn.subsubtrain_split_method().split()[-1])
     env.subtrain_directory = args.get(gpn.subtrain_directory().split()[-1])
     env.subtrain_name = args.get(gpn.subtrain_name().split()[-1])
+    env.sweep_directory = args.get(gpn.sweep_directory().split()[-1])
     env.t_norms = args.get(gpn.number_of_tnorms().split()[-1])
     env.test_database_name = args.get(gpn.test_name().split()[-1])
     env.train_database_name = args.get(gpn.train_name().split()[-1])
@@ -83,7 +185,9 @@ def _init_command_line_parameters(args: dict) -> None:
     env.trees_in_forest = args.get(gpn.trees_in_forest().split()[-1])
     env.true_class_directory = args.get(gpn.true_class_directory().split()[-1])
     env.vector_file_extension = args.get(gpn.vector_file_extension().split()[-1])
+    env.vector_format = args.get(gpn.vector_format().split()[-1])
     env.verbosity = args.get(gpn.verbosity().split()[-1])
+    env.workers = args.get(gpn.workers().split()[-1])
 
 
 def _init_miscellaneous(args: dict) -> None:
@@ -137,9 +241,17 @@ def _init_dir_paths(args: dict) -> None:
                                                                             class_name) for
                                                  class_name in env.possible_classes}
 
+    if env.sweep_directory:
+        env.sweep_directory_path = "{}/{}".format(env.subtrain_directory_path, env.sweep_directory)
+
 
 def _init_paths(args: dict) -> None:
     """ Initialize all the path-related variables inside the `env` module. """
+    # Imported locally, as the `matrix_tools`, `row_indexes` and `vector_tools` modules import NumPy
+    from fforest.src.file_tools.matrix_tools import matrix_extension
+    from fforest.src.file_tools.row_indexes import INDEXES_EXTENSION
+    from fforest.src.file_tools.vector_tools import vector_extension
+
     env.statistics_file_path = "{}/{}".format(env.main_directory_path, env.statistics_file_name)
     env.original_database_path = args.get(gpn.database())
     env.preprocessed_database_path = "{}/{}".format(env.main_directory_path, args.get(gpn.preprocessed_database_name()))
@@ -148,23 +260,30 @@ def _init_paths(args: dict) -> None:
     env.train_database_path = "{}/{}".format(env.main_directory_path, args.get(gpn.train_name()))
     env.reference_database_path = "{}/{}".format(env.subtrain_directory_path, args.get(gpn.reference_name()))
     env.subtrain_database_path = "{}/{}".format(env.subtrain_directory_path, args.get(gpn.subtrain_name()))
+    env.subtrain_offsets_path = "{}.{}".format(env.subtrain_database_path, INDEXES_EXTENSION)
     if env.trees_in_forest:
         env.subsubtrain_databases_paths = ["{}/{}.{}".format(env.subsubtrain_directories_path[tree_index],
                                                              env.subsubtrain_directory_pattern %
                                                              str(tree_index + 1).zfill(len(str(env.trees_in_forest))),
                                                              format_to_str(args.get(gpn.format_output())).lower()) for
                                            tree_index in range(env.trees_in_forest)]
+        env.subsubtrain_indexes_paths = ["{}/{}.{}".format(env.subsubtrain_directories_path[tree_index],
+                                                           env.subsubtrain_directory_pattern %
+                                                           str(tree_index + 1).zfill(len(str(env.trees_in_forest))),
+                                                           INDEXES_EXTENSION) for
+                                         tree_index in range(env.trees_in_forest)]
+        vectors_extension = vector_extension(env.vector_format, env.vector_file_extension)
         env.cclassified_vectors_paths = {tnorm: ["{}/{}{}.{}".format(env.subsubtrain_directories_path[tree_index - 1],
                                                                      env.cclassified_vector_prefix,
                                                                      tnorm,
-                                                                     env.vector_file_extension) for
+                                                                     vectors_extension) for
                                                  tree_index in range(1, env.trees_in_forest + 1)] for
                                          tnorm in [tnorm_to_str(tnorm_index) for tnorm_index in range(env.t_norms + 1)]}
 
         env.salammbo_vectors_paths = {tnorm: ["{}/{}{}.{}".format(env.subsubtrain_directories_path[tree_index - 1],
                                                                   env.salammbo_vector_prefix,
                                                                   tnorm,
-                                                                  env.vector_file_extension) for
+                                                                  vectors_extension) for
                                               tree_index in range(1, env.trees_in_forest + 1)] for
                                       tnorm in [tnorm_to_str(tnorm_index) for tnorm_index in range(env.t_norms + 1)]}
     if env.t_norms:
@@ -178,12 +297,13 @@ def _init_paths(args: dict) -> None:
                                                               tnorm,
                                                               format_to_str(args.get(gpn.format_output()))) for
                                    tnorm in [tnorm_to_str(tnorm_index) for tnorm_index in range(env.t_norms + 1)]}
+        matrices_extension = matrix_extension(env.matrix_format, format_to_str(args.get(gpn.format_output())))
         env.classes_matrices_files_paths = {class_name: {tnorm: "{}/{}{}_{}.{}".format(
             env.classes_matrices_directories_path[class_name],
             env.class_matrix_prefix,
             class_name,
             tnorm,
-            format_to_str(args.get(gpn.format_output()))) for
+            matrices_extension) for
             tnorm in [tnorm_to_str(tnorm_index) for tnorm_index in range(env.t_norms + 1)]}
             for class_name in env.possible_classes}
         env.clustering_trees_files_paths = {class_name: {tnorm: "{}/{}{}_{}.{}".format(
@@ -1,18 +1,27 @@
 """ This module is used to retrieve the first phase asked by the user. It should be called with the
 `compute_first_phase` method first. It shouldn't be used anywhere in the software but before any form of parsing
-has been made. It also shouldn't be needed by any entry point but the `main_entry_point`.
+has been made. It also shouldn't be needed by any entry point but the `main_entry_point`, and the entry points of the
+phases through the `prepare_single_phase` method.
 """
 import os
 import sys
+from typing import Callable
 
 import fforest.src.getters.environment as env
 import fforest.src.getters.get_parameter_name as gpn
-from fforest.src.core.phase.ending.environment_file import ENVIRONMENT_FILE_NAME, load_environment_file
+from fforest.src.core.phase.ending.environment_file import ENVIRONMENT_FILE_NAME, load_checkpoints, \
+    load_environment_file
 from fforest.src.core.phase.phase import Phase, str_to_phase, phase_processable, phase_to_str
 from fforest.src.getters.get_output_message import vprint, Message
 from fforest.src.vrac.file_system import file_exists
 
 
+class MissingEnvironmentFile(Exception):
+    def __init__(self, phase: str, path: str):
+        Exception.__init__(self, "The phase \"{phase}\" needs the environment file \"{path}\" computed by the previous "
+                                 "phases.".format(phase=phase, path=path))
+
+
 class UnprocessablePhase(Exception):
     def __init__(self, first_phase: str, last_phase: str):
         Exception.__init__(self, "The phase \"{first_phase}\" can't be processed before "
@@ -39,13 +48,34 @@ def compute_first_phase() -> Phase:
             return current_phase
     else:
         # User want to compute all phases, regarding of previous computations (or asked it but environment file has not
-        # been found).
+        # been found). The checkpoints of the previous computations are kept, to skip the phases which are up to date.
         if (not _env_file_exists(environment_file_path)) and _resume_phase_asked():
             vprint(Message.ENVIRONMENT_FILE_NOT_FOUND)
+        if _env_file_exists(environment_file_path):
+            load_checkpoints(path=environment_file_path)
         env.current_phase = Phase.PARSING
         return Phase.PARSING
 
 
+def prepare_single_phase(phase: Phase, parsing_function: Callable) -> None:
+    """ Initialize the `env` module to compute only the phase `phase`. The environment file computed by the previous
+    phases is loaded, then the parameters explicitly given in the command-line override its values. Without any
+    environment file, only the preprocessing phase can be computed, from the parameters of the command-line.
+    """
+    environment_file_path = os.path.join(os.getcwd(), _get_main_dir_name(), ENVIRONMENT_FILE_NAME)
+
+    if _env_file_exists(environment_file_path):
+        load_environment_file(path=environment_file_path)
+        if not phase_processable(phase_to_compute=phase, last_phase_computed=env.last_phase):
+            raise UnprocessablePhase(phase_to_str(phase), phase_to_str(env.last_phase))
+        parsing_function(override=True)
+    elif phase == Phase.PREPROCESSING:
+        parsing_function()
+    else:
+        raise MissingEnvironmentFile(phase_to_str(phase), environment_file_path)
+    env.current_phase = phase
+
+
 def _get_main_dir_name() -> str:
     """ Return the name of the main directory. Try to get it from the command line if it has been given by the user, or
     then return the default value (basename of the database), located in the current directory.
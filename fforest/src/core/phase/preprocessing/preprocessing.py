@@ -1,28 +1,29 @@
 """ The only method called from outside this module should be `preprocessing`.
-It'll backup the original database into a database called `preprocessed_database`, then'll clean this new database by
-applying a set of operations on it. Theses operations consist of :
+It'll copy the original database into a database called `preprocessed_database`, cleaning it along the way by applying
+a set of operations on each of its rows. Theses operations consist of :
 - Change its encoding, delimiter, format, quote character, quoting behavior and newline delimiter.
 - Add an ID column if it's not already present.
 - Move the ID column at the beginning of the database.
 - Move the class column at the end of the database.
 - Extract the header if it's present.
+All the operations are applied in a single streaming pass : the original database is read once, the preprocessed
+database is written once, and only the current row is kept in memory.
 """
 import csv
+from typing import Iterator, List, Optional, Union
 
 import fforest.src.getters.environment as env
 import fforest.src.getters.get_default_value as gdv
-from fforest.src.file_tools.csv_tools import get_number_of_columns, preprend_column, append_column, \
-    NamedAttributeButNoHeader, EmptyHeader, dump_csv_content, get_header
-from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.csv_tools import NamedAttributeButNoHeader, dump_csv_content
 from fforest.src.getters.get_output_message import Message, vprint
-from fforest.src.vrac.file_system import create_dir, extract_first_line, dump_string
+from fforest.src.vrac.file_system import create_dir
 from fforest.src.vrac.maths.maths import is_an_int
 
 
 def preprocessing() -> None:
     """ Prepare the original database to be processed.
-    It'll backup the original database into a database called `preprocessed_database`, then'll clean this new database
-    by applying a set of operations on it. Theses operations consist of :
+    It'll copy the original database into a database called `preprocessed_database`, cleaning it along the way by
+    applying a set of operations on each of its rows. Theses operations consist of :
         - Change its encoding, delimiter, format, quote character, quoting behavior and newline delimiter.
         - Add an ID column if it's not already present.
         - Move the ID column at the beginning of the database.
@@ -31,155 +32,115 @@ def preprocessing() -> None:
     """
     # Create the main directory of the application
     create_dir(env.main_directory_path)
-    # Change the encoding, delimiter, format, quoting behavior and quoting character of the original
-    # database to initialize the preprocessed database. Once it's done, we can forget about the original database.
+    # Change the encoding, delimiter, format, quoting behavior and quoting character of the original database to
+    # initialize the preprocessed database. Once it's done, we can forget about the original database.
     vprint(Message.INITIAL_PREPROCESSING)
-    _init_preprocessed_database(original_database_path=env.original_database_path,
-                                preprocessed_database_path=env.preprocessed_database_path,
-                                input_encoding=env.encoding_input,
-                                output_encoding=env.encoding_output,
-                                input_delimiter=env.delimiter_input,
-                                output_delimiter=env.delimiter_output,
-                                input_format=env.format_input,
-                                output_format=env.format_output,
-                                input_quote_char=env.quote_character_input,
-                                output_quote_char=env.quote_character_output,
-                                input_quoting=env.quoting_input,
-                                output_quoting=env.quoting_output,
-                                input_line_delimiter=env.line_delimiter_input,
-                                output_line_delimiter=env.line_delimiter_output)
-
-    # Check if the database contains an identifier column
-    if env.identifier is None:
-        vprint(Message.ADD_ID)
-        _add_id(input_path=env.preprocessed_database_path,
-                output_path=env.preprocessed_database_path,
-                id_name=gdv.identifier(),
-                have_header=env.have_header,
-                dialect=env.dialect_output)
-
-        # An header as been added
-        env.have_header = True
-
-        # The default identifier column is always added at the first index
-        env.identifier = 0
-
-        # The class name's index must obviously be shifted to the right
-        if env.class_name >= 0:
-            env.class_name += 1
-
-    # Check if the identifier column is at the beginning of the database
-    if not _identifier_at_beginning(path=env.preprocessed_database_path,
-                                    have_header=env.have_header,
-                                    identifier=env.identifier,
-                                    dialect=env.dialect_output):
-        vprint(Message.PREPEND_ID)
-        preprend_column(input_path=env.preprocessed_database_path,
-                        output_path=env.preprocessed_database_path,
-                        column=env.identifier,
-                        dialect=env.dialect_output)
-
-        # The identifier is now a the beginning of the database, we change it to the index 0
+    input_dialect, output_dialect = env.dialect_input, env.dialect_output
+    with open(env.original_database_path, encoding=input_dialect.encoding,
+              newline=input_dialect.line_delimiter) as input_file, \
+            open(env.preprocessed_database_path, "w", encoding=output_dialect.encoding,
+                 newline=output_dialect.line_delimiter) as output_file:
+        input_reader = csv.reader(input_file, delimiter=input_dialect.delimiter, quoting=input_dialect.quoting,
+                                  quotechar=input_dialect.quote_char, skipinitialspace=True)
+        output_writer = csv.writer(output_file, delimiter=output_dialect.delimiter, quoting=output_dialect.quoting,
+                                   quotechar=output_dialect.quote_char)
+
+        # The first row gives the number of columns, and the header if it's present
+        first_row = next(_non_empty_rows(input_reader))
+        header = first_row if env.have_header else None
+
+        # Find the columns to move, then the order of the columns of the preprocessed database
+        add_id = env.identifier is None
+        identifier = None if add_id else _column_index(column=env.identifier, header=header,
+                                                       number_of_columns=len(first_row))
+        class_column = _column_index(column=env.class_name, header=header, number_of_columns=len(first_row))
+        columns_order = _columns_order(number_of_columns=len(first_row), identifier=identifier,
+                                       class_column=class_column)
+        move_identifier = identifier is not None and identifier != 0
+        move_class = class_column != [column for column in range(len(first_row)) if column != identifier][-1]
+
+        if add_id:
+            vprint(Message.ADD_ID)
+        if move_identifier:
+            vprint(Message.PREPEND_ID)
+        if move_class:
+            vprint(Message.APPEND_CLASS)
+
+        # Then clean each row as soon as it's read
+        if header is not None:
+            rows = _non_empty_rows(input_reader)
+        else:
+            rows = _prepend_row(first_row, _non_empty_rows(input_reader))
+        if columns_order != list(range(len(first_row))):
+            rows = ([row[column] for column in columns_order] for row in rows)
+        if add_id:
+            rows = ([str(row_index), *row] for row_index, row in enumerate(rows))
+        output_writer.writerows(rows)
+
+    # The identifier is now at the beginning of the database, we change it to the index 0
+    if add_id or move_identifier:
         env.identifier = 0
-
-    # Check if the class column is at the end of the database
-    if not _class_at_end(path=env.preprocessed_database_path, class_name=env.class_name, have_header=env.have_header,
-                         dialect=env.dialect_output):
-        vprint(Message.APPEND_CLASS)
-        append_column(input_path=env.preprocessed_database_path,
-                      output_path=env.preprocessed_database_path,
-                      column=env.class_name,
-                      dialect=env.dialect_output)
-
-        # The class column is now a the end of the database, we change it to the last index
-        env.class_name = get_number_of_columns(env.preprocessed_database_path, dialect=env.dialect_output) - 1
+    # The class column is now at the end of the database, we change it to the last index
+    if not (is_an_int(env.class_name) and int(env.class_name) == -1):
+        env.class_name = len(columns_order) + add_id - 1
+    # A header has been added with the identifier column
+    if add_id:
+        env.have_header = True
 
     # Check if the database have a header
     if env.have_header:
         vprint(Message.EXTRACT_HEADER)
-        _extract_header(input_path=env.preprocessed_database_path,
-                        header_path=env.header_path,
-                        dialect=env.dialect_output)
+        cleaned_header = [] if header is None else [header[column] for column in columns_order]
+        if add_id:
+            cleaned_header.insert(0, gdv.identifier())
+        dump_csv_content(path=env.header_path, content=[cleaned_header], dialect=output_dialect)
 
         # The header have been extracted, we remove the boolean value attesting for its presence
         env.have_header = False
 
 
-# TODO: Change also the format of the database
-def _init_preprocessed_database(original_database_path, preprocessed_database_path, input_encoding, output_encoding,
-                                input_delimiter, output_delimiter, input_format, output_format, input_quote_char,
-                                output_quote_char, input_quoting, output_quoting, input_line_delimiter,
-                                output_line_delimiter) -> None:
-    """ Change the encoding, delimiter, format, quoting behavior and quoting character of the original database."""
-    with open(original_database_path, encoding=input_encoding, newline=input_line_delimiter) as input_file,\
-            open(preprocessed_database_path, "w", encoding=output_encoding,
-                 newline=output_line_delimiter) as output_file:
-        input_reader = csv.reader(input_file, delimiter=input_delimiter, quoting=input_quoting,
-                                  quotechar=input_quote_char, skipinitialspace=True)
-        output_writer = csv.writer(output_file, delimiter=output_delimiter, quoting=output_quoting,
-                                   quotechar=output_quote_char, skipinitialspace=True)
-        for row in input_reader:
-            output_writer.writerow(row)
-
-
-def _add_id(input_path: str, output_path: str, id_name: str, have_header: bool, dialect: Dialect) -> None:
-    """ Add an identificator for each instance into the database.
-    If the parameter id_name is provided, it'll be inserted as a header of the output_file.
-    """
-    with open(input_path, encoding=dialect.encoding, newline=dialect.line_delimiter) as input_file:
-        input_reader = csv.reader(input_file, delimiter=dialect.delimiter, quoting=dialect.quoting,
-                                  quotechar=dialect.quote_char, skipinitialspace=dialect.skip_initial_space)
-        content = []
-
-        if have_header:
-            header = next(input_reader)
-            header.insert(0, id_name)
-            content.append(header)
-        else:
-            content.append([id_name])
+def _non_empty_rows(input_reader) -> Iterator[List]:
+    """ Iterate through the rows of `input_reader`, skipping the empty ones. """
+    return (row for row in input_reader if row)
 
-        for row_index, row in enumerate(input_reader):
-            if row:
-                row.insert(0, str(row_index))
-                content.append(row)
 
-    # Prevent the input database to be erased if it's the same as the output database
-    dump_csv_content(path=output_path, content=content, dialect=dialect)
+def _prepend_row(first_row: List, rows: Iterator[List]) -> Iterator[List]:
+    """ Iterate through `first_row`, then through `rows`. """
+    yield first_row
+    yield from rows
 
 
-def _identifier_at_beginning(path: str, identifier: str, have_header: bool, dialect: Dialect) -> bool:
-    """ Check if the identifier column is at the beginning of the database. """
-    if is_an_int(identifier):
-        return int(identifier) == 0
+def _column_index(column: Union[str, int], header: Optional[List[str]], number_of_columns: int) -> int:
+    """ Return the positive index of `column`, given by its index or by its name in the header `header`.
 
-    if not have_header:
+        Example :
+        >>> _column_index(-1, None, 4)
+        3
+        >>> _column_index("class", ["id", "class", "age"], 3)
+        1
+    """
+    if is_an_int(column):
+        return int(column) % number_of_columns
+    if header is None:
         raise NamedAttributeButNoHeader()
-    else:
-        header = get_header(path=path, dialect=dialect)
-        if len(header) == 0:
-            raise EmptyHeader(path)
-        return header[0] == identifier
+    return header.index(column)
 
 
-def _class_at_end(path: str, class_name: str, have_header: bool, dialect: Dialect) -> bool:
-    """ Check if the class column is at the end of the database. """
-    if is_an_int(class_name):
-        return int(class_name) == -1 or \
-               int(class_name) == get_number_of_columns(path, dialect=dialect) - 1
+def _columns_order(number_of_columns: int, identifier: Optional[int], class_column: int) -> List[int]:
+    """ Return the indexes of the columns in the order of the preprocessed database : the `identifier` column first if
+    it's given, then the other columns in their original order, and the `class_column` column last.
 
-    if not have_header:
-        raise NamedAttributeButNoHeader()
-    else:
-        header = get_header(path=path, dialect=dialect)
-        if len(header) == 0:
-            raise EmptyHeader(path)
-        return header[-1] == class_name
-
-
-def _extract_header(input_path: str, header_path: str, dialect: Dialect):
-    """ Extract the header from a database then dump it elsewhere. """
-    header = extract_first_line(input_path, dialect=dialect)
-    dump_string(header_path, header, dialect=dialect)
+        Example :
+        >>> _columns_order(5, identifier=3, class_column=1)
+        [3, 0, 2, 4, 1]
+        >>> _columns_order(4, identifier=None, class_column=3)
+        [0, 1, 2, 3]
+    """
+    columns = [column for column in range(number_of_columns) if column not in (identifier, class_column)]
+    if identifier is not None:
+        columns.insert(0, identifier)
+    columns.append(class_column)
+    return columns
 
 
 if __name__ == '__main__':
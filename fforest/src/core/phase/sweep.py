@@ -0,0 +1,120 @@
+""" This module computes the forests of a sweep : one forest for each configuration of the Salammbô options given to the
+sweep entry point (see the `sweep_configurations` variable of the `env` module). All the configurations share the same
+split databases, but each configuration has its own directory inside the sweep directory, containing its vectors, its
+difficulty vectors, its quality files, its classes matrices and its clustering trees.
+The trees of all the configurations are constructed by a single pool of processes, then each forest is evaluated by the
+phases following the learning phase, one configuration after the other.
+"""
+import contextlib
+import os
+from typing import Callable, Dict, Iterator, List
+
+import fforest.src.getters.environment as env
+from fforest.src.getters.get_output_message import Message, vprint
+from fforest.src.vrac.file_system import create_dir
+from fforest.src.vrac.process import get_number_of_workers
+
+# The variables of the `env` module modified by the learning and evaluation of a forest, restored after each
+# configuration
+_TREES_VARIABLES = ("subsubtrain_databases_paths", "subsubtrain_indexes_paths", "trees_in_forest", "failed_trees",
+                    "classes_matrices_timings", "clustering_trees_timings")
+
+# The variables of the `env` module containing the paths written by the learning and evaluation of a forest, relocated
+# inside the directory of each configuration. The subsubtrain directories are relocated too, as they identify the trees
+_RELOCATED_VARIABLES = ("subsubtrain_directories_path", "cclassified_vectors_paths", "salammbo_vectors_paths",
+                        "difficulty_vectors_paths", "quality_files_paths", "classes_matrices_directory_path",
+                        "classes_matrices_directories_path", "classes_matrices_files_paths",
+                        "clustering_trees_directory_path", "clustering_trees_directories_path",
+                        "clustering_trees_files_paths")
+
+
+def sweep_forests(evaluation_entry_points: List[Callable]) -> None:
+    """ Construct the trees of all the configurations with a single pool of `workers` processes, then evaluate the
+    forest of each configuration by calling `evaluation_entry_points` successively.
+    """
+    # Imported locally, as the `forest_construction` module imports NumPy
+    from fforest.src.core.phase.learning_process.forest_construction import construct_forests, forest_jobs, \
+        remove_failed_trees
+
+    forests_jobs = list()
+    for configuration in env.sweep_configurations:
+        with _configuration_environment(configuration):
+            _create_vectors_directories()
+            forests_jobs.append(forest_jobs())
+
+    forests_failed_trees = construct_forests(forests_jobs=forests_jobs, workers=get_number_of_workers(env.workers))
+
+    for configuration, failed_trees in zip(env.sweep_configurations, forests_failed_trees):
+        with _configuration_environment(configuration):
+            vprint(Message.SWEEP_CONFIGURATION, configuration=configuration_name(configuration))
+            for tree_index in failed_trees:
+                vprint(Message.SWEEP_TREE_CONSTRUCTION_FAILED, tree_index=tree_index,
+                       configuration=configuration_name(configuration))
+            remove_failed_trees(failed_trees=failed_trees)
+
+            for entry_point in evaluation_entry_points:
+                entry_point()
+
+
+def configuration_name(configuration: Dict) -> str:
+    """ Return the name of the directory of `configuration`, made of the values of its variables.
+
+        Example :
+        >>> configuration_name({"discretization_threshold": 2, "entropy_threshold": "0.05", "minimal_size_leaf": "0"})
+        'discretization_threshold_2-entropy_threshold_0.05-minimal_size_leaf_0'
+    """
+    return "-".join("{}_{}".format(name, value) for name, value in sorted(configuration.items()))
+
+
+@contextlib.contextmanager
+def _configuration_environment(configuration: Dict) -> Iterator[None]:
+    """ Set the variables of the `env` module to learn and evaluate the forest of `configuration`, whose outputs are
+    relocated inside its own directory. All the modified variables are restored when leaving the context.
+    """
+    saved_variables = {name: getattr(env, name) for name in
+                       tuple(configuration.keys()) + _TREES_VARIABLES + _RELOCATED_VARIABLES}
+    configuration_directory = "{}/{}".format(env.sweep_directory_path, configuration_name(configuration))
+    try:
+        for name, value in configuration.items():
+            setattr(env, name, value)
+        for name in _RELOCATED_VARIABLES:
+            setattr(env, name, _relocate(getattr(env, name), old_directory=env.subtrain_directory_path,
+                                         new_directory=configuration_directory))
+        yield
+    finally:
+        for name, value in saved_variables.items():
+            setattr(env, name, value)
+
+
+def _relocate(value, old_directory: str, new_directory: str):
+    """ Replace `old_directory` by `new_directory` at the beginning of a path, or of all the paths of a list or a
+    dictionary of paths.
+
+        Example :
+        >>> _relocate({"luka": ["a/sub/1.vector", "a/2.vector"]}, old_directory="a", new_directory="a/sweep/c")
+        {'luka': ['a/sweep/c/sub/1.vector', 'a/sweep/c/2.vector']}
+    """
+    if value is None:
+        return None
+    elif isinstance(value, str):
+        if value == old_directory or value.startswith(old_directory + "/"):
+            return new_directory + value[len(old_directory):]
+        return value
+    elif isinstance(value, dict):
+        return {key: _relocate(element, old_directory, new_directory) for key, element in value.items()}
+    return [_relocate(element, old_directory, new_directory) for element in value]
+
+
+def _create_vectors_directories() -> None:
+    """ Create the directories of the vectors written by the learning and reduction phases. """
+    directories = set()
+    for paths in (env.cclassified_vectors_paths, env.salammbo_vectors_paths, env.difficulty_vectors_paths):
+        for tnorm_paths in paths.values():
+            directories.update(os.path.dirname(path) for path in
+                               ([tnorm_paths] if isinstance(tnorm_paths, str) else tnorm_paths))
+    for directory in sorted(directories):
+        create_dir(directory)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,43 @@
+""" Contains tools to sample the subsubtrain databases with the `bootstrap` method.
+The bootstrap method draws the rows of each database uniformly with replacement (bagging), instead of splitting the
+input into disjoint pieces. The input is read once to index the byte offset of each of its rows. Then the rows of each
+sample are read at their offset and copied to the database of the tree, without parsing them.
+The indexes of the rows of each sample are stored next to its database in the NumPy `.npy` format, so that a sample can
+be audited, or materialized again with `materialize_sample` (see the `row_indexes` module) without keeping its database.
+"""
+from typing import List, Optional
+
+import numpy as np
+
+from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.row_indexes import materialize_sample, rows_offsets
+
+
+def bootstrap(*, input_path: str, number_of_rows: int, output_paths: List[str], indexes_paths: List[str],
+              sampling_fraction: float, seed: int, dialect: Dialect, offsets_path: Optional[str] = None) -> List[int]:
+    """ Draw, for each database of `output_paths`, `sampling_fraction` times `number_of_rows` rows of the input with
+    replacement. Store the indexes of the rows of each sample in `indexes_paths`, then write the rows of each sample to
+    its database. Return the number of rows of each database.
+    If `offsets_path` is given, the databases are not written : the offsets of the rows of the input are stored into
+    `offsets_path` instead, so that the databases can be materialized later.
+    You must pass each argument along with its name.
+    """
+    offsets = rows_offsets(path=input_path, dialect=dialect)
+    if offsets_path is not None:
+        np.save(offsets_path, offsets)
+    sample_size = int(round(sampling_fraction * number_of_rows))
+
+    generator = np.random.default_rng(seed)
+    for output_path, indexes_path in zip(output_paths, indexes_paths):
+        # The indexes are sorted, so the input is read forward
+        rows_indexes = np.sort(generator.integers(0, len(offsets) - 1, size=sample_size))
+        np.save(indexes_path, rows_indexes)
+        if offsets_path is None:
+            materialize_sample(input_path=input_path, offsets=offsets, rows_indexes=rows_indexes,
+                               output_path=output_path)
+
+    return [sample_size for _ in output_paths]
+
+
+if __name__ == "__main__":
+    pass
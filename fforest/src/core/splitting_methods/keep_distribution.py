@@ -1,8 +1,11 @@
 """ Contains tools to splits a CSV file into multiple pieces with the `keep_distribution` method.
-The keep_distribution method regroup the database content into its class subgroup. then redistribute each instance
-with the same proportion as the initial content.
+The keep_distribution method redistribute the instances of each class with the same proportion as the initial content.
+The database is read twice : the first pass counts the instances of each class (see `count_classes`), then the second
+pass routes each row to its output as soon as it is read. Thus only a counter per class is kept in memory, and the time
+is linear in the number of rows.
 """
-from typing import Tuple, List, Union
+import collections
+from typing import Dict, Tuple, List, Union
 
 from fforest.src.vrac.maths.maths import is_an_int
 
@@ -15,77 +18,78 @@ class TooManyTreesToSplit(Exception):
                                                                              percentage_per_db=percentage_per_db))
 
 
+def count_classes(input_reader, class_name: Union[str, int]) -> Dict[str, int]:
+    """ Count the rows of each class of the database read by `input_reader`.
+
+        Example :
+        >>> count_classes([["1.0", "yes"], ["2.0", "no"], ["3.0", "yes"]], "1")
+        Counter({'yes': 2, 'no': 1})
+    """
+    class_name = _class_column(class_name)
+    return collections.Counter(row[class_name] for row in input_reader)
+
+
 def keep_distribution(input_reader, row_limit: int, out_writers, number_of_trees: int, class_name: Union[str, int],
-                      number_of_rows: int) -> List[int]:
+                      number_of_rows: int, classes_count: Dict[str, int]) -> List[int]:
     """ Splits a CSV file into multiple pieces with the `keep_distribution` method.
-    The keep_distribution method regroup the database content into its class subgroup. then redistribute each instance
-    with the same proportion as the initial content.
+    Each output but the last one receives the same proportion of each class as the initial content, given the number
+    of rows of each class `classes_count`. The last output receives the rest.
     """
     rows_count = [0 for _ in range(number_of_trees)]
+    class_name = _class_column(class_name)
 
-    if is_an_int(class_name):
-        class_name = int(class_name)
-
-    # We store rows into the distribution dictionary
-    distribution_dictionary = dict()
+    # Number of rows of each class to give to each output but the last one
+    percentage_per_db = row_limit / number_of_rows
+    rows_to_give = {class_value: int(round(count * percentage_per_db)) for class_value, count in classes_count.items()}
+    for class_value, count in classes_count.items():
+        if rows_to_give[class_value] * (number_of_trees - 1) > count:
+            raise TooManyTreesToSplit(number_of_trees, number_of_rows, percentage_per_db)
+
+    # Then we route the n-th row of each class to its output, the rest going to the last one
+    rows_given = dict.fromkeys(classes_count.keys(), 0)
+    last_index = number_of_trees - 1
     for row in input_reader:
-        if row[class_name] in distribution_dictionary:
-            distribution_dictionary[row[class_name]].append(row)
+        class_value = row[class_name]
+        if rows_to_give[class_value] > 0:
+            index = min(rows_given[class_value] // rows_to_give[class_value], last_index)
         else:
-            distribution_dictionary[row[class_name]] = [row]
+            index = last_index
+        rows_given[class_value] += 1
 
-    # Then we distribute the rows proportionally
-    percentage_per_db = row_limit / number_of_rows
-    for class_name in distribution_dictionary.keys():
-        rows_to_give = int(round(len(distribution_dictionary[class_name]) * percentage_per_db))
-        for index, writer in enumerate(out_writers[:-1]):
-            for _ in range(rows_to_give):
-                try:
-                    writer.writerow(distribution_dictionary[class_name].pop(0))
-                    rows_count[index] += 1
-                except IndexError:
-                    raise TooManyTreesToSplit(number_of_trees, number_of_rows, percentage_per_db)
-
-        # Then the rest to the last writer
-        for row in distribution_dictionary[class_name]:
-            out_writers[-1].writerow(row)
-            rows_count[-1] += 1
+        out_writers[index].writerow(row)
+        rows_count[index] += 1
 
     return rows_count
 
 
 def keep_distribution2(input_reader, row_limit, out_writer_train, out_writer_test, class_name: Union[str, int],
-                       number_of_rows: int) -> Tuple[int, int]:
+                       number_of_rows: int, classes_count: Dict[str, int]) -> Tuple[int, int]:
     """ Splits a CSV file into two pieces with the `keep_distribution` method.
-    The keep_distribution method regroup the database content into its class subgroup. then redistribute each instance
-    with the same proportion as the initial content.
+    The train database receives the same proportion of each class as the initial content, given the number of rows of
+    each class `classes_count`. The test database receives the rest.
     """
     row_count_train, row_count_test = 0, 0
+    class_name = _class_column(class_name)
 
-    if is_an_int(class_name):
-        class_name = int(class_name)
+    # Number of rows of each class to give to the train database
+    percentage_train = row_limit / number_of_rows
+    rows_to_give = {class_value: int(round(count * percentage_train)) for class_value, count in classes_count.items()}
 
-    # We store rows into the distribution dictionary
-    distribution_dictionary = dict()
     for row in input_reader:
-        if row[class_name] in distribution_dictionary:
-            distribution_dictionary[row[class_name]].append(row)
+        class_value = row[class_name]
+        if rows_to_give[class_value] > 0:
+            rows_to_give[class_value] -= 1
+            out_writer_train.writerow(row)
+            row_count_train += 1
         else:
-            distribution_dictionary[row[class_name]] = [row]
-
-    # Then we distribute the rows proportionally
-    percentage_train = row_limit / number_of_rows
-    for class_name in distribution_dictionary.keys():
-        # Distribute to train
-        rows_to_give = int(round(len(distribution_dictionary[class_name]) * percentage_train))
-        row_count_train += rows_to_give
-        for _ in range(rows_to_give):
-            row_to_write = distribution_dictionary[class_name].pop(0)
-            out_writer_train.writerow(row_to_write)
-
-        # Then the rest to test
-        for row in distribution_dictionary[class_name]:
             out_writer_test.writerow(row)
             row_count_test += 1
 
     return row_count_train, row_count_test
+
+
+def _class_column(class_name: Union[str, int]) -> Union[str, int]:
+    """ Return the index of the class column if `class_name` is an int. """
+    if is_an_int(class_name):
+        return int(class_name)
+    return class_name
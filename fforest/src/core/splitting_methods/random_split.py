@@ -0,0 +1,48 @@
+""" Contains tools to splits a CSV file into multiple pieces with the `random` method.
+The random method gives each row to a random database, with a random number generator initialized with a seed, so the
+same seed always gives the same databases. The rows are routed as soon as they are read, thus the database is never
+kept in memory and the order of its rows has no influence on the content of the databases.
+"""
+import random
+from typing import Tuple, List
+
+
+def random_split(input_reader, out_writers, number_of_trees: int, seed: int) -> List[int]:
+    """ Splits a CSV file into multiple pieces with the `random` method.
+    Each block of `number_of_trees` consecutive rows is dealt to the databases in a random order : each row has the same
+    probability to go to each database, and the sizes of the databases differ by at most one row.
+    """
+    rows_count = [0 for _ in range(number_of_trees)]
+    generator = random.Random(seed)
+
+    writers_order = list(range(number_of_trees))
+    for row_index, row in enumerate(input_reader):
+        position = row_index % number_of_trees
+        if position == 0:
+            generator.shuffle(writers_order)
+        writer_index = writers_order[position]
+        out_writers[writer_index].writerow(row)
+        rows_count[writer_index] += 1
+
+    return rows_count
+
+
+def random_split2(input_reader, row_limit, out_writer_train, out_writer_test, number_of_rows: int,
+                  seed: int) -> Tuple[int, int]:
+    """ Splits a CSV file into two pieces with the `random` method.
+    The train database receives `row_limit` rows chosen uniformly among the `number_of_rows` rows of the input, and
+    the test database receives the rest. Each row is selected with a probability equal to the number of rows still
+    needed by the train database divided by the number of rows still unread.
+    """
+    row_count_train, row_count_test = 0, 0
+    generator = random.Random(seed)
+
+    for row_index, row in enumerate(input_reader):
+        if generator.random() * (number_of_rows - row_index) < row_limit - row_count_train:
+            out_writer_train.writerow(row)
+            row_count_train += 1
+        else:
+            out_writer_test.writerow(row)
+            row_count_test += 1
+
+    return row_count_train, row_count_test
@@ -0,0 +1,59 @@
+""" Contains tools to splits a CSV file into multiple pieces with the `round_robin` method.
+The round_robin method deals the instances of each class to the databases in turn, as cards are dealt to players, so
+each database receives the same proportion of each class whatever the order of the rows. The rows are routed as soon as
+they are read, and only a counter per class is kept in memory.
+"""
+from typing import Tuple, List, Union
+
+from fforest.src.vrac.maths.maths import is_an_int
+
+
+def round_robin(input_reader, out_writers, number_of_trees: int, class_name: Union[str, int]) -> List[int]:
+    """ Splits a CSV file into multiple pieces with the `round_robin` method.
+    The instances of each class are given to each database in turn. The first instance of a class goes to the database
+    following the one which received the previous row, so the sizes of the databases differ by at most one row per
+    class.
+    """
+    rows_count = [0 for _ in range(number_of_trees)]
+
+    if is_an_int(class_name):
+        class_name = int(class_name)
+
+    # The database receiving the next instance of each class
+    next_writers = dict()
+    for row_index, row in enumerate(input_reader):
+        writer_index = next_writers.get(row[class_name], row_index % number_of_trees)
+        next_writers[row[class_name]] = (writer_index + 1) % number_of_trees
+
+        out_writers[writer_index].writerow(row)
+        rows_count[writer_index] += 1
+
+    return rows_count
+
+
+def round_robin2(input_reader, row_limit, out_writer_train, out_writer_test, class_name: Union[str, int],
+                 number_of_rows: int) -> Tuple[int, int]:
+    """ Splits a CSV file into two pieces with the `round_robin` method.
+    The instances of each class are interleaved between the train and test databases, so that after each row the train
+    database has received the rounded proportion `row_limit` / `number_of_rows` of the instances of its class.
+    """
+    row_count_train, row_count_test = 0, 0
+
+    if is_an_int(class_name):
+        class_name = int(class_name)
+
+    # The number of instances of each class read, and given to the train database
+    percentage_train = row_limit / number_of_rows
+    rows_read, rows_given = dict(), dict()
+    for row in input_reader:
+        class_value = row[class_name]
+        rows_read[class_value] = rows_read.get(class_value, 0) + 1
+        if int(round(rows_read[class_value] * percentage_train)) > rows_given.get(class_value, 0):
+            rows_given[class_value] = rows_given.get(class_value, 0) + 1
+            out_writer_train.writerow(row)
+            row_count_train += 1
+        else:
+            out_writer_test.writerow(row)
+            row_count_test += 1
+
+    return row_count_train, row_count_test
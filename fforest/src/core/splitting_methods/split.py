@@ -6,13 +6,19 @@ to the splitting method asked.
 """
 import csv
 import enum
-from typing import Tuple, List
+from typing import Tuple, List, Optional, Union
 
 from fforest.src.core.splitting_methods.halfing import halfing
 from fforest.src.core.splitting_methods.halfing import halfing2
+from fforest.src.core.splitting_methods.keep_distribution import count_classes
 from fforest.src.core.splitting_methods.keep_distribution import keep_distribution
 from fforest.src.core.splitting_methods.keep_distribution import keep_distribution2
+from fforest.src.core.splitting_methods.random_split import random_split
+from fforest.src.core.splitting_methods.random_split import random_split2
+from fforest.src.core.splitting_methods.round_robin import round_robin
+from fforest.src.core.splitting_methods.round_robin import round_robin2
 from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.writer_pool import RowIndexesPool, WriterPool
 from fforest.src.vrac.maths.maths import is_a_percentage
 
 
@@ -22,6 +28,12 @@ class UnknownSplittingMethod(Exception):
                                  " exists".format(method_name=method_name))
 
 
+class UnsupportedSplittingMethod(Exception):
+    def __init__(self, method_name: str, parameter_name: str):
+        Exception.__init__(self, "The splitting method : \"{method_name}\" can't be used with the parameter "
+                                 "{parameter_name}.".format(method_name=method_name, parameter_name=parameter_name))
+
+
 class InvalidValue(Exception):
     def __init__(self, row_limit: str):
         Exception.__init__(self, "The value \"{row_limit}\" is neither a percentage nor"
@@ -33,6 +45,9 @@ class SplittingMethod(enum.IntEnum):
     UNKNOWN = 0
     HALFING = 1
     KEEP_DISTRIBUTION = 2
+    RANDOM = 3
+    ROUND_ROBIN = 4
+    BOOTSTRAP = 5
 
 
 def str_to_splittingmethod(string: str) -> SplittingMethod:
@@ -50,7 +65,7 @@ def splittingmethod_to_str(splitting_method: SplittingMethod) -> str:
 
 
 def split2(*, class_name: int, input_path: str, method: SplittingMethod, number_of_rows: int, output_name_test: str,
-           output_name_train: str, row_limit: int, dialect: Dialect) -> Tuple[int, int]:
+           output_name_train: str, row_limit: int, seed: int, dialect: Dialect) -> Tuple[int, int]:
     """ Open the initial database as input, open the two output databases as output, then give the reader and writers
     to the asked splitting2 method.
     You must pass each argument along with its name.
@@ -61,8 +76,7 @@ def split2(*, class_name: int, input_path: str, method: SplittingMethod, number_
             open(output_name_test, mode='w', encoding=dialect.encoding,
                  newline=dialect.line_delimiter) as output_test:
 
-        input_reader = csv.reader(input_file, delimiter=dialect.delimiter, quoting=dialect.quoting,
-                                  quotechar=dialect.quote_char, skipinitialspace=dialect.skip_initial_space)
+        input_reader = _reader(input_file, dialect)
         out_writer_train = csv.writer(output_train, delimiter=dialect.delimiter, quoting=dialect.quoting,
                                       quotechar=dialect.quote_char, skipinitialspace=dialect.skip_initial_space)
         out_writer_test = csv.writer(output_test, delimiter=dialect.delimiter, quoting=dialect.quoting,
@@ -71,8 +85,16 @@ def split2(*, class_name: int, input_path: str, method: SplittingMethod, number_
         if method == SplittingMethod.HALFING:
             size_train, size_test = halfing2(input_reader, row_limit, out_writer_train, out_writer_test)
         elif method == SplittingMethod.KEEP_DISTRIBUTION:
-            size_train, size_test = keep_distribution2(input_reader, row_limit, out_writer_train, out_writer_test,
-                                                       class_name, number_of_rows)
+            classes_count = count_classes(input_reader, class_name)
+            input_file.seek(0)
+            size_train, size_test = keep_distribution2(_reader(input_file, dialect), row_limit, out_writer_train,
+                                                       out_writer_test, class_name, number_of_rows, classes_count)
+        elif method == SplittingMethod.RANDOM:
+            size_train, size_test = random_split2(input_reader, row_limit, out_writer_train, out_writer_test,
+                                                  number_of_rows, seed)
+        elif method == SplittingMethod.ROUND_ROBIN:
+            size_train, size_test = round_robin2(input_reader, row_limit, out_writer_train, out_writer_test, class_name,
+                                                 number_of_rows)
         else:
             raise UnknownSplittingMethod(splittingmethod_to_str(method))
 
@@ -80,35 +102,52 @@ def split2(*, class_name: int, input_path: str, method: SplittingMethod, number_
 
 
 def split(*, class_name: int,  input_path: str, method: SplittingMethod, number_of_rows: int,  row_limit: int,
-          output_paths: List[str], dialect: Dialect) -> List[int]:
-    """ Open the initial database as input, open all the other databases as output, then give the reader and writers
-    to the asked splitting method.
+          output_paths: List[str], seed: int, dialect: Dialect, indexes_paths: Optional[List[str]] = None) -> List[int]:
+    """ Open the initial database as input, open all the other databases as output through a pool of writers, then give
+    the reader and writers to the asked splitting method.
+    If `indexes_paths` is given, the databases are not written : the indexes of the rows of each database are stored
+    into the files `indexes_paths` instead.
     You must pass each argument along with its name.
     """
-    with open(input_path, mode='r', encoding=dialect.encoding, newline=dialect.line_delimiter) as input_file:
-        out_files = [open(name, mode='w', encoding=dialect.encoding,
-                          newline=dialect.line_delimiter) for name in output_paths]
-
-        input_reader = csv.reader(input_file, delimiter=dialect.delimiter, quoting=dialect.quoting,
-                                  quotechar=dialect.quote_char, skipinitialspace=dialect.skip_initial_space)
-        out_writers = [csv.writer(f, delimiter=dialect.delimiter, quoting=dialect.quoting, quotechar=dialect.quote_char,
-                                  skipinitialspace=dialect.skip_initial_space) for f in out_files]
+    with open(input_path, mode='r', encoding=dialect.encoding, newline=dialect.line_delimiter) as input_file, \
+            _writer_pool(output_paths=output_paths, indexes_paths=indexes_paths, dialect=dialect) as writer_pool:
+        input_reader = writer_pool.rows(_reader(input_file, dialect))
+        out_writers = writer_pool.writers
 
         number_of_trees = len(output_paths)
         if method == SplittingMethod.HALFING:
             databases_size = halfing(input_reader, row_limit, out_writers, number_of_trees)
         elif method == SplittingMethod.KEEP_DISTRIBUTION:
-            databases_size = keep_distribution(input_reader, row_limit, out_writers, number_of_trees, class_name,
-                                               number_of_rows)
+            classes_count = count_classes(input_reader, class_name)
+            input_file.seek(0)
+            databases_size = keep_distribution(writer_pool.rows(_reader(input_file, dialect)), row_limit, out_writers,
+                                               number_of_trees, class_name, number_of_rows, classes_count)
+        elif method == SplittingMethod.RANDOM:
+            databases_size = random_split(input_reader, out_writers, number_of_trees, seed)
+        elif method == SplittingMethod.ROUND_ROBIN:
+            databases_size = round_robin(input_reader, out_writers, number_of_trees, class_name)
         else:
             raise UnknownSplittingMethod(splittingmethod_to_str(method))
 
-        # Close all the file handlers
-        map(lambda f: f.close(), out_files)
-
         return databases_size
 
 
+def _writer_pool(output_paths: List[str], indexes_paths: Optional[List[str]],
+                 dialect: Dialect) -> Union[WriterPool, RowIndexesPool]:
+    """ Return a pool writing the databases `output_paths`, or storing the indexes of their rows into `indexes_paths`
+    if given.
+    """
+    if indexes_paths is None:
+        return WriterPool(paths=output_paths, dialect=dialect)
+    return RowIndexesPool(paths=indexes_paths)
+
+
+def _reader(input_file, dialect: Dialect):
+    """ Return a CSV reader of `input_file`, read with the dialect `dialect`. """
+    return csv.reader(input_file, delimiter=dialect.delimiter, quoting=dialect.quoting, quotechar=dialect.quote_char,
+                      skipinitialspace=dialect.skip_initial_space)
+
+
 def convert_row_limit(row_limit: str, number_of_rows: int) -> int:
     """ Convert the parsed `row_limit` to a number of rows if it's a percentage, or raise an exception otherwise
 
@@ -12,6 +12,7 @@ class Format(enum.IntEnum):
     XML = 2
     YAML = 3
     SYLK = 4
+    NUMPY = 5
 
 
 class UnknownFormat(Exception):
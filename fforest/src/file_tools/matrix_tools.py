@@ -0,0 +1,123 @@
+""" This module contains useful tools to dump and load the classes matrices. A class matrix contains one row per tree
+and one column per instance of the reference database, and link one instance to the % of membership a fuzzy tree gave
+it for a specific class.
+The matrices can be stored in two formats :
+- The CSV format, readable by a human. The first row contains the identifiers of the instances, then each row starts
+with the identifier of its tree.
+- The NUMPY format, a binary `.npy` file containing the dense (trees x instances) float64 matrix, in a C-contiguous
+layout where each tree is a contiguous row. The identifiers of the trees and of the instances are stored in a sidecar
+`.json` file with the same name. The matrix can thus be memory-mapped without building any Python object per cell.
+"""
+import json
+import os
+from typing import List
+
+import numpy as np
+
+from fforest.src.file_tools.csv_tools import iter_rows, dump_csv_content
+from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.format import Format, format_to_str
+from fforest.src.vrac.maths.arrays import z_score
+
+KEY_IDENTIFIER = "ID"
+KEY_TREES = "trees"
+KEY_INSTANCES = "instances"
+NUMPY_EXTENSION = "npy"
+SIDECAR_EXTENSION = "json"
+
+
+class UnsupportedMatrixFormat(Exception):
+    def __init__(self, matrix_format: str):
+        Exception.__init__(self, "The classes matrices can't be stored with the format \"{matrix_format}\". Values can "
+                                 "be `csv` or `numpy`.".format(matrix_format=matrix_format))
+
+
+class ClassMatrix:
+    """ The content of a class matrix for one class and one t-norm.
+
+    Attributes :
+        - trees: List[str], The identifier of each tree (the rows of the matrix).
+        - instances: List[str], The identifier of each instance (the columns of the matrix).
+        - values: np.array[float], A (trees x instances) matrix of the % of membership found by each tree. It's a
+        read-only memory-mapped array when the matrix is loaded from the NUMPY format.
+    """
+    def __init__(self, trees: List[str], instances: List[str], values: np.ndarray):
+        self.trees = list(trees)
+        self.instances = list(instances)
+        self.values = values
+
+
+def matrix_extension(matrix_format: Format, csv_extension: str) -> str:
+    """ Return the extension of the class matrix files stored with the format `matrix_format`. """
+    if matrix_format == Format.CSV:
+        return csv_extension
+    elif matrix_format == Format.NUMPY:
+        return NUMPY_EXTENSION
+    raise UnsupportedMatrixFormat(format_to_str(matrix_format))
+
+
+def sidecar_path(path: str) -> str:
+    """ Return the path of the sidecar file containing the identifiers of the class matrix located at `path`.
+
+        Example :
+        >>> sidecar_path("classes_matrices/yes/class_matrix_yes_luka.npy")
+        'classes_matrices/yes/class_matrix_yes_luka.json'
+    """
+    return "{}.{}".format(os.path.splitext(path)[0], SIDECAR_EXTENSION)
+
+
+def dump_class_matrix(path: str, matrix: ClassMatrix, matrix_format: Format, dialect: Dialect) -> None:
+    """ Dump a class matrix into the file located at `path`, with the format `matrix_format`. """
+    if matrix_format == Format.CSV:
+        content = list()
+
+        # Construct header
+        content.append([KEY_IDENTIFIER] + matrix.instances)
+
+        # Construct matrix
+        for tree, memberships in zip(matrix.trees, matrix.values.tolist()):
+            content.append([tree] + memberships)
+        dump_csv_content(path=path, content=content, dialect=dialect)
+    elif matrix_format == Format.NUMPY:
+        with open(path, "wb") as file:
+            np.save(file, np.ascontiguousarray(matrix.values, dtype=np.float64))
+        with open(sidecar_path(path), "w", encoding=dialect.encoding) as file:
+            json.dump({KEY_TREES: matrix.trees, KEY_INSTANCES: matrix.instances}, file)
+    else:
+        raise UnsupportedMatrixFormat(format_to_str(matrix_format))
+
+
+def load_class_matrix(path: str, matrix_format: Format, dialect: Dialect) -> ClassMatrix:
+    """ Load the class matrix located at `path`, stored with the format `matrix_format`. A matrix stored with the NUMPY
+    format is memory-mapped in read-only mode.
+    """
+    if matrix_format == Format.CSV:
+        rows = iter_rows(path=path, skip_header=False, dialect=dialect)
+        _, *instances = next(rows)
+        trees, values = list(), list()
+        for tree, *memberships in rows:
+            trees.append(tree)
+            values.append(memberships)
+        return ClassMatrix(trees=trees, instances=instances,
+                           values=np.array(values, dtype=np.float64).reshape((len(trees), len(instances))))
+    elif matrix_format == Format.NUMPY:
+        with open(sidecar_path(path), encoding=dialect.encoding) as file:
+            identifiers = json.load(file)
+        return ClassMatrix(trees=identifiers[KEY_TREES], instances=identifiers[KEY_INSTANCES],
+                           values=np.load(path, mmap_mode="r"))
+    raise UnsupportedMatrixFormat(format_to_str(matrix_format))
+
+
+def load_normalized_class_matrix(path: str, matrix_format: Format, dialect: Dialect,
+                                 useless_value: float = 0.0) -> ClassMatrix:
+    """ Load the class matrix located at `path` and normalize the values of each instance (column) with their z-score.
+    The instances with the same value for all the trees are useless, thus their values are replaced by `useless_value`.
+    The normalized values are a new array : the class matrix file is never modified.
+    """
+    class_matrix = load_class_matrix(path=path, matrix_format=matrix_format, dialect=dialect)
+    class_matrix.values = z_score(class_matrix.values, useless_value=useless_value)
+    return class_matrix
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,58 @@
+""" This module contains tools to access the rows of a CSV file by their index, without parsing the file.
+The file is read once to index the byte offset of each of its rows. A sample of rows, given by their indexes, can then
+be copied to another file by reading only these rows at their offset. The indexes are stored in the NumPy `.npy`
+format.
+"""
+import array
+from typing import BinaryIO
+
+import numpy as np
+
+from fforest.src.file_tools.dialect import Dialect
+
+INDEXES_EXTENSION = "npy"
+_BUFFER_SIZE = 1024 * 1024
+
+
+def rows_offsets(path: str, dialect: Dialect) -> np.ndarray:
+    """ Return the byte offset of the beginning of each row of the CSV file located at `path`, followed by the size of
+    the file. A line ending inside a quoted value doesn't end its row. The encoding of the file must be compatible with
+    ASCII.
+    """
+    quote_char = dialect.quote_char.encode(dialect.encoding)
+    offsets = array.array("q", [0])
+    position, in_quotes = 0, False
+    with open(path, mode="rb", buffering=_BUFFER_SIZE) as file:
+        for line in file:
+            position += len(line)
+            if line.count(quote_char) % 2 == 1:
+                in_quotes = not in_quotes
+            if not in_quotes:
+                offsets.append(position)
+    return np.frombuffer(offsets, dtype=np.int64)
+
+
+def materialize_sample(input_path: str, offsets: np.ndarray, rows_indexes: np.ndarray, output_path: str) -> None:
+    """ Write the rows `rows_indexes` of the file located at `input_path`, whose rows begin at `offsets`, to the file
+    located at `output_path`. The output can be a named pipe, as it is written sequentially.
+    """
+    with open(output_path, mode="wb", buffering=_BUFFER_SIZE) as output_file:
+        write_sample(input_path=input_path, offsets=offsets, rows_indexes=rows_indexes, output_file=output_file)
+
+
+def write_sample(input_path: str, offsets: np.ndarray, rows_indexes: np.ndarray, output_file: BinaryIO) -> None:
+    """ Write the rows `rows_indexes` of the file located at `input_path`, whose rows begin at `offsets`, to the binary
+    file object `output_file`.
+    """
+    with open(input_path, mode="rb", buffering=_BUFFER_SIZE) as input_file:
+        previous_index, row = None, b""
+        for row_index in rows_indexes.tolist():
+            if row_index != previous_index:
+                input_file.seek(offsets[row_index])
+                row = input_file.read(offsets[row_index + 1] - offsets[row_index])
+                previous_index = row_index
+            output_file.write(row)
+
+
+if __name__ == "__main__":
+    pass
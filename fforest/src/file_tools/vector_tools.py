@@ -0,0 +1,255 @@
+""" This module contains useful tools to dump and load the salammbo and cclassified vectors computed for each tree.
+The vectors can be stored in two formats :
+- The CSV format, readable by a human. A salammbo vector contains one row per instance, with the identifier of the
+instance, its true class and one membership column per class. A cclassified vector contains one row per instance, with
+its identifier and 1.0 if it has been correctly classified (0.0 otherwise).
+- The NUMPY format, a binary `.npz` archive containing one array per column. A salammbo vector stores the identifiers,
+the classes, the true classes and the memberships as a (instances x classes) float64 matrix. It is loaded by the
+following phases without parsing any text.
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from fforest.src.file_tools.csv_tools import iter_rows, dump_csv_content
+from fforest.src.file_tools.dialect import Dialect
+from fforest.src.file_tools.format import Format, format_to_str
+
+KEY_ID = "ID"
+KEY_TRUECLASS = "trueclass"
+KEY_CLASSES = "classes"
+KEY_MEMBERSHIPS = "memberships"
+KEY_CCLASSIFIED = "cclassified"
+NUMPY_EXTENSION = "npz"
+UNKNOWN_CLASS_CODE = -1
+
+
+class UnsupportedVectorFormat(Exception):
+    def __init__(self, vector_format: str):
+        Exception.__init__(self, "The vectors can't be stored with the format \"{vector_format}\". Values can be `csv` "
+                                 "or `numpy`.".format(vector_format=vector_format))
+
+
+class UnknownTrueClass(Exception):
+    def __init__(self, true_class: str, classes: List[str]):
+        Exception.__init__(self, "The true class \"{true_class}\" is not one of the classes of the salammbo vector "
+                                 "({classes}).".format(true_class=true_class, classes=", ".join(classes)))
+
+
+class SalammboVector:
+    """ The content of a salammbo vector for one tree and one t-norm.
+
+    Attributes :
+        - identifiers: np.array[str], The identifier of each instance.
+        - classes: List[str], The classes of the memberships columns.
+        - true_classes: np.array[str], The true class of each instance, which may not be one of `classes`.
+        - memberships: np.array[float], A (instances x classes) matrix of the % of membership found by the tree.
+    """
+    def __init__(self, identifiers, classes: List[str], true_classes, memberships):
+        self.identifiers = np.asarray(identifiers, dtype=str)
+        self.classes = list(classes)
+        self.true_classes = np.asarray(true_classes, dtype=str)
+        self.memberships = np.asarray(memberships, dtype=np.float64).reshape((len(self.identifiers),
+                                                                              len(self.classes)))
+
+    def true_classes_codes(self) -> np.ndarray:
+        """ Return the index of the true class of each instance in `classes`, or -1 if it's unknown. Each distinct true
+        class is only searched once.
+
+            Example :
+            >>> SalammboVector(["1", "2", "3"], ["yes", "no"], ["no", "maybe", "no"], [[0, 1]] * 3).true_classes_codes()
+            array([ 1, -1,  1], dtype=int32)
+        """
+        true_classes, inverse = np.unique(self.true_classes, return_inverse=True)
+        codes = np.array([class_to_code(true_class, self.classes) for true_class in true_classes.tolist()],
+                         dtype=np.int32)
+        return codes[inverse.reshape(-1)]
+
+    def true_class_memberships(self) -> np.ndarray:
+        """ Return the % of membership of each instance to its true class. Raise an `UnknownTrueClass` exception if the
+        true class of an instance is not one of `classes`.
+
+            Example :
+            >>> vector = SalammboVector(["1", "2"], ["yes", "no"], ["yes", "no"], [[0.2, 0.8], [0.3, 0.7]])
+            >>> vector.true_class_memberships()
+            array([0.2, 0.7])
+        """
+        codes = self.true_classes_codes()
+        unknown = np.flatnonzero(codes == UNKNOWN_CLASS_CODE)
+        if len(unknown):
+            raise UnknownTrueClass(true_class=self.true_classes[unknown[0]], classes=self.classes)
+        return self.memberships[np.arange(len(self.identifiers)), codes]
+
+
+def vector_extension(vector_format: Format, vector_file_extension: str) -> str:
+    """ Return the extension of the vector files stored with the format `vector_format`. """
+    if vector_format == Format.CSV:
+        return vector_file_extension
+    elif vector_format == Format.NUMPY:
+        return NUMPY_EXTENSION
+    raise UnsupportedVectorFormat(format_to_str(vector_format))
+
+
+def class_to_code(class_name: str, classes: List[str]) -> int:
+    """ Return the index of `class_name` in `classes`, or -1 if it's unknown.
+
+        Example :
+        >>> class_to_code("no", ["yes", "no"])
+        1
+        >>> class_to_code("maybe", ["yes", "no"])
+        -1
+    """
+    try:
+        return classes.index(class_name)
+    except ValueError:
+        return UNKNOWN_CLASS_CODE
+
+
+def dump_salammbo_vector(path: str, vector: SalammboVector, vector_format: Format, dialect: Dialect) -> None:
+    """ Dump a salammbo vector into the file located at `path`, with the format `vector_format`. """
+    if vector_format == Format.CSV:
+        dump_csv_content(path=path, content=_salammbo_vector_to_rows(vector), dialect=dialect)
+    elif vector_format == Format.NUMPY:
+        with open(path, "wb") as file:
+            np.savez(file, **{KEY_ID: vector.identifiers,
+                              KEY_CLASSES: np.asarray(vector.classes, dtype=str),
+                              KEY_TRUECLASS: vector.true_classes,
+                              KEY_MEMBERSHIPS: vector.memberships})
+    else:
+        raise UnsupportedVectorFormat(format_to_str(vector_format))
+
+
+def load_salammbo_vector(path: str, vector_format: Format, dialect: Dialect) -> SalammboVector:
+    """ Load the salammbo vector located at `path`, stored with the format `vector_format`. """
+    if vector_format == Format.CSV:
+        rows = iter_rows(path=path, skip_header=False, dialect=dialect)
+        _, _, *classes = next(rows)
+        identifiers, true_classes, memberships = list(), list(), list()
+        for identifier, true_class, *row_memberships in rows:
+            identifiers.append(identifier)
+            true_classes.append(true_class)
+            memberships.append(row_memberships)
+        return SalammboVector(identifiers=identifiers, classes=classes, true_classes=true_classes,
+                              memberships=memberships)
+    elif vector_format == Format.NUMPY:
+        with np.load(path) as archive:
+            return SalammboVector(identifiers=archive[KEY_ID],
+                                 classes=archive[KEY_CLASSES].tolist(),
+                                 true_classes=archive[KEY_TRUECLASS],
+                                 memberships=archive[KEY_MEMBERSHIPS])
+    raise UnsupportedVectorFormat(format_to_str(vector_format))
+
+
+class IdentifiersIndex:
+    """ Map a list of identifiers to their position, to align the rows of vectors on a shared ID index. """
+    def __init__(self, identifiers: List[str]):
+        self.identifiers = np.asarray(identifiers, dtype=str)
+        self._index = None
+
+    def align(self, vector_identifiers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ Return the rows of `vector_identifiers` known by the index, and their respective columns in the index.
+
+            Example :
+            >>> IdentifiersIndex(["0", "1", "2"]).align(np.array(["2", "5", "0"]))
+            (array([0, 2]), array([2, 0]))
+        """
+        if np.array_equal(vector_identifiers, self.identifiers):
+            # Fast path : the vector is already aligned on the index
+            positions = np.arange(len(self.identifiers))
+            return positions, positions
+
+        if self._index is None:
+            self._index = {identifier: column for column, identifier in enumerate(self.identifiers.tolist())}
+        columns = np.fromiter((self._index.get(identifier, -1) for identifier in vector_identifiers.tolist()),
+                              dtype=np.intp, count=len(vector_identifiers))
+        rows = np.flatnonzero(columns != -1)
+        return rows, columns[rows]
+
+
+def load_true_class_memberships(paths: List[str], identifiers: List[str], vector_format: Format,
+                                dialect: Dialect) -> np.ndarray:
+    """ Load the salammbo vectors located at `paths` into a preallocated (trees x instances) matrix containing the % of
+    membership of each instance to its true class. The columns are aligned on `identifiers`, and an instance missing in
+    a salammbo vector has a membership of 0.0 for this tree. Raise an `UnknownTrueClass` exception if the true class of
+    an instance is not one of the classes of its salammbo vector.
+    """
+    matrix = np.zeros((len(paths), len(identifiers)), dtype=np.float64)
+    index = IdentifiersIndex(identifiers)
+    for tree_index, path in enumerate(paths):
+        matrix[tree_index] = load_true_class_membership(path=path, index=index, vector_format=vector_format,
+                                                        dialect=dialect)
+    return matrix
+
+
+def load_true_class_membership(path: str, index: IdentifiersIndex, vector_format: Format,
+                               dialect: Dialect) -> np.ndarray:
+    """ Load the salammbo vector located at `path` into an array containing the % of membership of each instance to its
+    true class, aligned on `index`. An instance missing in the salammbo vector has a membership of 0.0.
+    """
+    vector = load_salammbo_vector(path=path, vector_format=vector_format, dialect=dialect)
+    result = np.zeros(len(index.identifiers), dtype=np.float64)
+    rows, columns = index.align(vector.identifiers)
+    result[columns] = vector.true_class_memberships()[rows]
+    return result
+
+
+def load_classes_memberships(paths: List[str], identifiers: List[str], classes: List[str], vector_format: Format,
+                             dialect: Dialect) -> Dict[str, np.ndarray]:
+    """ Load the salammbo vectors located at `paths` into one preallocated (trees x instances) matrix per class of
+    `classes`, containing the % of membership of each instance to this class. Each salammbo vector is loaded only once.
+    The columns are aligned on `identifiers`, and an instance missing in a salammbo vector has a membership of 0.0 for
+    this tree.
+    """
+    matrices = {class_name: np.zeros((len(paths), len(identifiers)), dtype=np.float64) for class_name in classes}
+    index = IdentifiersIndex(identifiers)
+    for tree_index, path in enumerate(paths):
+        vector = load_salammbo_vector(path=path, vector_format=vector_format, dialect=dialect)
+        rows, columns = index.align(vector.identifiers)
+        for class_name in classes:
+            class_code = class_to_code(class_name, vector.classes)
+            if class_code != UNKNOWN_CLASS_CODE:
+                matrices[class_name][tree_index, columns] = vector.memberships[rows, class_code]
+    return matrices
+
+
+def dump_cclassified_vector(path: str, identifiers: List[str], cclassified: List[bool], vector_format: Format,
+                            dialect: Dialect) -> None:
+    """ Dump a cclassified vector into the file located at `path`, with the format `vector_format`. """
+    if vector_format == Format.CSV:
+        dump_csv_content(path=path,
+                         content=([identifier, 1.0 if correct else 0.0] for identifier, correct in
+                                  zip(identifiers, cclassified)),
+                         dialect=dialect)
+    elif vector_format == Format.NUMPY:
+        with open(path, "wb") as file:
+            np.savez(file, **{KEY_ID: np.asarray(identifiers, dtype=str),
+                              KEY_CCLASSIFIED: np.asarray(cclassified, dtype=bool)})
+    else:
+        raise UnsupportedVectorFormat(format_to_str(vector_format))
+
+
+def export_vector_to_csv(path: str, output_path: str, dialect: Dialect) -> None:
+    """ Export a salammbo or cclassified vector stored in the NUMPY format into a CSV file, with the exact same content
+    as if it was dumped with the CSV format. It makes the binary vectors inspectable by a human.
+    """
+    with np.load(path) as archive:
+        if KEY_CCLASSIFIED in archive.files:
+            content = [[identifier, 1.0 if correct else 0.0] for identifier, correct in
+                       zip(archive[KEY_ID].tolist(), archive[KEY_CCLASSIFIED].tolist())]
+            dump_csv_content(path=output_path, content=content, dialect=dialect)
+            return
+
+    vector = load_salammbo_vector(path=path, vector_format=Format.NUMPY, dialect=dialect)
+    dump_csv_content(path=output_path, content=_salammbo_vector_to_rows(vector), dialect=dialect)
+
+
+def _salammbo_vector_to_rows(vector: SalammboVector) -> iter:
+    """ Iterate through the rows of a salammbo vector in the CSV format, header included. """
+    yield [KEY_ID, KEY_TRUECLASS, *vector.classes]
+    for identifier, true_class, memberships in zip(vector.identifiers.tolist(), vector.true_classes.tolist(),
+                                                   vector.memberships.tolist()):
+        yield [identifier, true_class, *memberships]
+
+
+if __name__ == "__main__":
+    pass
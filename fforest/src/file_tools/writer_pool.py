@@ -0,0 +1,164 @@
+""" This module contains a pool of CSV writers, used to write a large number of files at the same time.
+The rows given to each writer are buffered in memory, then written to their file by large blocks. The pool keeps a
+bounded number of files open at the same time : when there are more files than this bound, the rows are buffered by the
+pool itself, and the least recently used file is closed before opening a new one, then reopened later in append mode.
+Thus a database can be split into thousands of databases without exceeding the limit of open file descriptors of the
+process.
+This module also contains a pool of writers storing the indexes of the rows they receive instead of the rows themselves,
+used to split a database without writing its pieces.
+"""
+import array
+import collections
+import csv
+import io
+from typing import Iterable, Iterator, List
+
+from fforest.src.file_tools.dialect import Dialect
+
+_MAX_OPEN_FILES = 128
+_BUFFERS_SIZE = 64 * 1024 * 1024
+_MINIMAL_BLOCK_SIZE = 4 * 1024
+_MAXIMAL_BLOCK_SIZE = 1024 * 1024
+
+
+class WriterPool:
+    """ A pool of CSV writers, one for each path of `paths`, accessible through the `writers` attribute. The rows are
+    written with the dialect `dialect`, and at most `max_open_files` files are open at the same time. The pool must be
+    closed to write the remaining rows, or used as a context manager.
+    """
+    def __init__(self, paths: List[str], dialect: Dialect, max_open_files: int = _MAX_OPEN_FILES,
+                 buffers_size: int = _BUFFERS_SIZE):
+        self._paths = paths
+        self._dialect = dialect
+        self._max_open_files = max_open_files
+
+        # The open files, from the least recently used to the most recently used, and the files already created
+        self._open_files = collections.OrderedDict()
+        self._created_files = set()
+
+        block_size = min(max(buffers_size // max(len(paths), 1), _MINIMAL_BLOCK_SIZE), _MAXIMAL_BLOCK_SIZE)
+        if len(paths) <= max_open_files:
+            # All the files stay open, with a buffer of `block_size` bytes
+            for index, path in enumerate(paths):
+                self._open_files[index] = open(path, mode="w", encoding=dialect.encoding,
+                                               newline=dialect.line_delimiter, buffering=block_size)
+                self._created_files.add(index)
+            self.writers = [csv.writer(self._open_files[index], delimiter=dialect.delimiter, quoting=dialect.quoting,
+                                       quotechar=dialect.quote_char, skipinitialspace=dialect.skip_initial_space)
+                            for index in range(len(paths))]
+        else:
+            self.writers = [_BufferedWriter(pool=self, index=index, dialect=dialect, block_size=block_size)
+                            for index in range(len(paths))]
+
+    def __enter__(self) -> "WriterPool":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
+
+    def rows(self, input_reader: Iterable) -> Iterable:
+        """ Return the rows to give to the writers of the pool, read from `input_reader`. """
+        return input_reader
+
+    def close(self) -> None:
+        """ Write the rows remaining in the buffers, create the files which didn't receive any row, then close all the
+        files.
+        """
+        try:
+            for writer in self.writers:
+                if isinstance(writer, _BufferedWriter):
+                    writer.flush()
+            for index in range(len(self._paths)):
+                if index not in self._created_files:
+                    self.write(index=index, content="")
+        finally:
+            for file in self._open_files.values():
+                file.close()
+            self._open_files.clear()
+
+    def write(self, index: int, content: str) -> None:
+        """ Write `content` at the end of the file of the writer `index`, opening it if needed. """
+        file = self._open_files.pop(index, None)
+        if file is None:
+            if len(self._open_files) >= self._max_open_files:
+                _, least_recently_used_file = self._open_files.popitem(last=False)
+                least_recently_used_file.close()
+            mode = "a" if index in self._created_files else "w"
+            file = open(self._paths[index], mode=mode, encoding=self._dialect.encoding,
+                        newline=self._dialect.line_delimiter)
+            self._created_files.add(index)
+        self._open_files[index] = file
+        file.write(content)
+
+
+class _BufferedWriter:
+    """ A CSV writer storing its rows in memory, and giving them to its pool when they exceed `block_size`
+    characters.
+    """
+    def __init__(self, pool: WriterPool, index: int, dialect: Dialect, block_size: int):
+        self._pool = pool
+        self._index = index
+        self._block_size = block_size
+        self._remaining_size = block_size
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, delimiter=dialect.delimiter, quoting=dialect.quoting,
+                                  quotechar=dialect.quote_char, skipinitialspace=dialect.skip_initial_space)
+
+    def writerow(self, row) -> None:
+        # The CSV writer returns the number of characters written
+        self._remaining_size -= self._writer.writerow(row)
+        if self._remaining_size <= 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """ Give the buffered rows to the pool, then empty the buffer. """
+        if self._remaining_size < self._block_size:
+            self._pool.write(index=self._index, content=self._buffer.getvalue())
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._remaining_size = self._block_size
+
+
+class RowIndexesPool:
+    """ A pool of writers, one for each path of `paths`, accessible through the `writers` attribute. Each writer stores
+    the indexes of the rows it receives, which must be read through the `rows` method. When the pool is closed, the
+    indexes of each writer are saved to its path in the NumPy `.npy` format.
+    """
+    def __init__(self, paths: List[str]):
+        self._paths = paths
+        self._row_index = -1
+        self.writers = [_RowIndexesWriter(pool=self) for _ in paths]
+
+    def __enter__(self) -> "RowIndexesPool":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback) -> None:
+        self.close()
+
+    @property
+    def row_index(self) -> int:
+        """ The index of the last row read through the `rows` method. """
+        return self._row_index
+
+    def rows(self, input_reader: Iterable) -> Iterator:
+        """ Iterate through the rows of `input_reader`, keeping the index of the current row. """
+        for self._row_index, row in enumerate(input_reader):
+            yield row
+
+    def close(self) -> None:
+        """ Save the indexes of the rows received by each writer. """
+        # Imported locally, as the NumPy format is only needed when the pool is closed
+        import numpy as np
+
+        for path, writer in zip(self._paths, self.writers):
+            np.save(path, np.frombuffer(writer.indexes, dtype=np.int64))
+
+
+class _RowIndexesWriter:
+    """ A writer storing the index of the rows it receives in `indexes`, given by its pool. """
+    def __init__(self, pool: RowIndexesPool):
+        self._pool = pool
+        self.indexes = array.array("q")
+
+    def writerow(self, row) -> None:
+        self.indexes.append(self._pool.row_index)
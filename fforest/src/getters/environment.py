@@ -3,10 +3,13 @@ software.
 """
 
 # Command-line parameters
+cache_directory = None
+cache_size = None
 cclassified_vector_prefix = None
 class_matrix_prefix = None
 class_name = None
 classes_matrices_directory = None
+clustering_threshold = None
 clustering_trees_directory = None
 clustering_trees_method = None
 clustering_trees_prefix = None
@@ -19,6 +22,7 @@ encoding_input = None
 encoding_output = None
 entropy_measure = None
 entropy_threshold = None
+fifo = None
 format_input = None
 format_output = None
 have_header = None
@@ -31,6 +35,7 @@ last_phase = None
 line_delimiter_input = None
 line_delimiter_output = None
 main_directory = None
+matrix_format = None
 minimal_size_leaf = None
 parent_dir = None
 preprocessed_database_name = None
@@ -46,6 +51,8 @@ reference_database_name = None
 reference_split_method = None
 reference_value = None
 resume_phase = None
+sampling_fraction = None
+seed = None
 statistics_file_name = None
 subsubtrain_directory = None
 subsubtrain_directory_pattern = None
@@ -53,6 +60,7 @@ subsubtrain_name_pattern = None
 subsubtrain_split_method = None
 subtrain_directory = None
 subtrain_name = None
+sweep_directory = None
 t_norms = None
 test_database_name = None
 train_database_name = None
@@ -61,7 +69,9 @@ tree_file_extension = None
 trees_in_forest = None
 true_class_directory = None
 vector_file_extension = None
+vector_format = None
 verbosity = None
+workers = None
 
 # Directories paths
 main_directory_path = None
@@ -72,6 +82,7 @@ classes_matrices_directory_path = None
 classes_matrices_directories_path = None
 clustering_trees_directory_path = None
 clustering_trees_directories_path = None
+sweep_directory_path = None
 
 # Paths
 cclassified_vectors_paths = None
@@ -86,7 +97,9 @@ test_database_path = None
 train_database_path = None
 reference_database_path = None
 subtrain_database_path = None
+subtrain_offsets_path = None
 subsubtrain_databases_paths = None
+subsubtrain_indexes_paths = None
 salammbo_vectors_paths = None
 quality_files_paths = None
 
@@ -102,8 +115,14 @@ subtrain_database_instances = None
 subsubtrain_databases_instances = None
 
 # Miscellaneous
+classes_matrices_timings = None
+clustering_trees_timings = None
+command_line_arguments = None
 current_phase = None
 dialect_input = None
 dialect_output = None
+failed_trees = None
+phases_hashes = None
 possible_classes = None
+sweep_configurations = None
 t_norms_names = None
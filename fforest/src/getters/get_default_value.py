@@ -10,6 +10,7 @@ name.
 - Except for the access functions, this module mustn't have any side-effect to the program's namespace nor the files it
 tries to access.
 """
+import functools
 import json
 import os
 
@@ -18,12 +19,18 @@ _PATH_DEFAULT_VALUES = "../../res/default_values.json"
 
 
 def _get_value_from_file(value):
+    return _load_file()[value]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_file() -> dict:
+    """ Parse the file once per process. Call `_load_file.cache_clear()` to read it again. """
     global _PATH_DEFAULT_VALUES
 
     path = os.path.join(os.path.dirname(__file__),
                         _PATH_DEFAULT_VALUES)
     with open(path) as file:
-        return json.load(file)[value]
+        return json.load(file)
 
 
 def training_value() -> float:
@@ -54,6 +61,14 @@ def subsubtrain_split_method() -> str:
     return _get_value_from_file("subsubtrain_split_method")
 
 
+def seed() -> str:
+    return _get_value_from_file("seed")
+
+
+def sampling_fraction() -> str:
+    return _get_value_from_file("sampling_fraction")
+
+
 def quality_computing_method() -> str:
     return _get_value_from_file("quality_computing_method")
 
@@ -62,6 +77,14 @@ def clustering_trees_method() -> str:
     return _get_value_from_file("clustering_trees_method")
 
 
+def distance_measure() -> str:
+    return _get_value_from_file("distance_measure")
+
+
+def clustering_threshold() -> str:
+    return _get_value_from_file("clustering_threshold")
+
+
 def train_name() -> str:
     return _get_value_from_file("train_name")
 
@@ -146,6 +169,10 @@ def clustering_trees_directory() -> str:
     return _get_value_from_file("clustering_trees_directory")
 
 
+def sweep_directory() -> str:
+    return _get_value_from_file("sweep_directory")
+
+
 def subsubtrain_directory_pattern() -> str:
     return _get_value_from_file("subsubtrain_directory_pattern")
 
@@ -198,6 +225,14 @@ def format_output() -> str:
     return _get_value_from_file("format_output")
 
 
+def vector_format() -> str:
+    return _get_value_from_file("vector_format")
+
+
+def matrix_format() -> str:
+    return _get_value_from_file("matrix_format")
+
+
 def delimiter_input() -> str:
     return _get_value_from_file("delimiter_input")
 
@@ -234,5 +269,13 @@ def verbosity() -> str:
     return _get_value_from_file("verbosity")
 
 
+def workers() -> str:
+    return _get_value_from_file("workers")
+
+
+def cache_size() -> str:
+    return _get_value_from_file("cache_size")
+
+
 if __name__ == '__main__':
     pass
@@ -20,6 +20,7 @@ If you want to add an entry point to the file, add it inside the `<entry_points>
         </documentation>
 </entry_point>
 """
+import functools
 import os
 from xml.etree.ElementTree import parse as xml_parse
 
@@ -38,7 +39,9 @@ def _get_entry_point_documentation(entry_point_name: str) -> str:
             return entry_point.find(_KEY_DOCUMENTATION).text
 
 
+@functools.lru_cache(maxsize=None)
 def _get_root():
+    """ Parse the file once per process. Call `_get_root.cache_clear()` to read it again. """
     global _FILE_PATH
 
     path = os.path.join(os.path.dirname(__file__), _FILE_PATH)
@@ -80,3 +83,11 @@ def quality_entry_point() -> str:
 
 def classes_matrices_entry_point() -> str:
     return _get_entry_point_documentation("classes_matrices_entry_point")
+
+
+def clustering_trees_entry_point() -> str:
+    return _get_entry_point_documentation("clustering_trees_entry_point")
+
+
+def sweep_entry_point() -> str:
+    return _get_entry_point_documentation("sweep_entry_point")
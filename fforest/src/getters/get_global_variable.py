@@ -10,6 +10,7 @@ name.
 - Except for the access functions, this module mustn't have any side-effect to the program's namespace nor the files it
 tries to access.
 """
+import functools
 import json
 import os
 
@@ -18,12 +19,18 @@ _PATH_GLOBAL_VARIABLES = "../../res/global_variables.json"
 
 
 def _get_value_from_file(value):
+    return _load_file()[value]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_file() -> dict:
+    """ Parse the file once per process. Call `_load_file.cache_clear()` to read it again. """
     global _PATH_GLOBAL_VARIABLES
 
     path = os.path.join(os.path.dirname(__file__),
                         _PATH_GLOBAL_VARIABLES)
     with open(path) as file:
-        return json.load(file)[value]
+        return json.load(file)
 
 
 def name() -> str:
@@ -122,5 +129,13 @@ def classes_matrices_entry_point() -> str:
     return _get_value_from_file("classes_matrices_entry_point")
 
 
+def clustering_trees_entry_point() -> str:
+    return _get_value_from_file("clustering_trees_entry_point")
+
+
+def sweep_entry_point() -> str:
+    return _get_value_from_file("sweep_entry_point")
+
+
 if __name__ == '__main__':
     pass
@@ -19,6 +19,7 @@ Add it in the `Message` class, then call the `vprint` function like this :
 vprint(Message.PRINT_NAME, name="Christophe")
 """
 import enum
+import functools
 import json
 import os
 from typing import Union
@@ -43,6 +44,14 @@ class Message(enum.Enum):
     GUESS_QUOTING = "guess_quoting"
     GUESS_QUOTE_CHARACTER = "guess_quote_character"
     GUESS_ENCODING = "guess_encoding"
+    PHASE_UP_TO_DATE = "phase_up_to_date"
+    PARAMETER_NOT_OVERRIDABLE = "parameter_not_overridable"
+    TREE_CONSTRUCTION_FAILED = "tree_construction_failed"
+    SWEEP_TREE_CONSTRUCTION_FAILED = "sweep_tree_construction_failed"
+    SWEEP_CONFIGURATION = "sweep_configuration"
+    FIFO_FALLBACK = "fifo_fallback"
+    VERBOSE_CLASSES_MATRICES_TIMINGS = "verbose_classes_matrices_timings"
+    VERBOSE_CLUSTERING_TREES_TIMINGS = "verbose_clustering_trees_timings"
 
 
 @enum.unique
@@ -103,12 +112,18 @@ def _get_message_with_verbosity(message_key: str, verbosity: Union[Verbosity, No
 
 def _get_message_from_file(message_key: str):
     """ Retrieve the asked message from the file 'output_messages.json'. """
+    return _load_file()[message_key]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_file() -> dict:
+    """ Parse the file 'output_messages.json' once per process. Call `_load_file.cache_clear()` to read it again. """
     global _PATH_OUTPUT_MESSAGES
 
     path = os.path.join(os.path.dirname(__file__),
                         _PATH_OUTPUT_MESSAGES)
     with open(path) as file:
-        return json.load(file)[message_key]
+        return json.load(file)
 
 
 def _is_a_normal_message(message_key: str) -> bool:
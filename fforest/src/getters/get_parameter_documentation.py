@@ -10,6 +10,7 @@ name.
 - Except for the access functions, this module mustn't have any side-effect to the program's namespace nor the files it
 tries to access.
 """
+import functools
 import json
 import os
 
@@ -18,12 +19,18 @@ _PATH_PARAMS_DOC = "../../res/parameters_documentation.json"
 
 
 def _get_doc_from_file(value):
+    return _load_file()[value]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_file() -> dict:
+    """ Parse the file once per process. Call `_load_file.cache_clear()` to read it again. """
     global _PATH_PARAMS_DOC
 
     path = os.path.join(os.path.dirname(__file__),
                         _PATH_PARAMS_DOC)
     with open(path) as file:
-        return json.load(file)[value]
+        return json.load(file)
 
 
 def usage() -> str:
@@ -62,6 +69,18 @@ def subsubtrain_split_method() -> str:
     return _get_doc_from_file("subsubtrain_split_method")
 
 
+def seed() -> str:
+    return _get_doc_from_file("seed")
+
+
+def sampling_fraction() -> str:
+    return _get_doc_from_file("sampling_fraction")
+
+
+def fifo() -> str:
+    return _get_doc_from_file("fifo")
+
+
 def quality_computing_method() -> str:
     return _get_doc_from_file("quality_computing_method")
 
@@ -70,6 +89,14 @@ def clustering_trees_method() -> str:
     return _get_doc_from_file("clustering_trees_method")
 
 
+def distance_measure() -> str:
+    return _get_doc_from_file("distance_measure")
+
+
+def clustering_threshold() -> str:
+    return _get_doc_from_file("clustering_threshold")
+
+
 def train_name() -> str:
     return _get_doc_from_file("train_name")
 
@@ -162,6 +189,10 @@ def clustering_trees_directory() -> str:
     return _get_doc_from_file("clustering_trees_directory")
 
 
+def sweep_directory() -> str:
+    return _get_doc_from_file("sweep_directory")
+
+
 def subsubtrain_directory_pattern() -> str:
     return _get_doc_from_file("subsubtrain_directory_pattern")
 
@@ -222,6 +253,14 @@ def format_output() -> str:
     return _get_doc_from_file("format_output")
 
 
+def vector_format() -> str:
+    return _get_doc_from_file("vector_format")
+
+
+def matrix_format() -> str:
+    return _get_doc_from_file("matrix_format")
+
+
 def delimiter_input() -> str:
     return _get_doc_from_file("delimiter_input")
 
@@ -258,5 +297,17 @@ def verbosity() -> str:
     return _get_doc_from_file("verbosity")
 
 
+def workers() -> str:
+    return _get_doc_from_file("workers")
+
+
+def cache_directory() -> str:
+    return _get_doc_from_file("cache_directory")
+
+
+def cache_size() -> str:
+    return _get_doc_from_file("cache_size")
+
+
 if __name__ == '__main__':
     pass
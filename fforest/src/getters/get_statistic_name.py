@@ -11,6 +11,7 @@ name.
 - Except for the access functions, this module mustn't have any side-effect to the program's namespace nor the files it
 tries to access.
 """
+import functools
 import json
 import os
 
@@ -19,12 +20,18 @@ _PATH_STATISTICS_NAMES = "../../res/statistics_names.json"
 
 
 def _get_stat_from_file(value):
+    return _load_file()[value]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_file() -> dict:
+    """ Parse the file once per process. Call `_load_file.cache_clear()` to read it again. """
     global _PATH_STATISTICS_NAMES
 
     path = os.path.join(os.path.dirname(__file__),
                         _PATH_STATISTICS_NAMES)
     with open(path) as file:
-        return json.load(file)[value]
+        return json.load(file)
 
 
 def instances_in_database() -> str:
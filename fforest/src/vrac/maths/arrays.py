@@ -0,0 +1,64 @@
+""" This module contains numerical functions working on whole NumPy arrays at once, such as the vectorized versions of
+some functions of the `maths` module. It is kept apart from the `maths` module so that NumPy is only imported by the
+phases needing it.
+"""
+from typing import List, Union
+
+import numpy as np
+
+
+def round_floats(a: np.ndarray, epsilon: float = 0.0000000000000002) -> List[Union[float, int]]:
+    """ Vectorized version of `maths.round_float`. Round the floats of `a` which are very close to an integer, and
+    return all the values as a list of Python numbers.
+        Example :
+        >>> round_floats(np.array([0.9999999999999999, 0.9999999999999998, 0.30000000000000004]))
+        [1, 0.9999999999999998, 0.30000000000000004]
+    """
+    rounded = np.rint(a)
+    close = np.abs(rounded - a) < epsilon
+    return [int(r) if c else f for f, r, c in zip(a.tolist(), rounded.tolist(), close.tolist())]
+
+
+def z_score(matrix: np.ndarray, useless_value: float = 0.0, out: np.ndarray = None,
+            chunk_size: int = 64) -> np.ndarray:
+    """ Normalize each column of the 2-D `matrix` by subtracting its mean then dividing by its standard deviation. A
+    column with a standard deviation of 0.0 is useless because all its values are the same, thus all its values are
+    replaced by `useless_value`.
+    The result is written in `out`, which is a new float64 array if it's `None`. `out` can be `matrix` itself to
+    normalize it in place. The matrix is read by blocks of `chunk_size` contiguous rows, so the temporary arrays never
+    exceed (chunk_size x columns) values.
+        Example :
+        >>> z_score(np.array([[1.0, 5.0, 0.0], [3.0, 5.0, 2.0]]))
+        array([[-1.,  0., -1.],
+               [ 1.,  0.,  1.]])
+    """
+    rows, columns = matrix.shape
+    if out is None:
+        out = np.empty((rows, columns), dtype=np.float64)
+
+    mean = np.zeros(columns, dtype=np.float64)
+    for start in range(0, rows, chunk_size):
+        mean += matrix[start:start + chunk_size].sum(axis=0)
+    mean /= rows
+
+    variance = np.zeros(columns, dtype=np.float64)
+    for start in range(0, rows, chunk_size):
+        deviation = matrix[start:start + chunk_size] - mean
+        deviation *= deviation
+        variance += deviation.sum(axis=0)
+    standard_deviation = np.sqrt(variance / rows)
+
+    # (x - mean) * scale + shift, with scale = 0 and shift = useless_value for the useless columns
+    useless = standard_deviation == 0.0
+    scale = np.divide(1.0, standard_deviation, out=np.zeros(columns, dtype=np.float64), where=~useless)
+    shift = np.where(useless, useless_value, 0.0)
+    for start in range(0, rows, chunk_size):
+        block = out[start:start + chunk_size]
+        np.subtract(matrix[start:start + chunk_size], mean, out=block)
+        block *= scale
+        block += shift
+    return out
+
+
+if __name__ == "__main__":
+    pass
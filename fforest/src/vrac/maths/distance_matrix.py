@@ -0,0 +1,29 @@
+""" This module contains a vectorized engine computing all the pairwise distances between the rows of a matrix, with one
+of the measures of the `distance_measure` module. The distances are returned as a condensed distance array, as defined
+by `scipy.spatial.distance.pdist` : the distance between the rows `i` and `j` (with i < j < n) is stored at the index
+`n * i - i * (i + 1) // 2 + (j - i - 1)`.
+"""
+import numpy as np
+import scipy as sp
+import scipy.spatial
+
+from fforest.src.vrac.maths.distance_measure import DistanceMeasure, distancemeasure_to_metric
+
+
+def pairwise_distances(vectors: np.ndarray, measure: DistanceMeasure) -> np.ndarray:
+    """ Compute the distances between all the pairs of rows of the (n x d) matrix `vectors`, and return them as a
+    condensed distance array of n * (n - 1) / 2 values. The distances are computed at once by
+    `scipy.spatial.distance.pdist`. `vectors` can be a memory-mapped array.
+
+        Example :
+        >>> vectors = np.array([[0, 0], [3, 4], [6, 8]])
+        >>> pairwise_distances(vectors, DistanceMeasure.EUCLIDEAN)
+        array([ 5., 10.,  5.])
+        >>> pairwise_distances(vectors, DistanceMeasure.MANHATTAN)
+        array([ 7., 14.,  7.])
+    """
+    return sp.spatial.distance.pdist(vectors, metric=distancemeasure_to_metric(measure))
+
+
+if __name__ == "__main__":
+    pass
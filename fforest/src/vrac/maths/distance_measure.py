@@ -1,8 +1,9 @@
-from typing import Iterable, Callable
-
-import scipy as sp
-import scipy.spatial
+""" This module contains the distance measures used to compare vectors. The vectorized engine computing all the pairwise
+distances between the rows of a matrix is located in the `distance_matrix` module.
+SciPy is only imported when a distance is computed, as this module is needed to parse the command-line arguments.
+"""
 import enum
+from typing import Iterable, Callable
 
 from fforest.src.vrac.maths.maths import Number
 
@@ -35,12 +36,44 @@ def distancemeasure_to_str(form: DistanceMeasure) -> str:
 
 def distancemeasure_to_function(form: DistanceMeasure) -> Callable:
     """ Return the name of a DistanceMeasure as a its respective function. """
-    pass
+    if form == DistanceMeasure.EUCLIDEAN:
+        return euclidean
+    elif form == DistanceMeasure.MANHATTAN:
+        return manhattan
+    raise UnknownDistanceMeasure(form)
+
+
+def distancemeasure_to_metric(form: DistanceMeasure) -> str:
+    """ Return the name of the `scipy.spatial.distance` metric computing a DistanceMeasure. """
+    if form == DistanceMeasure.EUCLIDEAN:
+        return "euclidean"
+    elif form == DistanceMeasure.MANHATTAN:
+        return "cityblock"
+    raise UnknownDistanceMeasure(form)
+
+
+def distancemeasure_to_minkowski_p(form: DistanceMeasure) -> float:
+    """ Return the order `p` of the Minkowski distance equal to a DistanceMeasure, as used by
+    `scipy.spatial.cKDTree`.
+    """
+    if form == DistanceMeasure.EUCLIDEAN:
+        return 2
+    elif form == DistanceMeasure.MANHATTAN:
+        return 1
+    raise UnknownDistanceMeasure(form)
 
 
 def euclidean(vector1: Iterable[Number], vector2: Iterable[Number]) -> float:
-    return sp.spatial.distance.euclidean(vector1, vector2)
+    """ Compute the Euclidean distance between two vectors. """
+    import scipy.spatial
+    return scipy.spatial.distance.euclidean(vector1, vector2)
+
+
+def manhattan(vector1: Iterable[Number], vector2: Iterable[Number]) -> float:
+    """ Compute the Manhattan distance between two vectors. """
+    import scipy.spatial
+    return scipy.spatial.distance.cityblock(vector1, vector2)
 
 
-def manhattan(vector1: Iterable[Number], vector2: Iterable[Number]) -> int:
+if __name__ == "__main__":
     pass
@@ -1,7 +1,6 @@
+import math
 from typing import Union
 
-import numpy as np
-
 Number = Union[int, float, complex]
 
 
@@ -24,7 +23,7 @@ def gamma(n: Number) -> Number:
         Source :
         https://en.wikipedia.org/wiki/Gamma_function
     """
-    return np.math.factorial(n - 1)
+    return math.gamma(n)
 
 
 def round_float(f: float, epsilon: float = 0.0000000000000002) -> Union[float, int]:
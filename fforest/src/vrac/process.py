@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 
@@ -27,3 +28,35 @@ def execute_and_get_stdout(command: str, *parameters: str, stdin=None, stderr=No
                                        timeout=None).decode(encoding)
     except subprocess.CalledProcessError as error:
         print(error.output)
+
+
+def execute_and_iter_stdout(command: str, *parameters: str, stdin=None, stderr=None, encoding: str = "utf8") -> iter:
+    """ Execute `command` in a subprocess and iterate through the lines written on its stdout, as soon as they are
+    written. Contrary to `execute_and_get_stdout`, the output is never stored entirely in memory.
+    Raise a `subprocess.CalledProcessError` if the command returns a non-zero code.
+
+        Example:
+            >>> list(execute_and_iter_stdout("printf", "Hello\\nWorld !"))
+            ['Hello\\n', 'World !']
+    """
+    with subprocess.Popen([command, *parameters], stdin=stdin, stdout=subprocess.PIPE, stderr=stderr, shell=False,
+                          encoding=encoding) as process:
+        for line in process.stdout:
+            yield line
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, [command, *parameters])
+
+
+def get_number_of_workers(workers: int) -> int:
+    """ Return the number of workers to use in a pool of processes. If `workers` is 0 or `None`, return the number of
+    CPUs of the machine.
+
+        Example:
+            >>> get_number_of_workers(4)
+            4
+            >>> get_number_of_workers(0) == os.cpu_count()
+            True
+    """
+    if not workers:
+        return os.cpu_count() or 1
+    return workers
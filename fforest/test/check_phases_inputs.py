@@ -0,0 +1,111 @@
+""" Check that the input files declared for each phase in the `checkpoint` module are the files the phase actually
+reads. The main entry point is run on a test database, while an audit hook records every file opened by the process and
+its workers, and every file given to a subprocess. Once the run is over, each phase is checked both ways :
+- A file read by the phase must be declared as one of its inputs, unless the phase wrote it itself.
+- An existing file declared as one of its inputs must be read by the phase.
+Usage : python fforest/test/check_phases_inputs.py [database] [fforest options], from the root of the repository.
+Without any argument, the bank database is used. The exit code is non-zero if a phase doesn't match its declared inputs.
+"""
+import os
+import sys
+import tempfile
+from collections import defaultdict
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_DEFAULT_ARGS = [os.path.join(_ROOT, "fforest", "test", "data", "bank.csv"), "--delimiter-input=;", "--trees-in-forest",
+                 "15", "--have-header", "--class", "y"]
+_READ = "r"
+_WRITE = "w"
+
+
+def main() -> int:
+    sys.path.insert(0, _ROOT)
+    import fforest.src.core.phase.phase as phase_module
+    import fforest.src.getters.environment as env
+
+    # The phase being computed is recorded around its entry point, and inherited by its workers
+    call_phase = phase_module._call_phase
+    computed_phase = [None]
+
+    def recorded_call_phase(phase, entry_point):
+        computed_phase[0] = phase
+        call_phase(phase=phase, entry_point=entry_point)
+        computed_phase[0] = None
+
+    phase_module._call_phase = recorded_call_phase
+    log = tempfile.TemporaryFile()
+    sys.addaudithook(_audit_hook(log.fileno(), computed_phase))
+    args = [os.path.abspath(sys.argv[1])] + sys.argv[2:] if len(sys.argv) > 1 else _DEFAULT_ARGS
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        sys.argv = ["fforest"] + args
+        from fforest.main import main_entry_point
+        try:
+            main_entry_point()
+        except SystemExit:
+            pass
+        log.seek(0)
+        accesses = _parse_log(log.read().decode())
+        return _check_phases(accesses, env)
+
+
+def _audit_hook(log_fd: int, computed_phase: list):
+    """ Return an audit hook writing each file opened, or given to a subprocess, into the file descriptor `log_fd`,
+    with the phase currently computed, stored as the only element of `computed_phase`. The hook is inherited by the
+    workers of the process, and `os.write` doesn't raise any audit event itself.
+    """
+    def hook(event, args):
+        if event == "open" and isinstance(args[0], (str, bytes)):
+            path, mode, flags = args
+            if isinstance(path, bytes):
+                path = path.decode()
+            if mode is not None:
+                access = _WRITE if any(character in mode for character in "wax+") else _READ
+            else:
+                access = _READ if flags & (os.O_WRONLY | os.O_RDWR) == 0 else _WRITE
+            paths = [(access, path)]
+        elif event == "subprocess.Popen":
+            paths = [(_READ, str(argument)) for argument in args[1] if os.path.isfile(str(argument))]
+        else:
+            return
+        if computed_phase[0] is not None:
+            for access, path in paths:
+                os.write(log_fd, "{}\t{}\t{}\n".format(computed_phase[0].name, access, os.path.abspath(path)).encode())
+    return hook
+
+
+def _parse_log(log: str) -> dict:
+    """ Return, for each phase name, the sets of the paths it read and wrote. """
+    accesses = defaultdict(lambda: {_READ: set(), _WRITE: set()})
+    for line in log.splitlines():
+        phase_name, access, path = line.split("\t")
+        accesses[phase_name][access].add(path)
+    return accesses
+
+
+def _check_phases(accesses: dict, env) -> int:
+    """ Print the mismatches between the files read by each phase and its declared inputs, and return their number. """
+    from fforest.src.core.phase.checkpoint import _PHASES_INPUT_FILES, _PHASES_OUTPUT_FILES, _get_paths
+
+    checked_paths = {os.path.abspath(env.original_database_path)}
+    for phase in _PHASES_OUTPUT_FILES:
+        checked_paths.update(os.path.abspath(path) for path in _get_paths(_PHASES_OUTPUT_FILES[phase]))
+
+    mismatches = 0
+    for phase in _PHASES_INPUT_FILES:
+        declared = {os.path.abspath(path) for path in _get_paths(_PHASES_INPUT_FILES[phase])}
+        read = {path for path in accesses[phase.name][_READ] if path in checked_paths}
+        written = accesses[phase.name][_WRITE]
+        for path in sorted(read - declared - written):
+            print("{}: reads the undeclared input {}".format(phase.name, path))
+            mismatches += 1
+        for path in sorted(declared - read):
+            if os.path.isfile(path):
+                print("{}: doesn't read the declared input {}".format(phase.name, path))
+                mismatches += 1
+    print("{} mismatch(es) between the phases and their declared inputs".format(mismatches))
+    return mismatches
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -12,24 +12,6 @@ from os import path
 import fforest.src.getters.get_global_variable as ggv
 
 
-# TODO: Implement one entry-point for each phase :
-"""
-    entry_points={
-        'console_scripts': [
-            ggv.main_entry_point() + ' = fforest.main:main_entry_point',
-            ggv.preprocessing_entry_point() + ' = fforest.main:preprocessing_entry_point',
-            ggv.initial_split_entry_point() + ' = fforest.main:initial_split_entry_point',
-            ggv.reference_split_entry_point() + ' = fforest.main:reference_split_entry_point',
-            ggv.subsubtrain_split_entry_point() + ' = fforest.main:subsubtrain_split_entry_point',
-            ggv.learning_entry_point() + ' = fforest.main:learning_entry_point',
-            ggv.reduction_entry_point() + ' = fforest.main:reduction_entry_point',
-            ggv.quality_entry_point() + ' = fforest.main:quality_entry_point',
-            ggv.classes_matrices_entry_point() + ' = fforest.main:classes_matrices_entry_point',
-        ],
-    },
-"""
-
-
 _HERE = path.abspath(path.dirname(__file__))
 _README_FILE_NAME = "README.md"
 _README_FILE_ENCODING = "utf8"
@@ -100,6 +82,16 @@ setup(
     entry_points={
         'console_scripts': [
             ggv.main_entry_point() + ' = fforest.main:main_entry_point',
+            ggv.preprocessing_entry_point() + ' = fforest.main:preprocessing_entry_point',
+            ggv.initial_split_entry_point() + ' = fforest.main:initial_split_entry_point',
+            ggv.reference_split_entry_point() + ' = fforest.main:reference_split_entry_point',
+            ggv.subsubtrain_split_entry_point() + ' = fforest.main:subsubtrain_split_entry_point',
+            ggv.learning_entry_point() + ' = fforest.main:learning_entry_point',
+            ggv.reduction_entry_point() + ' = fforest.main:reduction_entry_point',
+            ggv.quality_entry_point() + ' = fforest.main:quality_entry_point',
+            ggv.classes_matrices_entry_point() + ' = fforest.main:classes_matrices_entry_point',
+            ggv.clustering_trees_entry_point() + ' = fforest.main:clustering_trees_entry_point',
+            ggv.sweep_entry_point() + ' = fforest.main:sweep_entry_point',
         ],
     },
 )